@@ -0,0 +1,145 @@
+"""Selection of the chapters of each book that are relevant to a query."""
+
+import json
+from collections import Counter
+
+from src.domain.ranking import bm25_idf, bm25_term_score
+from src.domain.text import ngram_tokens
+
+
+def estimate_tokens(text: str) -> float:
+    """Roughly estimate the LLM tokens of a text.
+
+    Japanese text costs about one token per character, ASCII text about
+    one token per four characters.
+    """
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return (len(text) - ascii_chars) + ascii_chars / 4
+
+
+class ChapterSelector:
+    """Trims each search result's TOC down to the chapters relevant to a query.
+
+    TOC entries are scored against the query (BM25 over character
+    n-grams, with each entry as a document); the top entries of each book
+    are kept together with their ancestors, in TOC order, within a token
+    budget per book. Books without a matching entry keep their
+    top-level chapters as an overview.
+    """
+
+    ELISION = "…"
+
+    def __init__(self, chapters_per_book: int = 5, tokens_per_book: int = 400) -> None:
+        """Initialize the selector.
+
+        Args:
+            chapters_per_book: Maximum number of matching entries per book
+            tokens_per_book: Estimated tokens of the selected TOC of a book
+
+        """
+        self.chapters_per_book = chapters_per_book
+        self.tokens_per_book = tokens_per_book
+
+    def select(self, query: str, search_results: list[dict]) -> list[dict]:
+        """Replace the `toc_text` of each result with its relevant chapters.
+
+        Args:
+            query: The search query
+            search_results: Search results with `toc_text` (and `toc_json`
+                with levels, when indexed)
+
+        Returns:
+            Copies of the results with a trimmed `toc_text`
+
+        """
+        query_terms = set(ngram_tokens(query))
+        return [
+            {
+                **result,
+                "toc_text": self._select_toc(query_terms, self._toc_entries(result)),
+            }
+            for result in search_results
+        ]
+
+    @staticmethod
+    def _toc_entries(result: dict) -> list[tuple[str, int]]:
+        """Get the (title, level) entries of a result's TOC."""
+        if result.get("toc_json"):
+            try:
+                return [
+                    (item["title"], int(item.get("level", 1)))
+                    for item in json.loads(result["toc_json"])
+                ]
+            except (ValueError, TypeError, KeyError):
+                pass
+        # Documents without levels: every line is a chapter
+        return [(line, 1) for line in result.get("toc_text", "").splitlines() if line]
+
+    def _select_toc(self, query_terms: set[str], entries: list[tuple[str, int]]) -> str:
+        """Select the entries of one book and render them as TOC text."""
+        scores = self._score(query_terms, entries)
+        ranked = sorted(
+            (i for i, score in enumerate(scores) if score > 0),
+            key=lambda i: -scores[i],
+        )[: self.chapters_per_book]
+        if not ranked:
+            # Nothing matches: give an overview of the top-level chapters
+            top_level = min((level for _, level in entries), default=1)
+            ranked = [i for i, (_, level) in enumerate(entries) if level == top_level]
+
+        selected: set[int] = set()
+        used = 0.0
+        for i in ranked:
+            added = {i, *self._ancestors(entries, i)} - selected
+            cost = sum(estimate_tokens(entries[j][0]) + 1 for j in added)
+            if selected and used + cost > self.tokens_per_book:
+                break
+            selected |= added
+            used += cost
+
+        lines = []
+        previous = -1
+        for i in sorted(selected):
+            if i > previous + 1:
+                lines.append(self.ELISION)
+            title, level = entries[i]
+            lines.append(f"{'  ' * (level - 1)}{title}")
+            previous = i
+        if entries and previous < len(entries) - 1:
+            lines.append(self.ELISION)
+        return "\n".join(lines)
+
+    def _score(
+        self, query_terms: set[str], entries: list[tuple[str, int]]
+    ) -> list[float]:
+        """Score each entry against the query with BM25 within the book."""
+        entry_terms = [Counter(ngram_tokens(title)) for title, _ in entries]
+        if not entry_terms or not query_terms:
+            return [0.0] * len(entries)
+        lengths = [sum(terms.values()) for terms in entry_terms]
+        avg_length = sum(lengths) / len(lengths) or 1.0
+        doc_freqs = Counter(
+            term for terms in entry_terms for term in terms if term in query_terms
+        )
+
+        scores = []
+        for terms, length in zip(entry_terms, lengths, strict=True):
+            score = 0.0
+            for term in query_terms & terms.keys():
+                idf = bm25_idf(len(entries), doc_freqs[term])
+                score += bm25_term_score(terms[term], length, avg_length, idf)
+            scores.append(score)
+        return scores
+
+    @staticmethod
+    def _ancestors(entries: list[tuple[str, int]], index: int) -> list[int]:
+        """Get the indexes of the entries enclosing entries[index]."""
+        ancestors = []
+        level = entries[index][1]
+        for i in range(index - 1, -1, -1):
+            if entries[i][1] < level:
+                ancestors.append(i)
+                level = entries[i][1]
+                if level <= 1:
+                    break
+        return ancestors
@@ -5,9 +5,10 @@ from datetime import UTC, datetime
 from google.cloud import firestore
 
 from src.domain.interfaces.book_repository import (
-    BookMasterRepository,
+    AsyncBookMasterRepository,
     TOCGenerator,
 )
+from src.domain.interfaces.toc_preview_cache import TOCPreviewCache
 from src.domain.models.book_master import BookMaster
 
 
@@ -16,19 +17,22 @@ class FetchBookMetadataUseCase:
 
     This handles:
     1. Checking if the book exists in the master record
-    2. If not, generating the metadata using Gemini
-    3. Returning the metadata for preview
+    2. If not, checking the preview cache
+    3. If not cached, generating the metadata using Gemini and caching it
+    4. Returning the metadata for preview
     """
 
     def __init__(
         self,
-        book_master_repo: BookMasterRepository,
+        book_master_repo: AsyncBookMasterRepository,
         toc_generator: TOCGenerator,
-        firestore_client: firestore.Client,
+        preview_cache: TOCPreviewCache,
+        firestore_client: firestore.AsyncClient,
     ) -> None:
         """Initialize the use case."""
         self.book_master_repo = book_master_repo
         self.toc_generator = toc_generator
+        self.preview_cache = preview_cache
         self.firestore_client = firestore_client
 
     async def execute(
@@ -50,17 +54,51 @@ class FetchBookMetadataUseCase:
         normalized_isbn = BookMaster.normalize_isbn(isbn)
 
         # Check if book master exists
-        book_master = self.book_master_repo.find_by_isbn(normalized_isbn)
+        book_master = await self.book_master_repo.find_by_isbn(normalized_isbn)
 
         if book_master:
             return book_master
 
-        # Book doesn't exist, generate it
-        query = f"ISBN: {normalized_isbn}"
-        if title:
-            query += f" (Title: {title})"
+        return await self.generate_preview(normalized_isbn, title)
 
-        result = await self.toc_generator.generate_from_query(query)
+    async def generate_preview(
+        self,
+        normalized_isbn: str,
+        title: str | None = None,
+    ) -> BookMaster:
+        """Generate a tentative book master, skipping the master lookup.
+
+        Used directly by callers that already know the book is not in the
+        master collection (e.g. bulk imports after a batched read).
+
+        Previews are cached by ISBN-13, so the ISBN-10 and ISBN-13 of a book
+        share one entry. The title hint is deliberately not part of the key:
+        it only helps generation find the book, and the returned title
+        prefers the hint anyway.
+
+        Args:
+            normalized_isbn: The normalized ISBN of the book
+            title: Optional title hint
+
+        Returns:
+            BookMaster: The book metadata (the TOC is empty if none was found)
+
+        """
+        # Reuse a previous preview if available
+        cache_key = BookMaster.to_isbn13(normalized_isbn)
+        result = await self.preview_cache.get(cache_key)
+
+        if result is None:
+            # Not previewed yet, generate it
+            query = f"ISBN: {normalized_isbn}"
+            if title:
+                query += f" (Title: {title})"
+
+            result = await self.toc_generator.generate_from_query(query)
+
+            # Only cache usable results so failed generations are retried
+            if result.get("toc"):
+                await self.preview_cache.set(cache_key, result)
 
         final_title = title or result.get("title", "Unknown Title")
         toc = result.get("toc", [])
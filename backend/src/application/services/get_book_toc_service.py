@@ -0,0 +1,75 @@
+"""Service for fetching the TOC of a book in a user's library."""
+
+import asyncio
+from datetime import datetime
+
+from src.domain.interfaces.book_repository import (
+    AsyncBookMasterRepository,
+    AsyncUserLibraryRepository,
+)
+from src.domain.interfaces.library_summary_repository import (
+    LibrarySummaryRepository,
+)
+from src.domain.models.book_master import BookMaster
+from src.domain.models.user import User
+
+
+class GetBookTOCUseCase:
+    """Use case for fetching one book's TOC (for paged, TOC-less listings)."""
+
+    def __init__(
+        self,
+        book_master_repo: AsyncBookMasterRepository,
+        user_library_repo: AsyncUserLibraryRepository,
+        library_summary_repo: LibrarySummaryRepository | None = None,
+    ) -> None:
+        """Initialize the use case."""
+        self.book_master_repo = book_master_repo
+        self.user_library_repo = user_library_repo
+        self.library_summary_repo = library_summary_repo
+
+    async def find_updated_at(self, user: User, isbn: str) -> datetime | None:
+        """Get when a book in the user's library last changed, without reading it.
+
+        Args:
+            user: The authenticated user
+            isbn: The ISBN of the book
+
+        Returns:
+            The book master's updated_at from the library summary, or None
+            if the summary does not know it
+
+        """
+        if self.library_summary_repo is None:
+            return None
+
+        normalized_isbn = BookMaster.normalize_isbn(isbn)
+        for item in await self.library_summary_repo.find_by_user(user.uid):
+            if item.isbn == normalized_isbn:
+                return item.updated_at
+        return None
+
+    async def execute(self, user: User, isbn: str) -> BookMaster | None:
+        """Execute the fetch TOC process.
+
+        Args:
+            user: The authenticated user
+            isbn: The ISBN of the book
+
+        Returns:
+            The book master with its TOC, or None if the book is not in
+            the user's library
+
+        """
+        normalized_isbn = BookMaster.normalize_isbn(isbn)
+
+        # Both reads are independent, so run them concurrently
+        entry, book_master = await asyncio.gather(
+            self.user_library_repo.find_entry(user.uid, normalized_isbn),
+            self.book_master_repo.find_by_isbn(normalized_isbn),
+        )
+
+        if entry is None:
+            return None
+
+        return book_master
@@ -0,0 +1,301 @@
+"""Service for importing many books at once."""
+
+import asyncio
+import contextlib
+import logging
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from src.application.services.fetch_book_metadata_service import (
+    FetchBookMetadataUseCase,
+)
+from src.domain.interfaces.book_indexer import BookIndexer
+from src.domain.interfaces.book_repository import AsyncBookMasterRepository
+from src.domain.interfaces.bulk_book_writer import BulkBookWriter
+from src.domain.interfaces.import_job_repository import ImportJobRepository
+from src.domain.models.book_master import BookMaster
+from src.domain.models.import_job import ImportJob, ImportJobStatus
+from src.domain.models.index_job import IndexJob
+from src.domain.models.user_library import UserLibraryEntry
+
+logger = logging.getLogger(__name__)
+
+
+class _StartRateLimiter:
+    """Spaces out operation starts to stay within a per-minute quota."""
+
+    def __init__(self, per_minute: int) -> None:
+        self.interval = 60.0 / per_minute
+        self._next_start = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Wait until the next start slot."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            now = loop.time()
+            delay = self._next_start - now
+            self._next_start = max(now, self._next_start) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ImportBooksUseCase:
+    """Use case for importing a list of ISBNs into a user's library.
+
+    This handles:
+    1. Creating an import job so the client can poll its progress
+    2. Loading existing book masters in one batched read; those are
+       only added to the library
+    3. Generating metadata and TOC for the other books, with a
+       concurrency cap and a per-minute quota on generations
+    4. Writing masters, library entries and index jobs in bulk (and
+       updating the in-process index, if any)
+
+    A run lives in its instance's memory: while it runs, the job is saved
+    every `heartbeat_seconds` so `GetImportJobUseCase` can tell a lost
+    run from a slow one.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        import_job_repo: ImportJobRepository,
+        book_master_repo: AsyncBookMasterRepository,
+        metadata_use_case: FetchBookMetadataUseCase,
+        bulk_writer: BulkBookWriter,
+        *,
+        max_isbns: int = 1000,
+        max_concurrency: int = 4,
+        generations_per_minute: int = 30,
+        flush_size: int = 50,
+        heartbeat_seconds: float = 60.0,
+        local_indexer: BookIndexer | None = None,
+    ) -> None:
+        """Initialize the use case."""
+        self.import_job_repo = import_job_repo
+        self.book_master_repo = book_master_repo
+        self.metadata_use_case = metadata_use_case
+        self.bulk_writer = bulk_writer
+        self.max_isbns = max_isbns
+        self.max_concurrency = max_concurrency
+        self.generations_per_minute = generations_per_minute
+        self.flush_size = flush_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self.local_indexer = local_indexer
+
+    async def start(self, user_id: str, isbns: list[str]) -> ImportJob:
+        """Create an import job for a list of ISBNs.
+
+        Args:
+            user_id: The ID of the importing user
+            isbns: The ISBNs to import (duplicates are ignored)
+
+        Returns:
+            The pending import job; malformed ISBNs are already
+            recorded as failed
+
+        Raises:
+            ValueError: If there are no ISBNs or more than allowed
+
+        """
+        normalized = list(
+            dict.fromkeys(BookMaster.normalize_isbn(isbn) for isbn in isbns if isbn)
+        )
+        if not normalized:
+            msg = "No ISBNs to import"
+            raise ValueError(msg)
+        if len(normalized) > self.max_isbns:
+            msg = f"Cannot import more than {self.max_isbns} books at once"
+            raise ValueError(msg)
+
+        job = ImportJob(
+            job_id=uuid.uuid4().hex,
+            user_id=user_id,
+            isbns=normalized,
+            failed_isbns=[isbn for isbn in normalized if not _is_valid_isbn(isbn)],
+        )
+        return await self.import_job_repo.save(job)
+
+    async def run(self, job: ImportJob) -> ImportJob:
+        """Process an import job to completion.
+
+        Args:
+            job: The import job created by `start`
+
+        Returns:
+            The finished import job
+
+        """
+        job.status = ImportJobStatus.RUNNING
+        job.started_at = datetime.now(UTC)
+        await self.save(job)
+
+        run = _ImportRun(self, job)
+        heartbeat = asyncio.create_task(self._heartbeat(job))
+        try:
+            await run.execute()
+            job.status = ImportJobStatus.COMPLETED
+        except Exception as e:
+            logger.exception("Import job %s failed", job.job_id)
+            job.status = ImportJobStatus.FAILED
+            job.error = f"{type(e).__name__}: {e}"
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+            job.finished_at = datetime.now(UTC)
+            await self.save(job)
+
+        logger.info(
+            "Import job %s finished: %d registered, %d linked, %d failed "
+            "(%.1f books/min)",
+            job.job_id,
+            job.registered,
+            job.linked,
+            len(job.failed_isbns),
+            job.books_per_minute(),
+        )
+        return job
+
+    async def save(self, job: ImportJob) -> None:
+        """Save a job's progress, with a fresh heartbeat."""
+        job.heartbeat_at = datetime.now(UTC)
+        await self.import_job_repo.save(job)
+
+    async def _heartbeat(self, job: ImportJob) -> None:
+        """Save the job periodically while it runs."""
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                await self.save(job)
+            except Exception:
+                logger.exception("Failed to save heartbeat of import %s", job.job_id)
+
+
+class GetImportJobUseCase:
+    """Use case for polling the progress of an import job.
+
+    Polling only reads the job, so it needs none of the import pipeline.
+    A job whose heartbeat is older than `stale_after_seconds` lost its run
+    with the instance that executed it and is reported as failed.
+    """
+
+    def __init__(
+        self, import_job_repo: ImportJobRepository, stale_after_seconds: float = 600.0
+    ) -> None:
+        """Initialize the use case."""
+        self.import_job_repo = import_job_repo
+        self.stale_after = timedelta(seconds=stale_after_seconds)
+
+    async def find(self, user_id: str, job_id: str) -> ImportJob | None:
+        """Find an import job, failing it if its run was interrupted.
+
+        Args:
+            user_id: The ID of the importing user
+            job_id: The import job ID
+
+        Returns:
+            The import job if found, None otherwise
+
+        """
+        job = await self.import_job_repo.find(user_id, job_id)
+        if job is not None and job.is_stale(self.stale_after):
+            logger.warning("Import job %s stopped responding; failing it", job.job_id)
+            job.status = ImportJobStatus.FAILED
+            job.error = "Interrupted: the import stopped before finishing"
+            job.finished_at = datetime.now(UTC)
+            await self.import_job_repo.save(job)
+        return job
+
+
+class _ImportRun:
+    """State of one running import: buffered writes and progress."""
+
+    def __init__(self, use_case: ImportBooksUseCase, job: ImportJob) -> None:
+        self.use_case = use_case
+        self.job = job
+        self._semaphore = asyncio.Semaphore(use_case.max_concurrency)
+        self._rate_limiter = _StartRateLimiter(use_case.generations_per_minute)
+        self._new_books: list[BookMaster] = []
+        self._linked_books: list[BookMaster] = []
+        self._flush_lock = asyncio.Lock()
+
+    async def execute(self) -> None:
+        """Link existing books, generate the others and write everything."""
+        rejected = set(self.job.failed_isbns)
+        isbns = [isbn for isbn in self.job.isbns if isbn not in rejected]
+        book_masters = await self.use_case.book_master_repo.find_many_by_isbn(isbns)
+
+        missing = []
+        for isbn, book_master in zip(isbns, book_masters, strict=True):
+            if book_master is None:
+                missing.append(isbn)
+            else:
+                self._linked_books.append(book_master)
+        await self._flush()
+
+        await asyncio.gather(*(self._generate(isbn) for isbn in missing))
+        await self._flush(force=True)
+
+    async def _generate(self, isbn: str) -> None:
+        """Generate one book's metadata and buffer it for writing."""
+        async with self._semaphore:
+            await self._rate_limiter.wait()
+            try:
+                book = await self.use_case.metadata_use_case.generate_preview(isbn)
+            except Exception:
+                logger.exception("Failed to generate metadata for %s", isbn)
+                book = None
+
+        if book is None or not book.toc:
+            # Registration requires a TOC; the user can add this one by hand
+            self.job.failed_isbns.append(isbn)
+            return
+
+        book.last_updated_by = self.job.user_id
+        self._new_books.append(book)
+        await self._flush()
+
+    async def _flush(self, *, force: bool = False) -> None:
+        """Write buffered registrations once enough have accumulated."""
+        async with self._flush_lock:
+            pending = len(self._new_books) + len(self._linked_books)
+            if pending == 0 or (not force and pending < self.use_case.flush_size):
+                return
+
+            books, self._new_books = self._new_books, []
+            linked_books, self._linked_books = self._linked_books, []
+            isbns = [book.isbn for book in [*books, *linked_books]]
+            now = datetime.now(UTC)
+
+            try:
+                await self.use_case.bulk_writer.write(
+                    books,
+                    [
+                        (
+                            UserLibraryEntry(
+                                user_id=self.job.user_id, isbn=book.isbn, added_at=now
+                            ),
+                            book,
+                        )
+                        for book in [*books, *linked_books]
+                    ],
+                    [IndexJob(isbn=isbn, user_id=self.job.user_id) for isbn in isbns],
+                )
+            except Exception:
+                logger.exception("Failed to write %d imported books", len(isbns))
+                self.job.failed_isbns.extend(isbns)
+            else:
+                self.job.registered += len(books)
+                self.job.linked += len(linked_books)
+                if self.use_case.local_indexer is not None:
+                    for book in [*books, *linked_books]:
+                        self.use_case.local_indexer.index_book(book, self.job.user_id)
+
+            # Progress for the status endpoint
+            await self.use_case.save(self.job)
+
+
+def _is_valid_isbn(isbn: str) -> bool:
+    """Check a normalized ISBN (same rule as BookMaster.validate_isbn)."""
+    return len(isbn) in {10, 13} and isbn.isdigit()
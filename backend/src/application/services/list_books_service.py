@@ -1,8 +1,11 @@
 """Service for listing books."""
 
 from src.domain.interfaces.book_repository import (
-    BookMasterRepository,
-    UserLibraryRepository,
+    AsyncBookMasterRepository,
+    AsyncUserLibraryRepository,
+)
+from src.domain.interfaces.library_summary_repository import (
+    LibrarySummaryRepository,
 )
 from src.domain.models.book_master import BookMaster
 from src.domain.models.user import User
@@ -12,10 +15,38 @@ from src.domain.models.user_library import UserLibraryEntry
 class BookWithLibraryInfo:
     """Combined view of book master and user library entry."""
 
-    def __init__(self, book: BookMaster, library_entry: UserLibraryEntry) -> None:
-        """Initialize combined book view."""
+    def __init__(
+        self,
+        book: BookMaster,
+        library_entry: UserLibraryEntry,
+        chapter_count: int | None = None,
+    ) -> None:
+        """Initialize combined book view.
+
+        Args:
+            book: The book master (possibly without TOC, see chapter_count).
+            library_entry: The user's library entry.
+            chapter_count: Number of chapters, when the TOC was not read.
+
+        """
         self.book = book
         self.library_entry = library_entry
+        self.chapter_count = (
+            chapter_count if chapter_count is not None else book.get_chapter_count()
+        )
+
+
+class BookListPage:
+    """One page of a user's books and where the next page starts."""
+
+    def __init__(
+        self,
+        items: list[BookWithLibraryInfo],
+        next_start_after: UserLibraryEntry | None,
+    ) -> None:
+        """Initialize the page."""
+        self.items = items
+        self.next_start_after = next_start_after
 
 
 class ListBooksUseCase:
@@ -23,37 +54,124 @@ class ListBooksUseCase:
 
     def __init__(
         self,
-        book_master_repo: BookMasterRepository,
-        user_library_repo: UserLibraryRepository,
+        book_master_repo: AsyncBookMasterRepository,
+        user_library_repo: AsyncUserLibraryRepository,
+        library_summary_repo: LibrarySummaryRepository | None = None,
     ) -> None:
         """Initialize the use case.
 
         Args:
             book_master_repo: Repository for book master operations.
             user_library_repo: Repository for user library operations.
+            library_summary_repo: Repository for library summaries, used
+                for listings without TOC.
 
         """
         self.book_master_repo = book_master_repo
         self.user_library_repo = user_library_repo
+        self.library_summary_repo = library_summary_repo
+
+    async def library_version(self, user: User) -> int:
+        """Get the version of the user's library, for conditional requests.
 
-    def execute(self, user: User) -> list[BookWithLibraryInfo]:
+        Args:
+            user: The authenticated user.
+
+        Returns:
+            A counter bumped by every change to the listing's content.
+
+        """
+        return await self.user_library_repo.get_version(user.uid)
+
+    async def execute(
+        self,
+        user: User,
+        limit: int | None = None,
+        start_after: UserLibraryEntry | None = None,
+        *,
+        include_toc: bool = True,
+    ) -> BookListPage:
         """Execute the list books process.
 
         Args:
             user: The authenticated user.
+            limit: Page size, or None for the whole library.
+            start_after: The last library entry of the previous page.
+            include_toc: Whether to read the TOCs (list views can skip them).
 
         Returns:
-            List of books with library info belonging to the user.
+            A page of books with library info belonging to the user,
+            newest first.
+
+        """
+        if not include_toc and self.library_summary_repo is not None:
+            return await self._execute_from_summary(user, limit, start_after)
+
+        if limit is None:
+            # The whole library, reading the masters of each page as it comes
+            items = [
+                item
+                async for page in self.user_library_repo.iter_pages_by_user(user.uid)
+                for item in await self._with_books(page, include_toc=include_toc)
+            ]
+            return BookListPage(items, None)
+
+        # One entry past the page tells whether another page follows
+        library_entries = await self.user_library_repo.find_page_by_user(
+            user.uid, limit + 1, start_after
+        )
+        has_more = len(library_entries) > limit
+        library_entries = library_entries[:limit]
+        return BookListPage(
+            await self._with_books(library_entries, include_toc=include_toc),
+            library_entries[-1] if has_more else None,
+        )
+
+    async def _with_books(
+        self, library_entries: list[UserLibraryEntry], *, include_toc: bool
+    ) -> list[BookWithLibraryInfo]:
+        """Fetch the book masters of library entries in one batched read."""
+        book_masters = await self.book_master_repo.find_many_by_isbn(
+            [entry.isbn for entry in library_entries],
+            fields=None if include_toc else ["isbn", "title"],
+        )
+        return [
+            BookWithLibraryInfo(book_master, entry)
+            for book_master, entry in zip(book_masters, library_entries, strict=True)
+            if book_master
+        ]
+
+    async def _execute_from_summary(
+        self,
+        user: User,
+        limit: int | None,
+        start_after: UserLibraryEntry | None,
+    ) -> BookListPage:
+        """List books from the library summary (one document read per shard).
 
+        The summary holds the whole library, so pages are cut in memory
+        with the same ordering and cursors as the library query.
         """
-        # 1. Get user's library entries
-        library_entries = self.user_library_repo.find_by_user(user.uid)
+        items = sorted(
+            await self.library_summary_repo.find_by_user(user.uid),
+            key=lambda item: (item.added_at, item.isbn),
+            reverse=True,
+        )
+        if start_after is not None:
+            cursor = (start_after.added_at, start_after.isbn)
+            items = [item for item in items if (item.added_at, item.isbn) < cursor]
 
-        # 2. Fetch book master data for each entry
-        result = []
-        for entry in library_entries:
-            book_master = self.book_master_repo.find_by_isbn(entry.isbn)
-            if book_master:
-                result.append(BookWithLibraryInfo(book_master, entry))
+        has_more = limit is not None and len(items) > limit
+        items = items[:limit]
 
-        return result
+        books = [
+            BookWithLibraryInfo(
+                BookMaster(isbn=item.isbn, title=item.title),
+                UserLibraryEntry(
+                    user_id=user.uid, isbn=item.isbn, added_at=item.added_at
+                ),
+                chapter_count=item.chapter_count,
+            )
+            for item in items
+        ]
+        return BookListPage(books, books[-1].library_entry if has_more else None)
@@ -0,0 +1,132 @@
+"""Service for draining the indexing outbox."""
+
+import asyncio
+import logging
+from collections import defaultdict
+
+from src.domain.interfaces.book_indexer import BookIndexer
+from src.domain.interfaces.book_repository import (
+    AsyncBookMasterRepository,
+    AsyncUserLibraryRepository,
+)
+from src.domain.interfaces.index_job_queue import IndexJobQueue
+from src.domain.interfaces.library_summary_repository import (
+    LibrarySummaryRepository,
+)
+from src.domain.models.book_master import BookMaster
+from src.domain.models.index_job import IndexJob
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessIndexJobsUseCase:
+    """Use case for processing pending index jobs.
+
+    This handles:
+    1. Leasing a batch of jobs from the outbox
+    2. Loading the current book masters in one batched read
+    3. Indexing each book (bounded concurrency, one job at a time per
+       ISBN), propagating master
+       changes to the library summaries of every owner, and bumping the
+       user's index version once the book is searchable
+    4. Completing, retrying with exponential backoff, or dead-lettering jobs
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        job_queue: IndexJobQueue,
+        book_master_repo: AsyncBookMasterRepository,
+        book_indexer: BookIndexer,
+        *,
+        library_summary_repo: LibrarySummaryRepository | None = None,
+        user_library_repo: AsyncUserLibraryRepository | None = None,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 8,
+        base_backoff_seconds: float = 30.0,
+        max_backoff_seconds: float = 3600.0,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Initialize the use case."""
+        self.job_queue = job_queue
+        self.book_master_repo = book_master_repo
+        self.book_indexer = book_indexer
+        self.library_summary_repo = library_summary_repo
+        self.user_library_repo = user_library_repo
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def execute(self, batch_size: int) -> int:
+        """Process one batch of jobs.
+
+        Args:
+            batch_size: Maximum number of jobs to lease
+
+        Returns:
+            The number of jobs leased (0 when the outbox is empty)
+
+        """
+        jobs = await self.job_queue.claim(batch_size, self.lease_seconds)
+        if not jobs:
+            return 0
+
+        book_masters = await self.book_master_repo.find_many_by_isbn(
+            [job.isbn for job in jobs]
+        )
+        by_isbn: dict[str, list[tuple[IndexJob, BookMaster | None]]] = defaultdict(list)
+        for job, book_master in zip(jobs, book_masters, strict=True):
+            by_isbn[job.isbn].append((job, book_master))
+        await asyncio.gather(*(self._process_isbn(group) for group in by_isbn.values()))
+        return len(jobs)
+
+    async def _process_isbn(
+        self, group: list[tuple[IndexJob, BookMaster | None]]
+    ) -> None:
+        """Process the jobs of one ISBN one after another.
+
+        Indexing may read-modify-write a book's document (the ACL of the
+        shared index), so concurrent jobs for the same ISBN from different
+        users would overwrite each other's changes.
+        """
+        for job, book_master in group:
+            await self._process(job, book_master)
+
+    async def _process(self, job: IndexJob, book_master: BookMaster | None) -> None:
+        """Index one job's book and record the outcome."""
+        if book_master is None:
+            await self.job_queue.dead_letter(job, "Book master not found")
+            return
+
+        try:
+            async with self._semaphore:
+                # The indexer client is blocking, so keep it off the event loop
+                await asyncio.to_thread(
+                    self.book_indexer.index_book, book_master, job.user_id
+                )
+                if job.refresh_summaries and self.library_summary_repo:
+                    await self.library_summary_repo.refresh_book(book_master)
+                # Search results cached since the registration miss the book.
+                # The library version (the listing's ETag) is not bumped: it
+                # moved with the registration, and refresh_book bumps it
+                # for the owners whose summaries change.
+                if self.user_library_repo:
+                    await self.user_library_repo.bump_index_version(job.user_id)
+        except Exception as e:
+            logger.exception("Failed to index %s (attempt %d)", job.isbn, job.attempts)
+            error = f"{type(e).__name__}: {e}"
+            if job.attempts >= self.max_attempts:
+                await self.job_queue.dead_letter(job, error)
+            else:
+                await self.job_queue.retry(job, error, self.backoff_seconds(job))
+            return
+
+        await self.job_queue.complete(job)
+
+    def backoff_seconds(self, job: IndexJob) -> float:
+        """Exponential backoff based on the number of attempts so far."""
+        return min(
+            self.base_backoff_seconds * 2 ** (job.attempts - 1),
+            self.max_backoff_seconds,
+        )
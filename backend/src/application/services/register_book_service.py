@@ -2,14 +2,12 @@
 
 from datetime import UTC, datetime
 
-from google.cloud import firestore
-
 from src.domain.interfaces.book_indexer import BookIndexer
-from src.domain.interfaces.book_repository import (
-    BookMasterRepository,
-    UserLibraryRepository,
+from src.domain.interfaces.book_registration_repository import (
+    BookRegistrationRepository,
 )
 from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.domain.models.index_job import IndexJob
 from src.domain.models.user import User
 from src.domain.models.user_library import UserLibraryEntry
 
@@ -17,24 +15,24 @@ from src.domain.models.user_library import UserLibraryEntry
 class RegisterBookUseCase:
     """Use case for registering a new book.
 
-    This handles:
-    1. Creating/retrieving the book master record (shared across users)
+    This handles, in a single atomic write:
+    1. Creating the book master record (shared across users), or
+       correcting the TOC of an existing one
     2. Adding the book to the user's library
-    3. Indexing the book for search
+    3. Enqueuing an index job (drained by the index worker)
+
+    An in-process index (e.g. the local search engine) is updated right
+    after the write.
     """
 
     def __init__(
         self,
-        book_master_repo: BookMasterRepository,
-        user_library_repo: UserLibraryRepository,
-        book_indexer: BookIndexer,
-        firestore_client: firestore.Client,
+        registration_repo: BookRegistrationRepository,
+        local_indexer: BookIndexer | None = None,
     ) -> None:
         """Initialize the use case."""
-        self.book_master_repo = book_master_repo
-        self.user_library_repo = user_library_repo
-        self.book_indexer = book_indexer
-        self.firestore_client = firestore_client
+        self.registration_repo = registration_repo
+        self.local_indexer = local_indexer
 
     async def execute(
         self,
@@ -57,37 +55,35 @@ class RegisterBookUseCase:
         """
         # Normalize ISBN using domain logic
         normalized_isbn = BookMaster.normalize_isbn(isbn)
+        now = datetime.now(UTC)
+
+        # The caller always provides the full TOC, so the master can be
+        # written without reading it first. If it already exists, only the
+        # TOC is replaced (Vandalism/Correction support).
+        # Convert dicts to domain objects to avoid Pydantic serialization warnings
+        # and ensure valid structure
+        book_master = BookMaster(
+            isbn=normalized_isbn,
+            title=title or "Unknown Title",
+            toc=[TableOfContentsItem(**item) for item in toc],
+            last_updated_by=user.uid,
+            created_at=now,
+            updated_at=now,
+        )
 
-        # Check if book master exists
-        book_master = self.book_master_repo.find_by_isbn(normalized_isbn)
-
-        if not book_master:
-            # Create new BookMaster using provided TOC
-            book_master = BookMaster(
-                isbn=normalized_isbn,
-                title=title or "Unknown Title",
-                toc=[TableOfContentsItem(**item) for item in toc],
-                last_updated_by=user.uid,
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC),
-            )
-            self.book_master_repo.save(book_master)
-
-        else:
-            # Book exists. Update TOC (Vandalism/Correction support)
-            # Convert dicts to domain objects to avoid Pydantic serialization warnings
-            # and ensure valid structure
-            book_master.toc = [TableOfContentsItem(**item) for item in toc]
-            book_master.last_updated_by = user.uid
-            book_master.updated_at = datetime.now(UTC)
-            self.book_master_repo.save(book_master)
-
-        # Add to user's library (Idempotent)
+        # Add to user's library (Idempotent; an existing entry keeps added_at)
         library_entry = UserLibraryEntry(
             user_id=user.uid,
             isbn=normalized_isbn,
-            added_at=datetime.now(UTC),
+            added_at=now,
+        )
+
+        book_master, library_entry = await self.registration_repo.register(
+            book_master,
+            library_entry,
+            IndexJob(isbn=normalized_isbn, user_id=user.uid),
         )
-        saved_entry = self.user_library_repo.add_book(library_entry)
+        if self.local_indexer is not None:
+            self.local_indexer.index_book(book_master, user.uid)
 
-        return book_master, saved_entry
+        return book_master, library_entry
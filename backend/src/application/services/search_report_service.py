@@ -1,33 +1,168 @@
 """Service for searching and reporting."""
 
+from collections.abc import AsyncIterator
+from typing import Any
+
+from src.application.services.chapter_selector import ChapterSelector
+from src.domain.interfaces.book_repository import AsyncUserLibraryRepository
 from src.domain.interfaces.report_generator import ReportGenerator
-from src.domain.interfaces.search_engine import SearchEngine
-from src.domain.models.search_report import SearchReport
+from src.domain.interfaces.search_engine import AsyncSearchEngine
+from src.domain.interfaces.search_report_cache import SearchReportCache
+from src.domain.models.search_report import (
+    CachedSearchReport,
+    RecommendedBook,
+    SearchReport,
+    SearchReportCacheKey,
+)
+from src.domain.text import normalize_query
 
 
 class SearchReportUseCase:
-    """Use case for searching books and generating reports."""
+    """Use case for searching books and generating reports.
+
+    With a report cache and a library repository, results are cached per
+    (user, normalized query, limit, library version): repeating a query
+    against an unchanged library skips both the search and the report,
+    and any library change makes the cached entries unreachable.
+    """
 
     def __init__(
         self,
-        search_engine: SearchEngine,
+        search_engine: AsyncSearchEngine,
         report_generator: ReportGenerator,
+        report_cache: SearchReportCache | None = None,
+        user_library_repo: AsyncUserLibraryRepository | None = None,
+        chapter_selector: ChapterSelector | None = None,
     ) -> None:
         """Initialize the use case."""
         self.search_engine = search_engine
         self.report_generator = report_generator
+        self.report_cache = report_cache
+        self.user_library_repo = user_library_repo
+        self.chapter_selector = chapter_selector
 
-    def execute(self, query: str, limit: int = 10, user_id: str | None = None) -> dict:
+    async def execute(
+        self, query: str, limit: int = 10, user_id: str | None = None
+    ) -> dict:
         """Execute the search and report generation process."""
+        cache_key = await self._cache_key(query, limit, user_id)
+        if cache_key is not None:
+            cached = await self.report_cache.get(cache_key)
+            if cached is not None:
+                return self._response(query, cached.search_results, cached.report)
+
         # 1. Search for relevant books (filtered by user if user_id provided)
-        search_results = self.search_engine.search(query, limit, user_id=user_id)
+        search_results = await self._search(query, limit, user_id)
 
         # 2. Generate report only if there are search results
         if search_results:
-            report = self.report_generator.generate_report(query, search_results)
+            report = await self.report_generator.generate_report(
+                query, self._report_context(query, search_results)
+            )
         else:
             report = SearchReport(recommendations=[])
 
+        if cache_key is not None and self._is_complete(search_results, report):
+            await self.report_cache.set(
+                cache_key,
+                CachedSearchReport(search_results=search_results, report=report),
+            )
+
+        return self._response(query, search_results, report)
+
+    async def stream(
+        self, query: str, limit: int = 10, user_id: str | None = None
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Execute the search, streaming the report as it is generated.
+
+        Yields (event, data) pairs: one "search_results" event as soon as
+        the search returns, one "recommendation" event per recommended
+        book and a final "done" event. A completed stream fills the same
+        cache as execute(); an interrupted one is not cached.
+        """
+        cache_key = await self._cache_key(query, limit, user_id)
+        if cache_key is not None:
+            cached = await self.report_cache.get(cache_key)
+            if cached is not None:
+                yield (
+                    "search_results",
+                    self._results_event(query, cached.search_results),
+                )
+                for recommendation in cached.report.recommendations:
+                    yield "recommendation", recommendation.model_dump()
+                yield (
+                    "done",
+                    {"recommendations_count": len(cached.report.recommendations)},
+                )
+                return
+
+        search_results = await self._search(query, limit, user_id)
+        yield "search_results", self._results_event(query, search_results)
+
+        recommendations: list[RecommendedBook] = []
+        if search_results:
+            async for recommendation in self.report_generator.stream_report(
+                query, self._report_context(query, search_results)
+            ):
+                recommendations.append(recommendation)
+                yield "recommendation", recommendation.model_dump()
+
+        report = SearchReport(recommendations=recommendations)
+        if cache_key is not None and self._is_complete(search_results, report):
+            await self.report_cache.set(
+                cache_key,
+                CachedSearchReport(search_results=search_results, report=report),
+            )
+        yield "done", {"recommendations_count": len(recommendations)}
+
+    async def _cache_key(
+        self, query: str, limit: int, user_id: str | None
+    ) -> SearchReportCacheKey | None:
+        """Build the cache key, or None when caching is not possible."""
+        if not (self.report_cache and self.user_library_repo and user_id):
+            return None
+        return SearchReportCacheKey(
+            user_id=user_id,
+            query=normalize_query(query),
+            limit=limit,
+            search_version=await self.user_library_repo.get_search_version(user_id),
+        )
+
+    async def _search(self, query: str, limit: int, user_id: str | None) -> list[dict]:
+        """Search for relevant books."""
+        return await self.search_engine.search(query, limit, user_id=user_id)
+
+    def _report_context(self, query: str, search_results: list[dict]) -> list[dict]:
+        """Trim the TOCs passed to the report generator to relevant chapters.
+
+        The response still carries the full search results.
+        """
+        if self.chapter_selector is None:
+            return search_results
+        return self.chapter_selector.select(query, search_results)
+
+    @staticmethod
+    def _is_complete(search_results: list[dict], report: SearchReport) -> bool:
+        """Check whether a report may be cached.
+
+        The report generator turns failures (including its deadline) into
+        an empty report, so an empty report for non-empty results is not
+        cached; the next request regenerates it.
+        """
+        return bool(report.recommendations) or not search_results
+
+    @staticmethod
+    def _results_event(query: str, search_results: list[dict]) -> dict:
+        """Build the "search_results" stream event."""
+        return {
+            "query": query,
+            "results_count": len(search_results),
+            "search_results": search_results,
+        }
+
+    @staticmethod
+    def _response(query: str, search_results: list[dict], report: SearchReport) -> dict:
+        """Build the search response."""
         return {
             "query": query,
             "results_count": len(search_results),
@@ -0,0 +1,208 @@
+"""Bulk (re-)index every book master into Vertex AI Search.
+
+Usage:
+    uv run python -m src.bulk_index [--output-dir DIR] [--reset]
+
+Books are streamed from Firestore in pages and written in batches, either
+straight into the data store through ImportDocuments (inline source) or as
+JSONL files for a GCS-based import. A checkpoint is saved after every page,
+so an interrupted run resumes where it stopped.
+"""
+
+import argparse
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from firebase_admin import firestore
+
+from src.config import get_settings
+from src.infrastructure.firebase.setup import initialize_firebase
+from src.infrastructure.firestore.book_master_repository import (
+    FirestoreBookMasterRepository,
+)
+from src.infrastructure.firestore.user_library_repository import (
+    FirestoreUserLibraryRepository,
+)
+from src.infrastructure.vertex.book_document import bulk_documents
+from src.infrastructure.vertex.bulk_import import (
+    DocumentBatchSink,
+    JsonlDirectorySink,
+    VertexAIImportSink,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BulkIndexPipeline:
+    """Streams book masters into a document sink with bounded concurrency."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        book_master_repo: FirestoreBookMasterRepository,
+        user_library_repo: FirestoreUserLibraryRepository,
+        sink: DocumentBatchSink,
+        checkpoint_path: Path,
+        *,
+        shared: bool,
+        page_size: int = 500,
+        batch_size: int = 100,
+        max_concurrency: int = 4,
+    ) -> None:
+        """Initialize the pipeline."""
+        self.book_master_repo = book_master_repo
+        self.user_library_repo = user_library_repo
+        self.sink = sink
+        self.checkpoint_path = checkpoint_path
+        self.shared = shared
+        self.page_size = page_size
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+
+    def load_checkpoint(self) -> dict[str, Any]:
+        """Load the last checkpoint, or an empty one."""
+        if not self.checkpoint_path.exists():
+            return {"last_isbn": None, "books": 0, "documents": 0}
+        return json.loads(self.checkpoint_path.read_text(encoding="utf-8"))
+
+    def save_checkpoint(self, checkpoint: dict[str, Any]) -> None:
+        """Atomically persist the checkpoint."""
+        tmp_path = self.checkpoint_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(checkpoint), encoding="utf-8")
+        tmp_path.replace(self.checkpoint_path)
+
+    def run(self) -> dict[str, Any]:
+        """Index every book after the checkpoint.
+
+        Returns:
+            The final checkpoint, including the throughput of this run.
+
+        """
+        checkpoint = self.load_checkpoint()
+        if checkpoint["last_isbn"]:
+            logger.info("Resuming after ISBN %s", checkpoint["last_isbn"])
+
+        owners = self.user_library_repo.find_all_owners()
+        logger.info("Loaded owners of %d books", len(owners))
+
+        started = time.monotonic()
+        documents_this_run = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            for page in self.book_master_repo.iter_pages(
+                self.page_size, start_after_isbn=checkpoint["last_isbn"]
+            ):
+                documents = [
+                    document
+                    for book in page
+                    for document in bulk_documents(
+                        book, owners.get(book.isbn, set()), shared=self.shared
+                    )
+                ]
+                batches = [
+                    documents[i : i + self.batch_size]
+                    for i in range(0, len(documents), self.batch_size)
+                ]
+                # Wait for the whole page before checkpointing it;
+                # .result() re-raises the first failed batch.
+                futures = [
+                    executor.submit(self.sink.write_batch, batch[0][0], batch)
+                    for batch in batches
+                ]
+                for future in futures:
+                    future.result()
+
+                documents_this_run += len(documents)
+                checkpoint = {
+                    "last_isbn": page[-1].isbn,
+                    "books": checkpoint["books"] + len(page),
+                    "documents": checkpoint["documents"] + len(documents),
+                }
+                self.save_checkpoint(checkpoint)
+
+                elapsed = time.monotonic() - started
+                logger.info(
+                    "Indexed %d books / %d documents so far (%.1f docs/s)",
+                    checkpoint["books"],
+                    checkpoint["documents"],
+                    documents_this_run / elapsed if elapsed else 0.0,
+                )
+
+        elapsed = time.monotonic() - started
+        return {
+            **checkpoint,
+            "elapsed_seconds": round(elapsed, 1),
+            "documents_per_second": (
+                round(documents_this_run / elapsed, 1) if elapsed else 0.0
+            ),
+        }
+
+
+def main() -> None:
+    """Run the bulk indexer from the command line."""
+    settings = get_settings()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        help="Write JSONL files here instead of importing into the data store",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["per_user", "shared"],
+        default=settings.vertex_index_mode,
+        help="Document layout (defaults to VERTEX_INDEX_MODE)",
+    )
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument(
+        "--batch-size", type=int, default=VertexAIImportSink.MAX_BATCH_SIZE
+    )
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        default=Path(".bulk_index_checkpoint.json"),
+    )
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="Ignore an existing checkpoint and start from the first book",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    initialize_firebase()
+    db = firestore.client()
+
+    if args.reset:
+        args.checkpoint.unlink(missing_ok=True)
+
+    sink: DocumentBatchSink
+    if args.output_dir:
+        sink = JsonlDirectorySink(args.output_dir)
+    else:
+        sink = VertexAIImportSink(
+            settings.google_cloud_project,
+            settings.vertex_ai_data_store_id,
+            settings.vertex_ai_location,
+        )
+
+    pipeline = BulkIndexPipeline(
+        FirestoreBookMasterRepository(db),
+        FirestoreUserLibraryRepository(db),
+        sink,
+        args.checkpoint,
+        shared=args.mode == "shared",
+        page_size=args.page_size,
+        batch_size=args.batch_size,
+        max_concurrency=args.concurrency,
+    )
+    result = pipeline.run()
+    logger.info("Bulk indexing finished: %s", result)
+
+
+if __name__ == "__main__":
+    main()
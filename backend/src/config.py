@@ -5,6 +5,7 @@ Centralizes all environment variables and settings.
 
 import json
 from functools import lru_cache
+from typing import Literal
 
 from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -21,11 +22,93 @@ class Settings(BaseSettings):
     # Vertex AI Search
     vertex_ai_data_store_id: str
     vertex_ai_location: str = "global"
+    # "per_user": one document per (user, ISBN)
+    # "shared": one document per ISBN with a `user_ids` ACL
+    vertex_index_mode: Literal["per_user", "shared"] = "per_user"
+
+    # Search backend: "vertex" (Vertex AI Search), "local" (in-process
+    # index over titles and TOCs, built from Firestore at startup) or
+    # "hedged" (Vertex AI Search, falling back to the local index when it
+    # has not answered within the hedge delay or failed)
+    search_backend: Literal["vertex", "local", "hedged"] = "vertex"
+    vertex_search_timeout_seconds: float = 10.0
+    # About the p95 latency of Vertex AI Search
+    search_hedge_delay_seconds: float = 0.8
+    # How often each worker reads the library entries added since its last
+    # read into its local index, to see registrations made through other
+    # workers (0 disables)
+    local_search_refresh_seconds: float = 300.0
+    # How often a refresh is a full rebuild instead, to drop removed books
+    # and re-read changed TOCs (0 disables)
+    local_search_rebuild_seconds: float = 86400.0
+
+    # Indexing outbox and worker
+    index_job_lease_seconds: float = 300.0
+    index_job_max_attempts: int = 8
+    index_job_base_backoff_seconds: float = 30.0
+    index_job_max_backoff_seconds: float = 3600.0
+    index_worker_batch_size: int = 20
+    index_worker_concurrency: int = 4
+    index_worker_poll_seconds: float = 5.0
 
     # Gemini
     gemini_toc_model: str = "gemini-2.5-flash"
     gemini_report_model: str = "gemini-2.5-flash"
     gemini_location: str = "asia-northeast1"
+    # Per-process concurrency caps and per-call deadlines (seconds)
+    gemini_toc_max_concurrency: int = 4
+    gemini_toc_timeout_seconds: float = 60.0
+    gemini_report_max_concurrency: int = 16
+    gemini_report_timeout_seconds: float = 30.0
+
+    # Bibliographic metadata sources (per-request timeouts in seconds)
+    ndl_timeout_seconds: float = 10.0
+    google_books_timeout_seconds: float = 10.0
+
+    # Bibliographic metadata cache ("memory" or "firestore")
+    book_metadata_cache_backend: Literal["memory", "firestore"] = "memory"
+    book_metadata_cache_max_size: int = 4096
+    book_metadata_positive_ttl_seconds: int = 30 * 24 * 60 * 60
+    book_metadata_negative_ttl_seconds: int = 24 * 60 * 60
+    # Google Books answers given while NDL Search was failing
+    book_metadata_fallback_ttl_seconds: int = 60 * 60
+
+    # TOC preview cache
+    toc_preview_cache_ttl_seconds: int = 7 * 24 * 60 * 60
+    toc_preview_cache_max_size: int = 1024
+
+    # Library summary documents (users/{uid}/summary/shard-k); raise for
+    # libraries that outgrow one document (~8k books per shard)
+    library_summary_shards: int = 1
+
+    # Bulk book import
+    book_import_max_isbns: int = 1000
+    book_import_max_concurrency: int = 4
+    book_import_generations_per_minute: int = 30
+    book_import_flush_size: int = 50
+    # A running import saves a heartbeat this often; one silent for longer
+    # than book_import_stale_after_seconds was interrupted and is failed
+    book_import_heartbeat_seconds: float = 60.0
+    book_import_stale_after_seconds: float = 600.0
+
+    # Search report cache (keyed by library version, so the TTL only
+    # bounds how long a report can go without being regenerated)
+    search_report_cache_ttl_seconds: int = 60 * 60
+    search_report_cache_max_size: int = 1024
+
+    # TOC excerpts passed to the report prompt: matching entries per book
+    # (with their ancestors) and estimated tokens per book
+    report_chapters_per_book: int = 5
+    report_toc_tokens_per_book: int = 400
+
+    # Cross-user report cache ("memory" or "firestore", fronted by memory)
+    report_cache_backend: Literal["memory", "firestore"] = "firestore"
+    report_cache_max_size: int = 2048
+    report_cache_ttl_seconds: int = 7 * 24 * 60 * 60
+
+    # Verified ID token cache
+    auth_token_cache_max_size: int = 10_000
+    auth_token_cache_skew_seconds: float = 60.0
 
     # CORS
     cors_origins: list[str] | str = ["*"]
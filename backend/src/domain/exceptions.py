@@ -32,3 +32,17 @@ class AuthenticationError(DomainError):
         """
         self.message = message
         super().__init__(self.message)
+
+
+class SearchUnavailableError(DomainError):
+    """Raised when a search backend fails or misses its deadline."""
+
+    def __init__(self, message: str = "Search is unavailable") -> None:
+        """Initialize search unavailable error.
+
+        Args:
+            message: Error message describing the failure.
+
+        """
+        self.message = message
+        super().__init__(self.message)
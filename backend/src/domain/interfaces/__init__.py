@@ -2,21 +2,50 @@
 
 from src.domain.interfaces.auth_service import AuthService
 from src.domain.interfaces.book_indexer import BookIndexer
+from src.domain.interfaces.book_metadata_cache import BookMetadataCache
+from src.domain.interfaces.book_registration_repository import (
+    BookRegistrationRepository,
+)
 from src.domain.interfaces.book_repository import (
+    AsyncBookMasterRepository,
+    AsyncUserLibraryRepository,
     BookMasterRepository,
     TOCGenerator,
     UserLibraryRepository,
 )
+from src.domain.interfaces.bulk_book_writer import BulkBookWriter
+from src.domain.interfaces.import_job_repository import ImportJobRepository
+from src.domain.interfaces.index_job_queue import IndexJobQueue
+from src.domain.interfaces.library_summary_repository import (
+    LibrarySummaryRepository,
+)
+from src.domain.interfaces.report_cache import ReportCache
 from src.domain.interfaces.report_generator import ReportGenerator
-from src.domain.interfaces.search_engine import SearchEngine, SearchResult
+from src.domain.interfaces.search_engine import (
+    AsyncSearchEngine,
+    SearchResult,
+)
+from src.domain.interfaces.search_report_cache import SearchReportCache
+from src.domain.interfaces.toc_preview_cache import TOCPreviewCache
 
 __all__ = [
+    "AsyncBookMasterRepository",
+    "AsyncSearchEngine",
+    "AsyncUserLibraryRepository",
     "AuthService",
     "BookIndexer",
     "BookMasterRepository",
+    "BookMetadataCache",
+    "BookRegistrationRepository",
+    "BulkBookWriter",
+    "ImportJobRepository",
+    "IndexJobQueue",
+    "LibrarySummaryRepository",
+    "ReportCache",
     "ReportGenerator",
-    "SearchEngine",
+    "SearchReportCache",
     "SearchResult",
     "TOCGenerator",
+    "TOCPreviewCache",
     "UserLibraryRepository",
 ]
@@ -10,4 +10,7 @@ class BookIndexer(ABC):
 
     @abstractmethod
     def index_book(self, book: BookMaster, user_id: str) -> None:
-        """Index a book into the search engine for a specific user."""
+        """Index a book into the search engine for a specific user.
+
+        Raises on failure so the caller (the index worker) can retry.
+        """
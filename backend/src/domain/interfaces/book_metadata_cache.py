@@ -0,0 +1,38 @@
+"""Interface for Bibliographic Metadata Cache."""
+
+from abc import ABC, abstractmethod
+
+
+class BookMetadataCache(ABC):
+    """Abstract interface for caching bibliographic metadata lookups.
+
+    Entries are keyed by normalized ISBN. An empty dict records that the
+    metadata sources do not know the ISBN (negative caching).
+    """
+
+    @abstractmethod
+    async def get(self, isbn: str) -> dict | None:
+        """Get cached metadata.
+
+        Args:
+            isbn: The normalized ISBN
+
+        Returns:
+            The cached metadata, {} for a cached "not found",
+            or None if nothing is cached
+
+        """
+
+    @abstractmethod
+    async def set(
+        self, isbn: str, metadata: dict, ttl_seconds: float | None = None
+    ) -> None:
+        """Store metadata.
+
+        Args:
+            isbn: The normalized ISBN
+            metadata: The metadata, or {} to record a "not found"
+            ttl_seconds: How long to keep it, overriding the cache's
+                positive/negative TTL
+
+        """
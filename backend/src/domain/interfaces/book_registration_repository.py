@@ -0,0 +1,39 @@
+"""Interface for Book Registration Repository."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.models.book_master import BookMaster
+from src.domain.models.index_job import IndexJob
+from src.domain.models.user_library import UserLibraryEntry
+
+
+class BookRegistrationRepository(ABC):
+    """Abstract interface for registering a book in one atomic write.
+
+    Registration touches the shared book master, the user's library and
+    the indexing outbox; all of them are written together or not at all,
+    so concurrent registrations of the same ISBN cannot interleave.
+    """
+
+    @abstractmethod
+    async def register(
+        self,
+        book: BookMaster,
+        entry: UserLibraryEntry,
+        index_job: IndexJob,
+    ) -> tuple[BookMaster, UserLibraryEntry]:
+        """Create or correct a book master and add it to a user's library.
+
+        Args:
+            book: The book master to create. If a master already exists,
+                only its TOC, last_updated_by and updated_at are replaced
+            entry: The library entry to add (idempotent). An existing
+                entry keeps its added_at
+            index_job: The index job to enqueue. It replaces a pending job
+                for the same book and user, keeping its refresh_summaries
+
+        Returns:
+            Tuple of (book_master, library_entry) as stored after the
+            registration
+
+        """
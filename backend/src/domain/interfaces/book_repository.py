@@ -1,6 +1,7 @@
 """Interfaces for Book Repository and TOC Generator."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from src.domain.models.book_master import BookMaster
 from src.domain.models.user_library import UserLibraryEntry
@@ -36,6 +37,19 @@ class BookMasterRepository(ABC):
 
         """
 
+    @abstractmethod
+    def find_many_by_isbn(self, isbns: list[str]) -> list[BookMaster | None]:
+        """Find multiple books by ISBN in a batched read.
+
+        Args:
+            isbns: The ISBNs to search for (will be normalized)
+
+        Returns:
+            A list aligned with the input, holding the book master
+            or None for each ISBN that was not found
+
+        """
+
     @abstractmethod
     def exists(self, isbn: str) -> bool:
         """Check if a book exists in the master collection.
@@ -56,11 +70,17 @@ class UserLibraryRepository(ABC):
     """
 
     @abstractmethod
-    def add_book(self, entry: UserLibraryEntry) -> UserLibraryEntry:
+    def add_book(
+        self, entry: UserLibraryEntry, book: BookMaster | None = None
+    ) -> UserLibraryEntry:
         """Add a book to user's library.
 
+        The library summary is updated in the same write.
+
         Args:
             entry: The library entry to add
+            book: The book master, for the summary entry. Without it the
+                summary is marked incomplete and rebuilt on the next read
 
         Returns:
             The saved library entry
@@ -69,7 +89,7 @@ class UserLibraryRepository(ABC):
 
     @abstractmethod
     def remove_book(self, user_id: str, isbn: str) -> None:
-        """Remove a book from user's library.
+        """Remove a book from user's library (and its library summary).
 
         Args:
             user_id: The user ID
@@ -114,6 +134,202 @@ class UserLibraryRepository(ABC):
         """
 
 
+class AsyncBookMasterRepository(ABC):
+    """Async counterpart of BookMasterRepository.
+
+    Used from async endpoints and use cases so storage round trips
+    do not block the event loop.
+    """
+
+    @abstractmethod
+    async def save(self, book: BookMaster) -> BookMaster:
+        """Save a book master record.
+
+        Args:
+            book: The book master to save (ISBN is used as document ID)
+
+        Returns:
+            The saved book master
+
+        """
+
+    @abstractmethod
+    async def find_by_isbn(self, isbn: str) -> BookMaster | None:
+        """Find a book by ISBN.
+
+        Args:
+            isbn: The ISBN to search for (will be normalized)
+
+        Returns:
+            The book master if found, None otherwise
+
+        """
+
+    @abstractmethod
+    async def find_many_by_isbn(
+        self, isbns: list[str], fields: list[str] | None = None
+    ) -> list[BookMaster | None]:
+        """Find multiple books by ISBN in a batched read.
+
+        Args:
+            isbns: The ISBNs to search for (will be normalized)
+            fields: Optional projection; fields not read (e.g. "toc")
+                keep their default value
+
+        Returns:
+            A list aligned with the input, holding the book master
+            or None for each ISBN that was not found
+
+        """
+
+    @abstractmethod
+    async def exists(self, isbn: str) -> bool:
+        """Check if a book exists in the master collection.
+
+        Args:
+            isbn: The ISBN to check (will be normalized)
+
+        Returns:
+            True if the book exists, False otherwise
+
+        """
+
+
+class AsyncUserLibraryRepository(ABC):
+    """Async counterpart of UserLibraryRepository."""
+
+    @abstractmethod
+    async def add_book(
+        self, entry: UserLibraryEntry, book: BookMaster | None = None
+    ) -> UserLibraryEntry:
+        """Add a book to user's library.
+
+        The library summary is updated in the same write.
+
+        Args:
+            entry: The library entry to add
+            book: The book master, for the summary entry. Without it the
+                summary is marked incomplete and rebuilt on the next read
+
+        Returns:
+            The saved library entry
+
+        """
+
+    @abstractmethod
+    async def remove_book(self, user_id: str, isbn: str) -> None:
+        """Remove a book from user's library (and its library summary).
+
+        Args:
+            user_id: The user ID
+            isbn: The ISBN of the book to remove
+
+        """
+
+    @abstractmethod
+    def iter_pages_by_user(self, user_id: str) -> AsyncIterator[list[UserLibraryEntry]]:
+        """Iterate over all library entries of a user, one page at a time.
+
+        Pages follow the order of `find_page_by_user`, and the next page is
+        only read once the caller asks for it.
+
+        Args:
+            user_id: The user ID
+
+        Yields:
+            Non-empty pages of library entries, newest first
+
+        """
+
+    @abstractmethod
+    async def find_page_by_user(
+        self,
+        user_id: str,
+        limit: int,
+        start_after: UserLibraryEntry | None = None,
+    ) -> list[UserLibraryEntry]:
+        """Find one page of library entries, newest first.
+
+        Entries are ordered by added_at descending, with the ISBN
+        breaking ties, so pages are stable while books are added.
+
+        Args:
+            user_id: The user ID
+            limit: Maximum number of entries to return
+            start_after: The last entry of the previous page, if any
+
+        Returns:
+            Up to `limit` library entries
+
+        """
+
+    @abstractmethod
+    async def find_entry(self, user_id: str, isbn: str) -> UserLibraryEntry | None:
+        """Find a specific library entry.
+
+        Args:
+            user_id: The user ID
+            isbn: The ISBN of the book
+
+        Returns:
+            The library entry if found, None otherwise
+
+        """
+
+    @abstractmethod
+    async def update_entry(self, entry: UserLibraryEntry) -> UserLibraryEntry:
+        """Update a library entry.
+
+        Args:
+            entry: The library entry to update
+        Returns:
+            The updated library entry
+
+        """
+
+    @abstractmethod
+    async def get_version(self, user_id: str) -> int:
+        """Get the version of a user's library.
+
+        The version is bumped by every change to the library, including
+        changes to the books in it, so it can back conditional requests.
+
+        Args:
+            user_id: The user ID
+
+        Returns:
+            The library version (0 for a library that never changed)
+
+        """
+
+    @abstractmethod
+    async def get_search_version(self, user_id: str) -> int:
+        """Get the version of what a search over a user's library can find.
+
+        Moves with the library version and with the index version, so
+        results derived from an older library or index are not reused.
+
+        Args:
+            user_id: The user ID
+
+        Returns:
+            The search version (0 for a library that never changed)
+
+        """
+
+    @abstractmethod
+    async def bump_index_version(self, user_id: str) -> None:
+        """Bump the index version of a user's library.
+
+        Used once a change becomes searchable (e.g. a registered book was
+        indexed). The library version, and so the listing's ETag, stays.
+
+        Args:
+            user_id: The user ID
+
+        """
+
+
 class TOCGenerator(ABC):
     """Abstract interface for TOC generation."""
 
@@ -0,0 +1,34 @@
+"""Interface for Bulk Book Writer."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.models.book_master import BookMaster
+from src.domain.models.index_job import IndexJob
+from src.domain.models.user_library import UserLibraryEntry
+
+
+class BulkBookWriter(ABC):
+    """Abstract interface for writing many registrations at once.
+
+    Unlike BookRegistrationRepository, writes are not atomic across
+    documents; they are pipelined for throughput, as used by imports.
+    """
+
+    @abstractmethod
+    async def write(
+        self,
+        books: list[BookMaster],
+        entries: list[tuple[UserLibraryEntry, BookMaster]],
+        index_jobs: list[IndexJob],
+    ) -> None:
+        """Write book masters, library entries and index jobs.
+
+        Args:
+            books: New book masters. A master that already exists
+                is left untouched
+            entries: Library entries to add (idempotent; an existing
+                entry keeps its added_at), each with its book master for
+                the library summary
+            index_jobs: Index jobs to enqueue
+
+        """
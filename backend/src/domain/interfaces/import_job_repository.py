@@ -0,0 +1,34 @@
+"""Interface for Import Job Repository."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.models.import_job import ImportJob
+
+
+class ImportJobRepository(ABC):
+    """Abstract interface for storing bulk import jobs and their progress."""
+
+    @abstractmethod
+    async def save(self, job: ImportJob) -> ImportJob:
+        """Create or overwrite an import job.
+
+        Args:
+            job: The import job to save
+
+        Returns:
+            The saved import job
+
+        """
+
+    @abstractmethod
+    async def find(self, user_id: str, job_id: str) -> ImportJob | None:
+        """Find an import job of a user.
+
+        Args:
+            user_id: The user ID
+            job_id: The import job ID
+
+        Returns:
+            The import job if found, None otherwise
+
+        """
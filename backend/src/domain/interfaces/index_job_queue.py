@@ -0,0 +1,60 @@
+"""Interface for Index Job Queue (indexing outbox)."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.models.index_job import IndexJob
+
+
+class IndexJobQueue(ABC):
+    """Abstract interface for draining the indexing outbox.
+
+    Jobs are leased for a limited time; a job whose worker died becomes
+    available again once its lease expires. Completion and retries only
+    apply while the caller still holds the lease.
+    """
+
+    @abstractmethod
+    async def claim(self, limit: int, lease_seconds: float) -> list[IndexJob]:
+        """Lease up to `limit` available jobs.
+
+        Args:
+            limit: Maximum number of jobs to lease
+            lease_seconds: How long the jobs stay invisible to other workers
+
+        Returns:
+            The leased jobs (with `lease_id` and incremented `attempts`)
+
+        """
+
+    @abstractmethod
+    async def complete(self, job: IndexJob) -> None:
+        """Remove a successfully processed job.
+
+        A job marked dirty by a re-registration while it was leased is
+        released for another pass instead.
+
+        Args:
+            job: The leased job
+
+        """
+
+    @abstractmethod
+    async def retry(self, job: IndexJob, error: str, delay_seconds: float) -> None:
+        """Release a failed job so it is retried after a delay.
+
+        Args:
+            job: The leased job
+            error: Description of the failure
+            delay_seconds: Backoff before the job becomes available again
+
+        """
+
+    @abstractmethod
+    async def dead_letter(self, job: IndexJob, error: str) -> None:
+        """Park a job that will not be retried anymore.
+
+        Args:
+            job: The leased job
+            error: Description of the final failure
+
+        """
@@ -0,0 +1,41 @@
+"""Interface for Library Summary Repository."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.models.book_master import BookMaster
+from src.domain.models.library_summary import LibrarySummaryItem
+
+
+class LibrarySummaryRepository(ABC):
+    """Abstract interface for per-user library summaries.
+
+    Summaries are maintained in the same writes that change a library;
+    this interface reads them and propagates book master changes to
+    every owner.
+    """
+
+    @abstractmethod
+    async def find_by_user(self, user_id: str) -> list[LibrarySummaryItem]:
+        """Get the summary of every book in a user's library.
+
+        A missing or incomplete summary is rebuilt from the library.
+
+        Args:
+            user_id: The user ID
+
+        Returns:
+            The summary items, in no particular order
+
+        """
+
+    @abstractmethod
+    async def refresh_book(self, book: BookMaster) -> int:
+        """Update the summary entry of a book for all of its owners.
+
+        Args:
+            book: The book master whose title or TOC changed
+
+        Returns:
+            The number of owners updated
+
+        """
@@ -0,0 +1,35 @@
+"""Interface for Report Cache."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.models.search_report import SearchReport
+
+
+class ReportCache(ABC):
+    """Abstract interface for caching generated reports across users.
+
+    Entries are keyed by a hash of the normalized query and the retrieved
+    books' content, so identical retrievals share one generated report.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> SearchReport | None:
+        """Get a cached report.
+
+        Args:
+            key: The report key
+
+        Returns:
+            The cached report, or None if nothing is cached
+
+        """
+
+    @abstractmethod
+    async def set(self, key: str, report: SearchReport) -> None:
+        """Store a report.
+
+        Args:
+            key: The report key
+            report: The generated report
+
+        """
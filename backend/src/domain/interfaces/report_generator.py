@@ -1,13 +1,28 @@
 """Interface for Report Generator."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
-from src.domain.models.search_report import SearchReport
+from src.domain.models.search_report import RecommendedBook, SearchReport
 
 
 class ReportGenerator(ABC):
     """Abstract interface for Report Generator."""
 
     @abstractmethod
-    def generate_report(self, query: str, search_results: list[dict]) -> SearchReport:
+    async def generate_report(
+        self, query: str, search_results: list[dict]
+    ) -> SearchReport:
         """Generate a report from search results."""
+
+    @abstractmethod
+    def stream_report(
+        self, query: str, search_results: list[dict]
+    ) -> AsyncIterator[RecommendedBook]:
+        """Generate a report, yielding each recommendation as it is produced.
+
+        Raises:
+            Exception: If generation fails; recommendations already yielded
+                stay valid.
+
+        """
@@ -11,11 +11,21 @@ class SearchResult(dict[str, Any]):
     """
 
 
-class SearchEngine(ABC):
-    """Abstract interface for search operations."""
+class AsyncSearchEngine(ABC):
+    """Abstract interface for search operations.
+
+    Async so a search does not hold a threadpool thread while it waits
+    on the network.
+    """
 
     @abstractmethod
-    def search(
+    async def search(
         self, query: str, limit: int = 5, user_id: str | None = None
     ) -> list[SearchResult]:
-        """Search for documents matching the query, optionally filtered by user."""
+        """Search for documents matching the query, optionally filtered by user.
+
+        Raises:
+            SearchUnavailableError: If the backend fails, so a failure is
+                not mistaken for "nothing found".
+
+        """
@@ -0,0 +1,35 @@
+"""Interface for Search Report Cache."""
+
+from abc import ABC, abstractmethod
+
+from src.domain.models.search_report import CachedSearchReport, SearchReportCacheKey
+
+
+class SearchReportCache(ABC):
+    """Abstract interface for caching search results and their reports.
+
+    Repeating a query against an unchanged library then skips both the
+    search and the report generation.
+    """
+
+    @abstractmethod
+    async def get(self, key: SearchReportCacheKey) -> CachedSearchReport | None:
+        """Get a cached search report.
+
+        Args:
+            key: The user, normalized query, limit and library version
+
+        Returns:
+            The cached search results and report, None if not cached
+
+        """
+
+    @abstractmethod
+    async def set(self, key: SearchReportCacheKey, value: CachedSearchReport) -> None:
+        """Store a search report.
+
+        Args:
+            key: The user, normalized query, limit and library version
+            value: The search results and the report generated from them
+
+        """
@@ -0,0 +1,34 @@
+"""Interface for TOC Preview Cache."""
+
+from abc import ABC, abstractmethod
+
+
+class TOCPreviewCache(ABC):
+    """Abstract interface for caching generated TOC previews.
+
+    Previews are keyed by normalized ISBN-13 so a book that has been
+    previewed once does not need to go through TOC generation again until it
+    expires, whichever form of its ISBN is used.
+    """
+
+    @abstractmethod
+    async def get(self, isbn: str) -> dict | None:
+        """Get a cached preview.
+
+        Args:
+            isbn: The normalized ISBN-13
+
+        Returns:
+            The generated result ({"title", "toc"}) if cached, None otherwise
+
+        """
+
+    @abstractmethod
+    async def set(self, isbn: str, result: dict) -> None:
+        """Store a generated preview.
+
+        Args:
+            isbn: The normalized ISBN-13
+            result: The generated result ({"title", "toc"})
+
+        """
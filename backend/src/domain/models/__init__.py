@@ -1,7 +1,20 @@
 """Domain models."""
 
 from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.domain.models.import_job import ImportJob, ImportJobStatus
+from src.domain.models.index_job import IndexJob, IndexJobStatus
+from src.domain.models.library_summary import LibrarySummaryItem
 from src.domain.models.user import User
 from src.domain.models.user_library import UserLibraryEntry
 
-__all__ = ["BookMaster", "TableOfContentsItem", "User", "UserLibraryEntry"]
+__all__ = [
+    "BookMaster",
+    "ImportJob",
+    "ImportJobStatus",
+    "IndexJob",
+    "IndexJobStatus",
+    "LibrarySummaryItem",
+    "TableOfContentsItem",
+    "User",
+    "UserLibraryEntry",
+]
@@ -1,9 +1,13 @@
 """Book master domain model - represents the canonical book data."""
 
+import hashlib
+import json
 from datetime import UTC, datetime
 
 from pydantic import BaseModel, Field, field_validator
 
+from src.domain.text import normalize_text
+
 
 class TableOfContentsItem(BaseModel):
     """Represents a single item in the table of contents."""
@@ -43,6 +47,19 @@ class BookMaster(BaseModel):
         """
         return isbn.replace("-", "").replace(" ", "")
 
+    @staticmethod
+    def to_isbn13(isbn: str) -> str:
+        """Convert a normalized ISBN-10 to its ISBN-13 ("978" prefix).
+
+        ISBN-13s are returned unchanged, so both forms of a book map to
+        the same key.
+        """
+        if len(isbn) != 10:  # noqa: PLR2004
+            return isbn
+        body = "978" + isbn[:9]
+        total = sum(int(digit) * (3 if i % 2 else 1) for i, digit in enumerate(body))
+        return body + str(-total % 10)
+
     @field_validator("isbn")
     @classmethod
     def validate_isbn(cls, v: str) -> str:
@@ -98,3 +115,16 @@ class BookMaster(BaseModel):
     def get_chapter_count(self) -> int:
         """Get the number of chapters (level 1 items)."""
         return len([item for item in self.toc if item.level == 1])
+
+    def content_hash(self) -> str:
+        """Get a stable hash of the searchable content (title and TOC).
+
+        Titles are NFKC-normalized with whitespace collapsed, so cosmetic
+        differences do not count as a content change.
+        """
+        content = {
+            "title": normalize_text(self.title),
+            "toc": [[normalize_text(item.title), item.level] for item in self.toc],
+        }
+        payload = json.dumps(content, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(payload.encode()).hexdigest()
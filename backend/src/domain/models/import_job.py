@@ -0,0 +1,70 @@
+"""Import job domain model - a bulk registration of many books."""
+
+from datetime import UTC, datetime, timedelta
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class ImportJobStatus(StrEnum):
+    """Lifecycle state of an import job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class ImportJob(BaseModel):
+    """Represents a user's bulk import of books by ISBN.
+
+    This is stored in users/{user_id}/import_jobs/{job_id} in Firestore.
+    Progress counters are updated as books are written, so the client
+    can poll the job while it runs. A running job also saves a heartbeat
+    periodically; a job whose heartbeat stopped was interrupted (e.g. by
+    an instance restart) and is reported as failed.
+    """
+
+    job_id: str = Field(..., min_length=1)
+    user_id: str = Field(..., min_length=1)
+    isbns: list[str] = Field(default_factory=list)  # Normalized, deduplicated
+    status: ImportJobStatus = ImportJobStatus.PENDING
+    registered: int = 0  # New book masters created
+    linked: int = 0  # Books already in the master, only added to the library
+    # Malformed ISBNs, books without a TOC found, and failed writes
+    failed_isbns: list[str] = Field(default_factory=list)
+    error: str | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    heartbeat_at: datetime | None = None  # Last save while running
+
+    @property
+    def is_finished(self) -> bool:
+        """Whether the job completed or failed."""
+        return self.status in {ImportJobStatus.COMPLETED, ImportJobStatus.FAILED}
+
+    def is_stale(self, stale_after: timedelta, now: datetime | None = None) -> bool:
+        """Whether an unfinished job has not saved a heartbeat for too long."""
+        if self.is_finished:
+            return False
+        last_seen = self.heartbeat_at or self.created_at
+        return (now or datetime.now(UTC)) - last_seen > stale_after
+
+    @property
+    def total(self) -> int:
+        """Number of distinct ISBNs in the import."""
+        return len(self.isbns)
+
+    @property
+    def processed(self) -> int:
+        """Number of ISBNs handled so far (successfully or not)."""
+        return self.registered + self.linked + len(self.failed_isbns)
+
+    def books_per_minute(self, now: datetime | None = None) -> float:
+        """Throughput of the job so far, in processed books per minute."""
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at or now or datetime.now(UTC)
+        minutes = (end - self.started_at).total_seconds() / 60
+        return self.processed / minutes if minutes > 0 else 0.0
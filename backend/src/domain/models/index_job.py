@@ -0,0 +1,42 @@
+"""Index job domain model - a pending search index update (outbox entry)."""
+
+from datetime import UTC, datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+
+class IndexJobStatus(StrEnum):
+    """Lifecycle state of an index job."""
+
+    PENDING = "pending"  # Waiting for (or leased by) a worker
+    DEAD = "dead"  # Gave up after too many attempts
+
+
+class IndexJob(BaseModel):
+    """Represents a request to (re-)index a book for a user.
+
+    Written in the same batch as the registration that caused it, and
+    drained asynchronously by the index worker. Completed jobs are deleted.
+    """
+
+    isbn: str = Field(..., min_length=10)
+    user_id: str = Field(..., min_length=1)
+    status: IndexJobStatus = IndexJobStatus.PENDING
+    attempts: int = 0
+    # Not before this time: set by leasing and by retry backoff
+    available_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    lease_id: str | None = None
+    # Set when the registration changed an existing master, so the worker
+    # also refreshes the library summaries of the book's other owners
+    refresh_summaries: bool = False
+    # Set when the book is registered again while this job exists, so a
+    # worker holding the lease queues the job again instead of deleting it
+    dirty: bool = False
+    last_error: str | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def job_id(self) -> str:
+        """Deterministic ID, so a re-registration finds the existing job."""
+        return f"{self.isbn}-{self.user_id}"
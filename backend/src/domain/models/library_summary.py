@@ -0,0 +1,20 @@
+"""Library summary domain model - a compact listing of a user's books."""
+
+from datetime import datetime
+
+from pydantic import BaseModel, Field
+
+
+class LibrarySummaryItem(BaseModel):
+    """Represents one book in a user's denormalized library summary.
+
+    Summaries are stored in users/{user_id}/summary/{shard} in Firestore
+    and hold just enough to render the library list without reading the
+    library subcollection or any book master.
+    """
+
+    isbn: str = Field(..., min_length=10)
+    title: str = Field(..., min_length=1)
+    added_at: datetime
+    chapter_count: int = Field(default=0, ge=0)
+    updated_at: datetime | None = None  # Of the book master
@@ -1,6 +1,6 @@
 """Search Report domain models."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ChapterRef(BaseModel):
@@ -28,3 +28,25 @@ class SearchReport(BaseModel):
     recommendations: list[RecommendedBook] = Field(
         ..., description="List of recommended books"
     )
+
+
+class SearchReportCacheKey(BaseModel):
+    """Identifies a cached search report.
+
+    The search version makes entries unreachable once the library or its
+    search index changed, so no explicit invalidation is needed.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    user_id: str
+    query: str  # Normalized with normalize_query
+    limit: int
+    search_version: int
+
+
+class CachedSearchReport(BaseModel):
+    """Search results and the report generated from them."""
+
+    search_results: list[dict]
+    report: SearchReport
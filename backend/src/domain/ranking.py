@@ -0,0 +1,18 @@
+"""BM25 relevance scoring shared by search and chapter selection."""
+
+import math
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+
+def bm25_idf(doc_count: int, doc_freq: int) -> float:
+    """Get the inverse document frequency of a term (never negative)."""
+    return math.log(1 + (doc_count - doc_freq + 0.5) / (doc_freq + 0.5))
+
+
+def bm25_term_score(freq: int, length: float, avg_length: float, idf: float) -> float:
+    """Score one term occurring `freq` times in a document of `length` terms."""
+    norm = K1 * (1 - B + B * length / avg_length)
+    return idf * freq * (K1 + 1) / (freq + norm)
@@ -0,0 +1,41 @@
+"""Text normalization rules shared across the domain."""
+
+import re
+import unicodedata
+
+_WORD_RUN = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for comparison.
+
+    NFKC folds full-width alphanumerics to half-width and half-width
+    katakana to full-width (e.g. "ＰＹＴＨＯＮ" -> "PYTHON", "ｶﾀｶﾅ" -> "カタカナ");
+    whitespace runs, including the ideographic space, collapse to one space.
+    """  # noqa: RUF002 - the full-width example is intentional
+    return " ".join(unicodedata.normalize("NFKC", text).split())
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a search query so equivalent inputs compare equal.
+
+    Like normalize_text, and case-insensitive.
+    """
+    return normalize_text(query).casefold()
+
+
+def ngram_tokens(text: str, n: int = 2) -> list[str]:
+    """Split text into overlapping character n-grams for search.
+
+    Japanese has no word separators, so each run of word characters
+    (after normalize_query) is cut into n-grams, e.g. "機械学習" ->
+    ["機械", "械学", "学習"]; runs shorter than `n` are kept whole.
+    Whitespace and punctuation end a run, so no n-gram spans them.
+    """
+    tokens: list[str] = []
+    for run in _WORD_RUN.findall(normalize_query(text)):
+        if len(run) <= n:
+            tokens.append(run)
+        else:
+            tokens.extend(run[i : i + n] for i in range(len(run) - n + 1))
+    return tokens
@@ -0,0 +1,88 @@
+"""Index worker: drains the indexing outbox into Vertex AI Search.
+
+Usage:
+    uv run python -m src.index_worker [--once]
+
+Runs as a separate process (e.g. a Cloud Run job or worker service), so
+indexing survives API instance scale-down and failed jobs are retried.
+"""
+
+import argparse
+import asyncio
+import logging
+
+from firebase_admin import firestore_async
+
+from src.application.services.process_index_jobs_service import (
+    ProcessIndexJobsUseCase,
+)
+from src.config import get_settings
+from src.infrastructure.client_registry import ClientRegistry
+from src.infrastructure.firebase.setup import initialize_firebase
+from src.infrastructure.firestore.async_book_master_repository import (
+    AsyncFirestoreBookMasterRepository,
+)
+from src.infrastructure.firestore.async_user_library_repository import (
+    AsyncFirestoreUserLibraryRepository,
+)
+from src.infrastructure.firestore.index_job_queue import FirestoreIndexJobQueue
+from src.infrastructure.firestore.library_summary_repository import (
+    AsyncFirestoreLibrarySummaryRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run(*, once: bool) -> None:
+    """Process index jobs until the outbox is empty (once) or forever."""
+    settings = get_settings()
+    initialize_firebase()
+    db = firestore_async.client()
+    registry = ClientRegistry(settings)
+
+    use_case = ProcessIndexJobsUseCase(
+        FirestoreIndexJobQueue(db),
+        AsyncFirestoreBookMasterRepository(db),
+        registry.book_indexer(),
+        library_summary_repo=AsyncFirestoreLibrarySummaryRepository(
+            db, settings.library_summary_shards
+        ),
+        user_library_repo=AsyncFirestoreUserLibraryRepository(
+            db, settings.library_summary_shards
+        ),
+        lease_seconds=settings.index_job_lease_seconds,
+        max_attempts=settings.index_job_max_attempts,
+        base_backoff_seconds=settings.index_job_base_backoff_seconds,
+        max_backoff_seconds=settings.index_job_max_backoff_seconds,
+        max_concurrency=settings.index_worker_concurrency,
+    )
+
+    try:
+        while True:
+            processed = await use_case.execute(settings.index_worker_batch_size)
+            if processed:
+                logger.info("Processed %d index jobs", processed)
+                continue
+            if once:
+                return
+            await asyncio.sleep(settings.index_worker_poll_seconds)
+    finally:
+        await registry.aclose()
+
+
+def main() -> None:
+    """Run the index worker from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Exit as soon as no job is available",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run(once=args.once))
+
+
+if __name__ == "__main__":
+    main()
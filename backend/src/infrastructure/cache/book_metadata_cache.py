@@ -0,0 +1,45 @@
+"""In-memory implementation of BookMetadataCache."""
+
+from typing import Any
+
+from src.domain.interfaces.book_metadata_cache import BookMetadataCache
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class InMemoryBookMetadataCache(BookMetadataCache):
+    """Bounded in-process LRU of bibliographic metadata.
+
+    Positive results are kept for `positive_ttl_seconds`, "not found"
+    results for the (shorter) `negative_ttl_seconds`.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        positive_ttl_seconds: float,
+        negative_ttl_seconds: float,
+    ) -> None:
+        """Initialize the cache."""
+        self.positive_ttl_seconds = positive_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.entries = TTLCache[str, dict](
+            max_size=max_size, ttl_seconds=positive_ttl_seconds
+        )
+
+    async def get(self, isbn: str) -> dict | None:
+        """Get cached metadata."""
+        return self.entries.get(isbn)
+
+    async def set(
+        self, isbn: str, metadata: dict, ttl_seconds: float | None = None
+    ) -> None:
+        """Store metadata, by default with the negative TTL for "not found"."""
+        if ttl_seconds is None:
+            ttl_seconds = (
+                self.positive_ttl_seconds if metadata else self.negative_ttl_seconds
+            )
+        self.entries.set(isbn, metadata, ttl_seconds=ttl_seconds)
+
+    def stats(self) -> dict[str, Any]:
+        """Report size and hit/miss counters."""
+        return self.entries.stats()
@@ -0,0 +1,32 @@
+"""In-memory implementation of ReportCache."""
+
+from typing import Any
+
+from src.domain.interfaces.report_cache import ReportCache
+from src.domain.models.search_report import SearchReport
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class InMemoryReportCache(ReportCache):
+    """Bounded in-process LRU of generated reports."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """Initialize the cache."""
+        self.ttl_seconds = ttl_seconds
+        self.entries = TTLCache[str, SearchReport](
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+
+    async def get(self, key: str) -> SearchReport | None:
+        """Get a cached report."""
+        return self.entries.get(key)
+
+    async def set(
+        self, key: str, report: SearchReport, ttl_seconds: float | None = None
+    ) -> None:
+        """Store a report."""
+        self.entries.set(key, report, ttl_seconds=ttl_seconds)
+
+    def stats(self) -> dict[str, Any]:
+        """Report size and hit/miss counters."""
+        return self.entries.stats()
@@ -0,0 +1,33 @@
+"""In-memory implementation of SearchReportCache."""
+
+from typing import Any
+
+from src.domain.interfaces.search_report_cache import SearchReportCache
+from src.domain.models.search_report import CachedSearchReport, SearchReportCacheKey
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+
+class InMemorySearchReportCache(SearchReportCache):
+    """Bounded in-process LRU of search results and reports.
+
+    Entries of a library that changed since are never hit again (the key
+    holds the library version) and are evicted by LRU or TTL.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """Initialize the cache."""
+        self.entries = TTLCache[SearchReportCacheKey, CachedSearchReport](
+            max_size=max_size, ttl_seconds=ttl_seconds
+        )
+
+    async def get(self, key: SearchReportCacheKey) -> CachedSearchReport | None:
+        """Get a cached search report."""
+        return self.entries.get(key)
+
+    async def set(self, key: SearchReportCacheKey, value: CachedSearchReport) -> None:
+        """Store a search report."""
+        self.entries.set(key, value)
+
+    def stats(self) -> dict[str, Any]:
+        """Report size and hit/miss counters."""
+        return self.entries.stats()
@@ -0,0 +1,63 @@
+"""Single-flight coalescing of concurrent async calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class _Flight:
+    """An in-flight call shared by one or more waiters."""
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight[V]:
+    """Runs at most one call per key at a time and shares its outcome.
+
+    Callers arriving while a call for the same key is in flight await that
+    call instead of starting their own, and receive the same result or
+    exception. Cancelling one waiter does not cancel the shared call; it is
+    only cancelled once every waiter has gone away.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._flights: dict[Hashable, _Flight] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[V]]) -> V:
+        """Run `call` for `key`, or join the call already in flight."""
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.executions += 1
+        else:
+            self.coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Every caller was cancelled; nobody needs the result anymore
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def _forget(self, key: Hashable, flight: _Flight) -> None:
+        """Drop `flight` so the next caller for `key` starts a fresh call."""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> dict[str, Any]:
+        """Report how many calls ran and how many callers were coalesced."""
+        return {
+            "in_flight": len(self._flights),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
@@ -0,0 +1,82 @@
+"""Bounded in-process LRU cache with per-entry expiry."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class TTLCache[K, V]:
+    """Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    The least recently used entry is evicted once `max_size` is reached.
+    Hit and miss counters are kept for observability.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept in memory.
+            ttl_seconds: Default lifetime of an entry.
+
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for `key`, or None if absent or expired."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        """Store `value` under `key`, optionally overriding the default TTL."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """Remove `key` from the cache if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries (including not yet purged ones)."""
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Report size and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
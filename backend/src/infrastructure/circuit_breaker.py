@@ -0,0 +1,65 @@
+"""Simple circuit breaker for outbound calls."""
+
+import time
+
+
+class CircuitBreaker:
+    """Stops calling a failing dependency for a cool-down period.
+
+    The circuit opens after `failure_threshold` consecutive failures. Once
+    `reset_timeout_seconds` have passed, a single trial call is let through
+    (half-open); its outcome closes the circuit again or re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_seconds: float = 30.0,
+    ) -> None:
+        """Initialize a closed circuit."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.state = self.CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be attempted now."""
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at >= self.reset_timeout_seconds:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+        # Half-open: a trial call is already in flight
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call and close the circuit."""
+        self._consecutive_failures = 0
+        self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if the threshold is hit."""
+        self._consecutive_failures += 1
+        if (
+            self.state == self.HALF_OPEN
+            or self._consecutive_failures >= self.failure_threshold
+        ):
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def record_abandoned(self) -> None:
+        """Record a call that ended without an outcome (e.g. it was cancelled).
+
+        A half-open circuit goes back to open so the next call can be the trial.
+        """
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
@@ -0,0 +1,274 @@
+"""Process-wide registry of long-lived infrastructure clients."""
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import Any
+
+from firebase_admin import firestore_async
+
+from src.config import Settings
+from src.domain.interfaces.book_indexer import BookIndexer
+from src.domain.interfaces.book_metadata_cache import BookMetadataCache
+from src.domain.interfaces.report_cache import ReportCache
+from src.domain.interfaces.search_engine import AsyncSearchEngine
+from src.infrastructure.cache.book_metadata_cache import InMemoryBookMetadataCache
+from src.infrastructure.cache.report_cache import InMemoryReportCache
+from src.infrastructure.cache.search_report_cache import InMemorySearchReportCache
+from src.infrastructure.firebase.auth_service import FirebaseAuthService
+from src.infrastructure.firestore.book_metadata_cache import (
+    FirestoreBookMetadataCache,
+)
+from src.infrastructure.firestore.report_cache import FirestoreReportCache
+from src.infrastructure.firestore.toc_preview_cache import FirestoreTOCPreviewCache
+from src.infrastructure.gemini.caching_report_generator import (
+    CachingReportGenerator,
+)
+from src.infrastructure.gemini.coalescing_toc_generator import (
+    CoalescingTOCGenerator,
+)
+from src.infrastructure.gemini.report_generator import GeminiReportGenerator
+from src.infrastructure.gemini.toc_generator import GeminiTOCGenerator
+from src.infrastructure.search.hedged_search_engine import HedgedSearchEngine
+from src.infrastructure.search.local_toc_search_engine import LocalTOCSearchEngine
+from src.infrastructure.vertex.book_indexer import VertexAIBookIndexer
+from src.infrastructure.vertex.search_engine import AsyncVertexAISearchEngine
+from src.infrastructure.vertex.shared_book_indexer import SharedVertexAIBookIndexer
+
+logger = logging.getLogger(__name__)
+
+
+class ClientRegistry:
+    """Builds Vertex AI and Gemini clients once per worker and shares them.
+
+    Each client owns its own gRPC channel (or HTTP connection pool) and pays
+    an auth handshake on creation, so they are created lazily on first use,
+    reused by every request afterwards and closed on application shutdown.
+    Process-wide caches and coalescing layers are held here too so every
+    request sees the same instance.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        """Initialize an empty registry."""
+        self.settings = settings
+        self._instances: dict[str, Any] = {}
+        self._caches: dict[str, Any] = {}
+        self._reuse_counts: dict[str, int] = {}
+        # Sync dependencies run on the threadpool, so creation must be guarded.
+        # Re-entrant because some factories pull in other shared components.
+        self._lock = threading.RLock()
+
+    def _get_or_create(self, name: str, factory: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """Return the shared client for `name`, creating it on first use."""
+        with self._lock:
+            instance = self._instances.get(name)
+            if instance is None:
+                logger.info("Creating shared client: %s", name)
+                instance = factory()
+                self._instances[name] = instance
+                self._reuse_counts[name] = 0
+            else:
+                self._reuse_counts[name] += 1
+            return instance
+
+    def _get_or_create_cache(self, name: str, factory: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """Return the shared cache or coalescer for `name`, creating it on first use."""
+        with self._lock:
+            cache = self._caches.get(name)
+            if cache is None:
+                cache = factory()
+                self._caches[name] = cache
+            return cache
+
+    def book_indexer(self) -> BookIndexer:
+        """Get the shared Vertex AI book indexer for the configured index mode."""
+        indexer_class = (
+            SharedVertexAIBookIndexer
+            if self.settings.vertex_index_mode == "shared"
+            else VertexAIBookIndexer
+        )
+        return self._get_or_create(
+            "book_indexer",
+            lambda: indexer_class(
+                self.settings.google_cloud_project,
+                self.settings.vertex_ai_data_store_id,
+                self.settings.vertex_ai_location,
+            ),
+        )
+
+    def search_engine(self) -> AsyncSearchEngine:
+        """Get the shared search engine for the configured backend.
+
+        Must first be called from the event loop thread, which the Vertex AI
+        client's gRPC channel is bound to.
+        """
+        local_engine = self.local_search_engine()
+        if local_engine is None:
+            return self._vertex_search_engine()
+        if self.settings.search_backend == "local":
+            return local_engine
+        return self._get_or_create_cache(
+            "hedged_search_engine",
+            lambda: HedgedSearchEngine(
+                self._vertex_search_engine(),
+                local_engine,
+                hedge_delay_seconds=self.settings.search_hedge_delay_seconds,
+            ),
+        )
+
+    def local_search_engine(self) -> LocalTOCSearchEngine | None:
+        """Get the in-process search index, or None if the backend does not use it."""
+        if self.settings.search_backend == "vertex":
+            return None
+        return self._get_or_create_cache("local_search_engine", LocalTOCSearchEngine)
+
+    def _vertex_search_engine(self) -> AsyncVertexAISearchEngine:
+        """Get the shared async Vertex AI search engine."""
+        return self._get_or_create(
+            "search_engine",
+            lambda: AsyncVertexAISearchEngine(
+                self.settings.google_cloud_project,
+                self.settings.vertex_ai_data_store_id,
+                self.settings.vertex_ai_location,
+                user_filter_field=(
+                    "user_ids"
+                    if self.settings.vertex_index_mode == "shared"
+                    else "user_id"
+                ),
+                timeout_seconds=self.settings.vertex_search_timeout_seconds,
+            ),
+        )
+
+    def toc_generator(self) -> CoalescingTOCGenerator:
+        """Get the shared Gemini TOC generator, coalesced per ISBN."""
+        generator = self._get_or_create(
+            "toc_generator",
+            lambda: GeminiTOCGenerator(
+                project_id=self.settings.google_cloud_project,
+                location=self.settings.gemini_location,
+                model=self.settings.gemini_toc_model,
+                max_concurrency=self.settings.gemini_toc_max_concurrency,
+                timeout_seconds=self.settings.gemini_toc_timeout_seconds,
+                ndl_timeout_seconds=self.settings.ndl_timeout_seconds,
+                google_books_timeout_seconds=(
+                    self.settings.google_books_timeout_seconds
+                ),
+                metadata_cache=self.book_metadata_cache(),
+                metadata_fallback_ttl_seconds=(
+                    self.settings.book_metadata_fallback_ttl_seconds
+                ),
+            ),
+        )
+        return self._get_or_create_cache(
+            "toc_generator_coalescing",
+            lambda: CoalescingTOCGenerator(generator),
+        )
+
+    def report_generator(self) -> CachingReportGenerator:
+        """Get the shared Gemini report generator, cached across users."""
+        generator = self._get_or_create(
+            "report_generator",
+            lambda: GeminiReportGenerator(
+                self.settings.google_cloud_project,
+                self.settings.gemini_location,
+                self.settings.gemini_report_model,
+                max_concurrency=self.settings.gemini_report_max_concurrency,
+                timeout_seconds=self.settings.gemini_report_timeout_seconds,
+            ),
+        )
+        return self._get_or_create_cache(
+            "report_generator_caching",
+            lambda: CachingReportGenerator(generator, self._build_report_cache()),
+        )
+
+    def auth_service(self) -> FirebaseAuthService:
+        """Get the shared Firebase auth service and its verified-token cache."""
+        return self._get_or_create_cache(
+            "auth_service",
+            lambda: FirebaseAuthService(
+                cache_max_size=self.settings.auth_token_cache_max_size,
+                cache_expiry_skew_seconds=self.settings.auth_token_cache_skew_seconds,
+            ),
+        )
+
+    def toc_preview_cache(self) -> FirestoreTOCPreviewCache:
+        """Get the shared TOC preview cache."""
+        return self._get_or_create_cache(
+            "toc_preview_cache",
+            lambda: FirestoreTOCPreviewCache(
+                firestore_async.client(),
+                ttl_seconds=self.settings.toc_preview_cache_ttl_seconds,
+                max_size=self.settings.toc_preview_cache_max_size,
+            ),
+        )
+
+    def search_report_cache(self) -> InMemorySearchReportCache:
+        """Get the shared search report cache."""
+        return self._get_or_create_cache(
+            "search_report_cache",
+            lambda: InMemorySearchReportCache(
+                max_size=self.settings.search_report_cache_max_size,
+                ttl_seconds=self.settings.search_report_cache_ttl_seconds,
+            ),
+        )
+
+    def book_metadata_cache(self) -> BookMetadataCache:
+        """Get the shared bibliographic metadata cache."""
+        return self._get_or_create_cache(
+            "book_metadata_cache", self._build_book_metadata_cache
+        )
+
+    def _build_book_metadata_cache(self) -> BookMetadataCache:
+        """Build the metadata cache for the configured backend."""
+        memory = InMemoryBookMetadataCache(
+            max_size=self.settings.book_metadata_cache_max_size,
+            positive_ttl_seconds=self.settings.book_metadata_positive_ttl_seconds,
+            negative_ttl_seconds=self.settings.book_metadata_negative_ttl_seconds,
+        )
+        if self.settings.book_metadata_cache_backend == "firestore":
+            return FirestoreBookMetadataCache(firestore_async.client(), memory)
+        return memory
+
+    def _build_report_cache(self) -> ReportCache:
+        """Build the report cache for the configured backend."""
+        memory = InMemoryReportCache(
+            max_size=self.settings.report_cache_max_size,
+            ttl_seconds=self.settings.report_cache_ttl_seconds,
+        )
+        if self.settings.report_cache_backend == "firestore":
+            return FirestoreReportCache(firestore_async.client(), memory)
+        return memory
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Report counters of every shared cache and coalescing layer."""
+        with self._lock:
+            caches = list(self._caches.items())
+        return {name: cache.stats() for name, cache in caches}
+
+    def stats(self) -> dict[str, Any]:
+        """Report open channels, clients and how often each client was reused.
+
+        Every registry client owns exactly one Vertex AI or Gemini channel
+        (a gRPC channel, or a Gemini client's HTTP connection pool) from
+        creation until aclose(), so `open_channels` equals `clients`.
+        """
+        with self._lock:
+            return {
+                "open_channels": len(self._instances),
+                "clients": len(self._instances),
+                "reuse_counts": dict(self._reuse_counts),
+            }
+
+    async def aclose(self) -> None:
+        """Close every client created by this registry."""
+        with self._lock:
+            instances = list(self._instances.items())
+            self._instances.clear()
+            self._caches.clear()
+            self._reuse_counts.clear()
+
+        for name, instance in instances:
+            try:
+                await instance.aclose()
+            except Exception:
+                logger.exception("Failed to close shared client: %s", name)
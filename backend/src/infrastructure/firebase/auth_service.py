@@ -1,10 +1,15 @@
 """Firebase implementation of authentication service."""
 
+import hashlib
+import time
+from typing import Any
+
 from firebase_admin import auth
 
 from src.domain.exceptions import AuthenticationError
 from src.domain.interfaces.auth_service import AuthService
 from src.domain.models.user import User
+from src.infrastructure.cache.ttl_cache import TTLCache
 
 
 class FirebaseAuthService(AuthService):
@@ -12,8 +17,32 @@ class FirebaseAuthService(AuthService):
 
     This service uses Firebase Admin SDK to verify ID tokens
     and authenticate users.
+
+    Verified tokens are kept in a bounded LRU keyed by the token's SHA-256
+    hash until shortly before their own `exp` claim, so clients reusing a
+    token skip the signature check. Failed verifications (including
+    certificate fetch errors) never touch cached entries.
     """
 
+    def __init__(
+        self,
+        cache_max_size: int = 10_000,
+        cache_expiry_skew_seconds: float = 60.0,
+    ) -> None:
+        """Initialize the service and its verified-token cache.
+
+        Args:
+            cache_max_size: Maximum number of verified tokens kept in memory.
+            cache_expiry_skew_seconds: How long before `exp` a cached token
+                stops being trusted.
+
+        """
+        self.cache_expiry_skew_seconds = cache_expiry_skew_seconds
+        self.token_cache = TTLCache[str, User](
+            max_size=cache_max_size,
+            ttl_seconds=0,  # Every entry gets its own TTL from `exp`
+        )
+
     def verify_token(self, token: str) -> User:
         """Verify a Firebase ID token and return the authenticated user.
 
@@ -28,6 +57,11 @@ class FirebaseAuthService(AuthService):
                 or verification fails.
 
         """
+        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        cached_user = self.token_cache.get(token_hash)
+        if cached_user is not None:
+            return cached_user
+
         try:
             decoded_token = auth.verify_id_token(token)
         except auth.InvalidIdTokenError as e:
@@ -53,4 +87,16 @@ class FirebaseAuthService(AuthService):
             raise AuthenticationError(msg)
 
         email = decoded_token.get("email")
-        return User(uid=uid, email=email)
+        user = User(uid=uid, email=email)
+
+        ttl_seconds = (
+            decoded_token["exp"] - self.cache_expiry_skew_seconds - time.time()
+        )
+        if ttl_seconds > 0:
+            self.token_cache.set(token_hash, user, ttl_seconds=ttl_seconds)
+
+        return user
+
+    def stats(self) -> dict[str, Any]:
+        """Report verified-token cache counters."""
+        return self.token_cache.stats()
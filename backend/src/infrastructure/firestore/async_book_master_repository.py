@@ -0,0 +1,86 @@
+"""Firestore AsyncClient implementation of AsyncBookMasterRepository."""
+
+import asyncio
+
+from google.cloud import firestore
+
+from src.domain.interfaces.book_repository import AsyncBookMasterRepository
+from src.domain.models.book_master import BookMaster
+from src.infrastructure.firestore.book_master_repository import (
+    book_master_from_document,
+)
+
+
+class AsyncFirestoreBookMasterRepository(AsyncBookMasterRepository):
+    """Book master repository implementation using the async Firestore client.
+
+    Stores canonical book data in the 'books' collection.
+    Uses ISBN as the document ID to prevent duplicates.
+    """
+
+    # Documents per get_all() call; chunks are fetched concurrently
+    BATCH_GET_CHUNK_SIZE = 100
+
+    def __init__(self, client: firestore.AsyncClient) -> None:
+        """Initialize async Firestore book master repository."""
+        self.client = client
+        self.collection = self.client.collection("books")
+
+    async def save(self, book: BookMaster) -> BookMaster:
+        """Save a book master record using ISBN as document ID."""
+        normalized_isbn = BookMaster.normalize_isbn(book.isbn)
+        await self.collection.document(normalized_isbn).set(book.model_dump())
+        return book
+
+    async def find_by_isbn(self, isbn: str) -> BookMaster | None:
+        """Find a book by ISBN."""
+        normalized_isbn = BookMaster.normalize_isbn(isbn)
+        doc = await self.collection.document(normalized_isbn).get()
+
+        if not doc.exists:
+            return None
+
+        return book_master_from_document(doc.to_dict())
+
+    async def find_many_by_isbn(
+        self, isbns: list[str], fields: list[str] | None = None
+    ) -> list[BookMaster | None]:
+        """Find multiple books by ISBN using concurrent, chunked get_all() calls.
+
+        Results are returned in the same order as the input ISBNs. With a
+        projection, Firestore only sends the requested fields (e.g. no TOC).
+        """
+        normalized_isbns = [BookMaster.normalize_isbn(isbn) for isbn in isbns]
+        unique_isbns = list(dict.fromkeys(normalized_isbns))
+        if not unique_isbns:
+            return []
+
+        chunk_results = await asyncio.gather(
+            *(
+                self._get_chunk(unique_isbns[i : i + self.BATCH_GET_CHUNK_SIZE], fields)
+                for i in range(0, len(unique_isbns), self.BATCH_GET_CHUNK_SIZE)
+            )
+        )
+
+        found: dict[str, BookMaster] = {}
+        for chunk_result in chunk_results:
+            found.update(chunk_result)
+
+        return [found.get(isbn) for isbn in normalized_isbns]
+
+    async def _get_chunk(
+        self, isbns: list[str], fields: list[str] | None
+    ) -> dict[str, BookMaster]:
+        """Fetch one chunk of book documents in a single batched RPC."""
+        refs = [self.collection.document(isbn) for isbn in isbns]
+        return {
+            doc.id: book_master_from_document(doc.to_dict())
+            async for doc in self.client.get_all(refs, field_paths=fields)
+            if doc.exists
+        }
+
+    async def exists(self, isbn: str) -> bool:
+        """Check if a book exists in the master collection."""
+        normalized_isbn = BookMaster.normalize_isbn(isbn)
+        doc = await self.collection.document(normalized_isbn).get()
+        return doc.exists
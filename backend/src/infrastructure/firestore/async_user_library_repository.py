@@ -0,0 +1,172 @@
+"""Firestore AsyncClient implementation of AsyncUserLibraryRepository."""
+
+from collections.abc import AsyncIterator
+
+from google.cloud import firestore
+
+from src.domain.interfaces.book_repository import AsyncUserLibraryRepository
+from src.domain.models.book_master import BookMaster
+from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.firestore.library_summary import (
+    INDEX_VERSION_FIELD,
+    LIBRARY_VERSION_FIELD,
+    library_change_writes,
+    summary_fields,
+    summary_shard_ref,
+)
+
+
+class AsyncFirestoreUserLibraryRepository(AsyncUserLibraryRepository):
+    """User library repository implementation using the async Firestore client.
+
+    Stores user-specific book ownership in subcollections:
+    users/{user_id}/library/{isbn}
+    """
+
+    # Entries read per query when listing a whole library
+    PAGE_SIZE = 500
+
+    def __init__(self, client: firestore.AsyncClient, summary_shards: int = 1) -> None:
+        """Initialize async Firestore user library repository."""
+        self.client = client
+        self.summary_shards = summary_shards
+
+    def _get_library_ref(self, user_id: str) -> firestore.AsyncCollectionReference:
+        """Get the library collection reference for a user."""
+        return self.client.collection("users").document(user_id).collection("library")
+
+    async def add_book(
+        self, entry: UserLibraryEntry, book: BookMaster | None = None
+    ) -> UserLibraryEntry:
+        """Add a book to user's library, updating the summary in the same batch."""
+        normalized_isbn = BookMaster.normalize_isbn(entry.isbn)
+        batch = self.client.batch()
+        batch.set(
+            self._get_library_ref(entry.user_id).document(normalized_isbn),
+            entry.model_dump(),
+        )
+        changes = {}
+        if book is not None:
+            changes[normalized_isbn] = summary_fields(book, entry.added_at)
+        else:
+            ref = summary_shard_ref(
+                self.client, entry.user_id, normalized_isbn, self.summary_shards
+            )
+            batch.set(ref, {"complete": False}, merge=True)
+        for ref, data in library_change_writes(
+            self.client, entry.user_id, changes, self.summary_shards
+        ):
+            batch.set(ref, data, merge=True)
+        await batch.commit()
+        return entry
+
+    async def remove_book(self, user_id: str, isbn: str) -> None:
+        """Remove a book from user's library and from the summary."""
+        normalized_isbn = BookMaster.normalize_isbn(isbn)
+        batch = self.client.batch()
+        batch.delete(self._get_library_ref(user_id).document(normalized_isbn))
+        for ref, data in library_change_writes(
+            self.client,
+            user_id,
+            {normalized_isbn: firestore.DELETE_FIELD},
+            self.summary_shards,
+        ):
+            batch.set(ref, data, merge=True)
+        await batch.commit()
+
+    async def iter_pages_by_user(
+        self, user_id: str
+    ) -> AsyncIterator[list[UserLibraryEntry]]:
+        """Iterate over all library entries of a user, one query per page."""
+        start_after: UserLibraryEntry | None = None
+        while True:
+            page = await self.find_page_by_user(user_id, self.PAGE_SIZE, start_after)
+            if page:
+                yield page
+            if len(page) < self.PAGE_SIZE:
+                return
+            start_after = page[-1]
+
+    async def find_page_by_user(
+        self,
+        user_id: str,
+        limit: int,
+        start_after: UserLibraryEntry | None = None,
+    ) -> list[UserLibraryEntry]:
+        """Find one page of library entries, newest first.
+
+        Requires a composite index on (added_at DESC, isbn DESC).
+        """
+        query = (
+            self._get_library_ref(user_id)
+            .order_by("added_at", direction=firestore.Query.DESCENDING)
+            .order_by("isbn", direction=firestore.Query.DESCENDING)
+        )
+        if start_after is not None:
+            query = query.start_after(
+                {"added_at": start_after.added_at, "isbn": start_after.isbn}
+            )
+        return [
+            UserLibraryEntry(**doc.to_dict())
+            async for doc in query.limit(limit).stream()
+        ]
+
+    async def find_entry(self, user_id: str, isbn: str) -> UserLibraryEntry | None:
+        """Find a specific library entry."""
+        normalized_isbn = BookMaster.normalize_isbn(isbn)
+        doc = await self._get_library_ref(user_id).document(normalized_isbn).get()
+
+        if not doc.exists:
+            return None
+
+        return UserLibraryEntry(**doc.to_dict())
+
+    async def update_entry(self, entry: UserLibraryEntry) -> UserLibraryEntry:
+        """Update a library entry (and its summary entry)."""
+        normalized_isbn = BookMaster.normalize_isbn(entry.isbn)
+        batch = self.client.batch()
+        batch.update(
+            self._get_library_ref(entry.user_id).document(normalized_isbn),
+            entry.model_dump(),
+        )
+        for ref, data in library_change_writes(
+            self.client,
+            entry.user_id,
+            {normalized_isbn: {"added_at": entry.added_at}},
+            self.summary_shards,
+        ):
+            batch.set(ref, data, merge=True)
+        await batch.commit()
+        return entry
+
+    async def get_version(self, user_id: str) -> int:
+        """Get the library version of a user (0 if never changed)."""
+        doc = await (
+            self.client.collection("users")
+            .document(user_id)
+            .get(field_paths=[LIBRARY_VERSION_FIELD])
+        )
+        if not doc.exists:
+            return 0
+        return (doc.to_dict() or {}).get(LIBRARY_VERSION_FIELD, 0)
+
+    async def get_search_version(self, user_id: str) -> int:
+        """Get the sum of the library and index versions of a user.
+
+        Both only grow, so the sum changes whenever either does.
+        """
+        doc = await (
+            self.client.collection("users")
+            .document(user_id)
+            .get(field_paths=[LIBRARY_VERSION_FIELD, INDEX_VERSION_FIELD])
+        )
+        data = (doc.to_dict() or {}) if doc.exists else {}
+        return data.get(LIBRARY_VERSION_FIELD, 0) + data.get(INDEX_VERSION_FIELD, 0)
+
+    async def bump_index_version(self, user_id: str) -> None:
+        """Bump the index version of a user."""
+        await (
+            self.client.collection("users")
+            .document(user_id)
+            .set({INDEX_VERSION_FIELD: firestore.Increment(1)}, merge=True)
+        )
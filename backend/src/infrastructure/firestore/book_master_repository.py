@@ -1,11 +1,22 @@
 """Firestore implementation of BookMasterRepository."""
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
 from google.cloud import firestore
 
 from src.domain.interfaces.book_repository import BookMasterRepository
 from src.domain.models.book_master import BookMaster, TableOfContentsItem
 
 
+def book_master_from_document(data: dict) -> BookMaster:
+    """Convert a Firestore 'books' document dict into a BookMaster."""
+    # Explicitly convert TOC dicts to TableOfContentsItem objects
+    if data.get("toc"):
+        data["toc"] = [TableOfContentsItem(**item) for item in data["toc"]]
+    return BookMaster(**data)
+
+
 class FirestoreBookMasterRepository(BookMasterRepository):
     """Book master repository implementation using Firestore.
 
@@ -13,6 +24,10 @@ class FirestoreBookMasterRepository(BookMasterRepository):
     Uses ISBN as the document ID to prevent duplicates.
     """
 
+    # Documents per get_all() call and max chunks fetched in parallel
+    BATCH_GET_CHUNK_SIZE = 100
+    BATCH_GET_MAX_WORKERS = 8
+
     def __init__(self, client: firestore.Client) -> None:
         """Initialize Firestore book master repository."""
         self.client = client
@@ -42,55 +57,74 @@ class FirestoreBookMasterRepository(BookMasterRepository):
         if not doc.exists:
             return None
 
-        data = doc.to_dict()
-        # Explicitly convert TOC dicts to TableOfContentsItem objects
-        if data.get("toc"):
-            data["toc"] = [TableOfContentsItem(**item) for item in data["toc"]]
-        return BookMaster(**data)
+        return book_master_from_document(doc.to_dict())
 
-    def exists(self, isbn: str) -> bool:
-        """Check if a book exists in the master collection."""
-        normalized_isbn = BookMaster.normalize_isbn(isbn)
-        doc = self.collection.document(normalized_isbn).get()
-        return doc.exists
+    def find_many_by_isbn(self, isbns: list[str]) -> list[BookMaster | None]:
+        """Find multiple books by ISBN using chunked, concurrent get_all() calls.
 
-    def save_if_not_exists(
-        self,
-        transaction: firestore.Transaction,
-        book: BookMaster,
-    ) -> tuple[BookMaster, bool]:
-        """Save a book only if it doesn't exist (transactional).
-
-        This is used to prevent race conditions when multiple users
-        try to register the same book simultaneously.
+        Results are returned in the same order as the input ISBNs.
+        """
+        normalized_isbns = [BookMaster.normalize_isbn(isbn) for isbn in isbns]
+        unique_isbns = list(dict.fromkeys(normalized_isbns))
+        if not unique_isbns:
+            return []
+
+        chunks = [
+            unique_isbns[i : i + self.BATCH_GET_CHUNK_SIZE]
+            for i in range(0, len(unique_isbns), self.BATCH_GET_CHUNK_SIZE)
+        ]
+
+        found: dict[str, BookMaster] = {}
+        if len(chunks) == 1:
+            found.update(self._get_chunk(chunks[0]))
+        else:
+            max_workers = min(len(chunks), self.BATCH_GET_MAX_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for chunk_result in executor.map(self._get_chunk, chunks):
+                    found.update(chunk_result)
+
+        return [found.get(isbn) for isbn in normalized_isbns]
+
+    def _get_chunk(self, isbns: list[str]) -> dict[str, BookMaster]:
+        """Fetch one chunk of book documents in a single batched RPC."""
+        refs = [self.collection.document(isbn) for isbn in isbns]
+        return {
+            doc.id: book_master_from_document(doc.to_dict())
+            for doc in self.client.get_all(refs)
+            if doc.exists
+        }
+
+    def iter_pages(
+        self, page_size: int, start_after_isbn: str | None = None
+    ) -> Iterator[list[BookMaster]]:
+        """Stream all book masters in ISBN order, one page at a time.
 
         Args:
-            transaction: Firestore transaction
-            book: The book to save
-
-        Returns:
-            Tuple of (book_data, was_created)
-            - book_data: The book master (either newly created or existing)
-            - was_created: True if the book was created, False if it already existed
+            page_size: Number of books per page
+            start_after_isbn: Resume after this ISBN (exclusive)
 
         """
-        normalized_isbn = BookMaster.normalize_isbn(book.isbn)
-        ref = self.collection.document(normalized_isbn)
+        query = self.collection.order_by(firestore.FieldPath.document_id()).limit(
+            page_size
+        )
+        cursor = None
+        if start_after_isbn:
+            cursor = self.collection.document(start_after_isbn).get()
+            if not cursor.exists:
+                msg = f"Cannot resume after unknown ISBN {start_after_isbn}"
+                raise ValueError(msg)
+
+        while True:
+            page_query = query.start_after(cursor) if cursor else query
+            snapshots = list(page_query.stream())
+            if not snapshots:
+                return
+
+            yield [book_master_from_document(doc.to_dict()) for doc in snapshots]
+            cursor = snapshots[-1]
 
-        # Check if book exists within transaction
-        snapshot = ref.get(transaction=transaction)
-
-        if snapshot.exists:
-            # Book already exists, return existing data
-            existing_data = snapshot.to_dict()
-            # Explicitly convert TOC dicts to TableOfContentsItem objects
-            if existing_data.get("toc"):
-                existing_data["toc"] = [
-                    TableOfContentsItem(**item) for item in existing_data["toc"]
-                ]
-            return BookMaster(**existing_data), False
-
-        # Book doesn't exist, create it
-        book_dict = book.model_dump()
-        transaction.set(ref, book_dict)
-        return book, True
+    def exists(self, isbn: str) -> bool:
+        """Check if a book exists in the master collection."""
+        normalized_isbn = BookMaster.normalize_isbn(isbn)
+        doc = self.collection.document(normalized_isbn).get()
+        return doc.exists
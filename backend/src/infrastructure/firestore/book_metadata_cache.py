@@ -0,0 +1,89 @@
+"""Firestore implementation of BookMetadataCache."""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from google.cloud import firestore
+
+from src.domain.interfaces.book_metadata_cache import BookMetadataCache
+from src.infrastructure.cache.book_metadata_cache import InMemoryBookMetadataCache
+
+logger = logging.getLogger(__name__)
+
+
+class FirestoreBookMetadataCache(BookMetadataCache):
+    """Bibliographic metadata cache stored in the 'book_metadata' collection.
+
+    Shares lookups across workers and instances. Reads go through an
+    in-process LRU first. Documents carry an `expires_at` field, which can
+    also back a Firestore TTL policy for cleanup.
+    """
+
+    def __init__(
+        self,
+        client: firestore.AsyncClient,
+        memory: InMemoryBookMetadataCache,
+    ) -> None:
+        """Initialize the cache with an in-memory front tier."""
+        self.collection = client.collection("book_metadata")
+        self.memory = memory
+        self.firestore_hits = 0
+        self.misses = 0
+
+    async def get(self, isbn: str) -> dict | None:
+        """Get cached metadata from memory, then Firestore."""
+        cached = await self.memory.get(isbn)
+        if cached is not None:
+            return cached
+
+        try:
+            doc = await self.collection.document(isbn).get()
+        except Exception:
+            logger.exception("Failed to read metadata cache for %s", isbn)
+            self.misses += 1
+            return None
+
+        data = doc.to_dict() if doc.exists else None
+        now = datetime.now(UTC)
+        if not data or data["expires_at"] <= now:
+            self.misses += 1
+            return None
+
+        metadata = data["metadata"]
+        remaining = (data["expires_at"] - now).total_seconds()
+        await self.memory.set(isbn, metadata, ttl_seconds=remaining)
+        self.firestore_hits += 1
+        return metadata
+
+    async def set(
+        self, isbn: str, metadata: dict, ttl_seconds: float | None = None
+    ) -> None:
+        """Store metadata in memory and Firestore."""
+        await self.memory.set(isbn, metadata, ttl_seconds=ttl_seconds)
+        if ttl_seconds is None:
+            ttl_seconds = (
+                self.memory.positive_ttl_seconds
+                if metadata
+                else self.memory.negative_ttl_seconds
+            )
+        now = datetime.now(UTC)
+        try:
+            await self.collection.document(isbn).set(
+                {
+                    "metadata": metadata,
+                    "found": bool(metadata),
+                    "cached_at": now,
+                    "expires_at": now + timedelta(seconds=ttl_seconds),
+                }
+            )
+        except Exception:
+            logger.exception("Failed to write metadata cache for %s", isbn)
+
+    def stats(self) -> dict[str, Any]:
+        """Report memory and Firestore hit/miss counters."""
+        return {
+            "memory": self.memory.stats(),
+            "firestore_hits": self.firestore_hits,
+            "misses": self.misses,
+        }
@@ -0,0 +1,155 @@
+"""Firestore implementation of BookRegistrationRepository."""
+
+import logging
+
+from google.api_core.exceptions import AlreadyExists
+from google.cloud import firestore
+
+from src.domain.interfaces.book_registration_repository import (
+    BookRegistrationRepository,
+)
+from src.domain.models.book_master import BookMaster
+from src.domain.models.index_job import IndexJob
+from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.firestore.book_master_repository import (
+    book_master_from_document,
+)
+from src.infrastructure.firestore.index_job_queue import (
+    index_job_ref,
+    requeue_fields,
+)
+from src.infrastructure.firestore.library_summary import (
+    library_change_writes,
+    summary_fields,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@firestore.async_transactional
+async def _correct_existing(
+    transaction: firestore.AsyncTransaction,
+    repository: "AsyncFirestoreBookRegistrationRepository",
+    book: BookMaster,
+    entry: UserLibraryEntry,
+    index_job: IndexJob,
+) -> tuple[BookMaster, UserLibraryEntry]:
+    """Apply a TOC correction to a book master plus the registration writes.
+
+    An unchanged master is not rewritten, so its updated_at (and the ETags
+    derived from it) stay stable across re-registrations. The master, the
+    library entry and the index job are read in one round trip: an
+    existing entry keeps its added_at, and an existing job is only marked
+    dirty, keeping a worker's lease on it (see requeue_fields).
+    """
+    book_ref = repository.books.document(BookMaster.normalize_isbn(book.isbn))
+    library_ref = repository.library_ref(entry)
+    job_ref = index_job_ref(repository.client, index_job)
+    snapshots = {
+        snapshot.reference.path: snapshot
+        async for snapshot in repository.client.get_all(
+            [book_ref, library_ref, job_ref], transaction=transaction
+        )
+    }
+
+    library_snapshot = snapshots[library_ref.path]
+    if library_snapshot.exists:
+        entry = UserLibraryEntry(**library_snapshot.to_dict())
+    job_snapshot = snapshots[job_ref.path]
+    stored_job = job_snapshot.to_dict() if job_snapshot.exists else None
+
+    book_snapshot = snapshots[book_ref.path]
+    if not book_snapshot.exists:
+        # Books are never deleted, but stay correct if one was
+        stored = book
+        transaction.set(book_ref, stored.model_dump())
+    else:
+        stored = book_master_from_document(book_snapshot.to_dict())
+        if stored.content_hash() != book.content_hash():
+            stored.toc = book.toc
+            stored.last_updated_by = book.last_updated_by
+            stored.updated_at = book.updated_at
+            transaction.set(book_ref, stored.model_dump())
+            # Other owners' summaries are refreshed by the index worker
+            index_job = index_job.model_copy(update={"refresh_summaries": True})
+
+    repository.stage_registration(transaction, stored, entry, index_job, stored_job)
+    return stored, entry
+
+
+class AsyncFirestoreBookRegistrationRepository(BookRegistrationRepository):
+    """Registers books with as few Firestore round trips as possible.
+
+    A new book is written with a single batch commit: the master and the
+    index job are created with "exists: false" preconditions, together
+    with the library entry and the library summary (a new master has no
+    library entries or index jobs yet). Only when the master already
+    exists does a precondition fail, and the registration falls back to
+    a transaction that reads the stored documents and corrects the TOC.
+    """
+
+    def __init__(self, client: firestore.AsyncClient, summary_shards: int = 1) -> None:
+        """Initialize Firestore book registration repository."""
+        self.client = client
+        self.summary_shards = summary_shards
+        self.books = client.collection("books")
+
+    def library_ref(self, entry: UserLibraryEntry) -> firestore.AsyncDocumentReference:
+        """Get the document reference of a library entry."""
+        return (
+            self.client.collection("users")
+            .document(entry.user_id)
+            .collection("library")
+            .document(BookMaster.normalize_isbn(entry.isbn))
+        )
+
+    def stage_registration(
+        self,
+        writer: firestore.AsyncWriteBatch | firestore.AsyncTransaction,
+        book: BookMaster,
+        entry: UserLibraryEntry,
+        index_job: IndexJob,
+        stored_job: dict | None = None,
+    ) -> None:
+        """Add the library entry, summary and index job writes to a commit.
+
+        The library entry is replaced, so `entry` must already carry what
+        is kept from a stored one. The index job is created, or, when
+        `stored_job` exists, updated without touching its lease.
+        """
+        writer.set(self.library_ref(entry), entry.model_dump())
+        for ref, data in library_change_writes(
+            self.client,
+            entry.user_id,
+            {entry.isbn: summary_fields(book, entry.added_at)},
+            self.summary_shards,
+        ):
+            writer.set(ref, data, merge=True)
+        job_ref = index_job_ref(self.client, index_job)
+        if stored_job is None:
+            writer.create(job_ref, index_job.model_dump())
+        else:
+            writer.update(job_ref, requeue_fields(index_job, stored_job))
+
+    async def register(
+        self,
+        book: BookMaster,
+        entry: UserLibraryEntry,
+        index_job: IndexJob,
+    ) -> tuple[BookMaster, UserLibraryEntry]:
+        """Create or correct a book master and add it to a user's library."""
+        book_ref = self.books.document(BookMaster.normalize_isbn(book.isbn))
+
+        batch = self.client.batch()
+        batch.create(book_ref, book.model_dump())
+        self.stage_registration(batch, book, entry, index_job)
+        try:
+            await batch.commit()
+        except AlreadyExists:
+            logger.debug("Book %s already exists; correcting it", book.isbn)
+        else:
+            return book, entry
+
+        return await _correct_existing(
+            self.client.transaction(), self, book, entry, index_job
+        )
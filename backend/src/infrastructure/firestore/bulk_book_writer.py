@@ -0,0 +1,185 @@
+"""Firestore BulkWriter implementation of BulkBookWriter."""
+
+import asyncio
+import logging
+from collections import defaultdict
+
+from google.cloud import firestore
+from google.cloud.firestore_v1.bulk_writer import BulkWriteFailure, BulkWriter
+from google.rpc.code_pb2 import Code
+
+from src.domain.interfaces.bulk_book_writer import BulkBookWriter
+from src.domain.models.book_master import BookMaster
+from src.domain.models.index_job import IndexJob
+from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.firestore.index_job_queue import (
+    INDEX_JOBS_COLLECTION,
+    requeue_fields,
+)
+from src.infrastructure.firestore.library_summary import (
+    library_change_writes,
+    summary_fields,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class FirestoreBulkBookWriter(BulkBookWriter):
+    """Writes registrations through a Firestore BulkWriter.
+
+    BulkWriter batches and parallelizes the writes and ramps up its
+    throughput within Firestore's 500/50/5 rule. It is only available on
+    the sync client, so each call runs on a worker thread.
+    """
+
+    # Retries per write for transient errors (BulkWriter backs off itself)
+    MAX_WRITE_ATTEMPTS = 5
+
+    def __init__(self, client: firestore.Client, summary_shards: int = 1) -> None:
+        """Initialize Firestore bulk book writer."""
+        self.client = client
+        self.summary_shards = summary_shards
+
+    async def write(
+        self,
+        books: list[BookMaster],
+        entries: list[tuple[UserLibraryEntry, BookMaster]],
+        index_jobs: list[IndexJob],
+    ) -> None:
+        """Write book masters, library entries (and summaries) and index jobs."""
+        await asyncio.to_thread(self._write, books, entries, index_jobs)
+
+    def _library_ref(self, entry: UserLibraryEntry) -> firestore.DocumentReference:
+        """Get the document reference of a library entry."""
+        return (
+            self.client.collection("users")
+            .document(entry.user_id)
+            .collection("library")
+            .document(BookMaster.normalize_isbn(entry.isbn))
+        )
+
+    def _job_ref(self, index_job: IndexJob) -> firestore.DocumentReference:
+        """Get the document reference of an index job."""
+        return self.client.collection(INDEX_JOBS_COLLECTION).document(index_job.job_id)
+
+    def _read_stored(
+        self,
+        books: list[BookMaster],
+        entries: list[tuple[UserLibraryEntry, BookMaster]],
+        index_jobs: list[IndexJob],
+    ) -> tuple[list[tuple[UserLibraryEntry, BookMaster]], dict[str, dict]]:
+        """Read what re-registrations of existing masters must keep.
+
+        Only books whose master already exists can already be in a library
+        or have an index job; their library entries and jobs are read in
+        one batched get_all. Entries get their stored added_at.
+
+        Returns:
+            The entries, and the stored index jobs by path
+
+        """
+        new_isbns = {book.isbn for book in books}
+        refs = [
+            *(
+                self._library_ref(entry)
+                for entry, _ in entries
+                if entry.isbn not in new_isbns
+            ),
+            *(
+                self._job_ref(index_job)
+                for index_job in index_jobs
+                if index_job.isbn not in new_isbns
+            ),
+        ]
+        if not refs:
+            return entries, {}
+
+        stored = {
+            snapshot.reference.path: snapshot.to_dict()
+            for snapshot in self.client.get_all(
+                refs, field_paths=["added_at", "status"]
+            )
+            if snapshot.exists
+        }
+        entries = [
+            (
+                entry.model_copy(update={"added_at": stored[path]["added_at"]})
+                if (path := self._library_ref(entry).path) in stored
+                else entry,
+                book,
+            )
+            for entry, book in entries
+        ]
+        return entries, stored
+
+    def _stage(
+        self,
+        bulk_writer: BulkWriter,
+        books: list[BookMaster],
+        entries: list[tuple[UserLibraryEntry, BookMaster]],
+        index_jobs: list[IndexJob],
+    ) -> None:
+        """Enqueue the master, library, summary and index job writes."""
+        books_ref = self.client.collection("books")
+        for book in books:
+            bulk_writer.create(
+                books_ref.document(BookMaster.normalize_isbn(book.isbn)),
+                book.model_dump(),
+            )
+        entries, stored = self._read_stored(books, entries, index_jobs)
+        summary_changes: dict[str, dict[str, dict]] = defaultdict(dict)
+        for entry, book in entries:
+            bulk_writer.set(self._library_ref(entry), entry.model_dump())
+            summary_changes[entry.user_id][entry.isbn] = summary_fields(
+                book, entry.added_at
+            )
+        # One merge per summary shard rather than one per book
+        for user_id, changes in summary_changes.items():
+            for ref, data in library_change_writes(
+                self.client, user_id, changes, self.summary_shards
+            ):
+                bulk_writer.set(ref, data, merge=True)
+        # An existing job keeps its lease (see requeue_fields)
+        for index_job in index_jobs:
+            job_ref = self._job_ref(index_job)
+            if job_ref.path in stored:
+                bulk_writer.update(
+                    job_ref, requeue_fields(index_job, stored[job_ref.path])
+                )
+            else:
+                bulk_writer.create(job_ref, index_job.model_dump())
+
+    def _write(
+        self,
+        books: list[BookMaster],
+        entries: list[tuple[UserLibraryEntry, BookMaster]],
+        index_jobs: list[IndexJob],
+    ) -> None:
+        """Enqueue every write on a BulkWriter and wait for all of them."""
+        failures: list[BulkWriteFailure] = []
+
+        def on_write_error(failure: BulkWriteFailure, _: BulkWriter) -> bool:
+            # Another registration created the master or job first: keep
+            # theirs. A job deleted since it was read has been completed,
+            # and bulk imports do not change existing masters.
+            if failure.code in (Code.ALREADY_EXISTS, Code.NOT_FOUND):
+                return False
+            if failure.attempts < self.MAX_WRITE_ATTEMPTS:
+                return True
+            failures.append(failure)
+            return False
+
+        bulk_writer = self.client.bulk_writer()
+        bulk_writer.on_write_error(on_write_error)
+        self._stage(bulk_writer, books, entries, index_jobs)
+        bulk_writer.close()
+
+        if failures:
+            for failure in failures:
+                logger.error(
+                    "Bulk write to %s failed: %s",
+                    failure.operation.reference.path,
+                    failure.message,
+                )
+            msg = f"{len(failures)} bulk writes failed"
+            raise RuntimeError(msg)
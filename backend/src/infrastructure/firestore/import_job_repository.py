@@ -0,0 +1,38 @@
+"""Firestore implementation of ImportJobRepository."""
+
+from google.cloud import firestore
+
+from src.domain.interfaces.import_job_repository import ImportJobRepository
+from src.domain.models.import_job import ImportJob
+
+
+class FirestoreImportJobRepository(ImportJobRepository):
+    """Import job repository implementation using the async Firestore client.
+
+    Stores jobs in subcollections:
+    users/{user_id}/import_jobs/{job_id}
+    """
+
+    def __init__(self, client: firestore.AsyncClient) -> None:
+        """Initialize Firestore import job repository."""
+        self.client = client
+
+    def _get_jobs_ref(self, user_id: str) -> firestore.AsyncCollectionReference:
+        """Get the import jobs collection reference for a user."""
+        return (
+            self.client.collection("users").document(user_id).collection("import_jobs")
+        )
+
+    async def save(self, job: ImportJob) -> ImportJob:
+        """Create or overwrite an import job."""
+        await self._get_jobs_ref(job.user_id).document(job.job_id).set(job.model_dump())
+        return job
+
+    async def find(self, user_id: str, job_id: str) -> ImportJob | None:
+        """Find an import job of a user."""
+        doc = await self._get_jobs_ref(user_id).document(job_id).get()
+
+        if not doc.exists:
+            return None
+
+        return ImportJob(**doc.to_dict())
@@ -0,0 +1,182 @@
+"""Firestore implementation of IndexJobQueue."""
+
+import logging
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from google.cloud import firestore
+
+from src.domain.interfaces.index_job_queue import IndexJobQueue
+from src.domain.models.index_job import IndexJob, IndexJobStatus
+
+logger = logging.getLogger(__name__)
+
+INDEX_JOBS_COLLECTION = "index_jobs"
+
+
+def index_job_ref(
+    client: firestore.AsyncClient, job: IndexJob
+) -> firestore.AsyncDocumentReference:
+    """Get the document reference of an index job.
+
+    Used by repositories that enqueue jobs inside their own write batches.
+    """
+    return client.collection(INDEX_JOBS_COLLECTION).document(job.job_id)
+
+
+def requeue_fields(job: IndexJob, stored: dict) -> dict:
+    """Get the update that re-registers `job` over its stored document.
+
+    The lease is left alone, so a worker processing the job keeps it and no
+    other worker can claim the same book meanwhile. The job is marked
+    dirty instead, and the worker queues it again on completion (the
+    master may have changed after the worker read it). A dead job is
+    revived.
+    """
+    fields: dict = {"dirty": True}
+    if job.refresh_summaries:
+        fields["refresh_summaries"] = True
+    if stored.get("status") == IndexJobStatus.DEAD:
+        fields.update(
+            status=IndexJobStatus.PENDING,
+            attempts=0,
+            available_at=job.available_at,
+            last_error=None,
+        )
+    return fields
+
+
+@firestore.async_transactional
+async def _lease_job(
+    transaction: firestore.AsyncTransaction,
+    ref: firestore.AsyncDocumentReference,
+    lease_until: datetime,
+) -> IndexJob | None:
+    """Lease one job if it is still available (another worker may have won)."""
+    snapshot = await ref.get(transaction=transaction)
+    if not snapshot.exists:
+        return None
+
+    job = IndexJob(**snapshot.to_dict())
+    if job.status != IndexJobStatus.PENDING or job.available_at > datetime.now(UTC):
+        return None
+
+    job.lease_id = uuid.uuid4().hex
+    job.attempts += 1
+    job.available_at = lease_until
+    # The worker reads the master after leasing, so earlier changes are seen
+    job.dirty = False
+    transaction.update(
+        ref,
+        {
+            "lease_id": job.lease_id,
+            "attempts": job.attempts,
+            "available_at": job.available_at,
+            "dirty": False,
+        },
+    )
+    return job
+
+
+@firestore.async_transactional
+async def _update_if_leased(
+    transaction: firestore.AsyncTransaction,
+    ref: firestore.AsyncDocumentReference,
+    lease_id: str | None,
+    updates: dict | None,
+) -> None:
+    """Apply `updates` (or complete when None) only while the lease is held.
+
+    A lease that expired may have been taken by another worker, whose
+    outcome is the one that counts. Completing a job that a re-registration
+    marked dirty releases it for another pass instead of deleting it.
+    """
+    snapshot = await ref.get(transaction=transaction)
+    if not snapshot.exists or snapshot.get("lease_id") != lease_id:
+        logger.info("Lease on index job %s was lost; leaving it", ref.id)
+        return
+
+    if updates is None and snapshot.get("dirty"):
+        updates = {
+            "lease_id": None,
+            "dirty": False,
+            "attempts": 0,
+            "available_at": datetime.now(UTC),
+            "last_error": None,
+        }
+    if updates is None:
+        transaction.delete(ref)
+    else:
+        transaction.update(ref, updates)
+
+
+class FirestoreIndexJobQueue(IndexJobQueue):
+    """Index job queue backed by the 'index_jobs' collection.
+
+    Leasing is done per job in a transaction, so concurrent workers never
+    process the same job at the same time. Requires a composite index on
+    (status, available_at).
+    """
+
+    def __init__(self, client: firestore.AsyncClient) -> None:
+        """Initialize the Firestore index job queue."""
+        self.client = client
+        self.collection = client.collection(INDEX_JOBS_COLLECTION)
+
+    async def claim(self, limit: int, lease_seconds: float) -> list[IndexJob]:
+        """Lease up to `limit` available jobs."""
+        now = datetime.now(UTC)
+        query = (
+            self.collection.where(
+                filter=firestore.FieldFilter("status", "==", IndexJobStatus.PENDING)
+            )
+            .where(filter=firestore.FieldFilter("available_at", "<=", now))
+            .order_by("available_at")
+            .limit(limit)
+        )
+
+        # Read candidates first so no stream is held open across transactions
+        snapshots = [snapshot async for snapshot in query.stream()]
+
+        jobs = []
+        for snapshot in snapshots:
+            job = await _lease_job(
+                self.client.transaction(),
+                snapshot.reference,
+                now + timedelta(seconds=lease_seconds),
+            )
+            if job is not None:
+                jobs.append(job)
+        return jobs
+
+    async def complete(self, job: IndexJob) -> None:
+        """Delete the job (or release it if dirty) while leased by the caller."""
+        await _update_if_leased(
+            self.client.transaction(),
+            self.collection.document(job.job_id),
+            job.lease_id,
+            None,
+        )
+
+    async def retry(self, job: IndexJob, error: str, delay_seconds: float) -> None:
+        """Release the job with a backoff delay."""
+        await _update_if_leased(
+            self.client.transaction(),
+            self.collection.document(job.job_id),
+            job.lease_id,
+            {
+                "lease_id": None,
+                "last_error": error,
+                "available_at": datetime.now(UTC) + timedelta(seconds=delay_seconds),
+            },
+        )
+
+    async def dead_letter(self, job: IndexJob, error: str) -> None:
+        """Mark the job as dead so it is no longer claimed."""
+        logger.error("Index job %s moved to dead letter: %s", job.job_id, error)
+        await _update_if_leased(
+            self.client.transaction(),
+            self.collection.document(job.job_id),
+            job.lease_id,
+            {"status": IndexJobStatus.DEAD, "lease_id": None, "last_error": error},
+        )
@@ -0,0 +1,115 @@
+"""Firestore layout of the denormalized per-user library summary.
+
+Each user has `shard_count` summary documents,
+users/{user_id}/summary/shard-{k}, holding a `books` map of
+ISBN -> {title, added_at, chapter_count}. A book always lives in the same
+shard (by hash of its ISBN), so an entry can be added, changed or removed
+with a blind merge write in the same commit as the library change.
+
+Shards written by a full rebuild carry `complete: true` and the shard
+count they were built for; a shard created by a merge write alone is
+incomplete, and readers rebuild it.
+
+The same commits also bump `library_version` on users/{user_id}, so a
+client can revalidate its copy of the library with a single read. The
+index worker bumps `index_version` there instead once a book becomes
+searchable, which moves search results but not the listing.
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any
+
+from google.cloud import firestore
+
+from src.domain.models.book_master import BookMaster
+
+SUMMARY_COLLECTION = "summary"
+LIBRARY_VERSION_FIELD = "library_version"
+INDEX_VERSION_FIELD = "index_version"
+
+
+def summary_shard_id(isbn: str, shard_count: int) -> str:
+    """Get the ID of the summary shard holding an ISBN."""
+    digest = hashlib.sha256(BookMaster.normalize_isbn(isbn).encode()).digest()
+    return f"shard-{int.from_bytes(digest[:8]) % shard_count}"
+
+
+def summary_shard_ref(
+    client: Any,  # noqa: ANN401
+    user_id: str,
+    isbn: str,
+    shard_count: int,
+) -> Any:  # noqa: ANN401
+    """Get the reference of the summary shard holding an ISBN."""
+    return (
+        client.collection("users")
+        .document(user_id)
+        .collection(SUMMARY_COLLECTION)
+        .document(summary_shard_id(isbn, shard_count))
+    )
+
+
+def summary_shard_refs(client: Any, user_id: str, shard_count: int) -> list[Any]:  # noqa: ANN401
+    """Get the references of every summary shard of a user.
+
+    Works with both the sync and the async Firestore client.
+    """
+    collection = (
+        client.collection("users").document(user_id).collection(SUMMARY_COLLECTION)
+    )
+    return [collection.document(f"shard-{k}") for k in range(shard_count)]
+
+
+def summary_fields(book: BookMaster, added_at: datetime | None = None) -> dict:
+    """Get the summary entry of a book (without added_at for master changes)."""
+    fields: dict[str, Any] = {
+        "title": book.title,
+        "chapter_count": book.get_chapter_count(),
+        "updated_at": book.updated_at,
+    }
+    if added_at is not None:
+        fields["added_at"] = added_at
+    return fields
+
+
+def library_change_writes(
+    client: Any,  # noqa: ANN401
+    user_id: str,
+    changes: dict[str, Any],
+    shard_count: int,
+) -> list[tuple[Any, dict]]:
+    """Get the writes that must accompany a change to a user's library.
+
+    Per-ISBN summary changes are grouped into one merge write per shard,
+    followed by the library version bump.
+
+    Args:
+        client: A sync or async Firestore client
+        user_id: The owner of the summary
+        changes: ISBN -> summary fields, or firestore.DELETE_FIELD to remove
+        shard_count: Number of summary shards
+
+    Returns:
+        (document reference, data) pairs to apply with set(..., merge=True)
+
+    """
+    by_shard: dict[str, dict[str, Any]] = {}
+    for isbn, change in changes.items():
+        normalized_isbn = BookMaster.normalize_isbn(isbn)
+        shard = by_shard.setdefault(summary_shard_id(normalized_isbn, shard_count), {})
+        shard[normalized_isbn] = change
+
+    collection = (
+        client.collection("users").document(user_id).collection(SUMMARY_COLLECTION)
+    )
+    return [
+        *(
+            (collection.document(shard_id), {"books": books})
+            for shard_id, books in by_shard.items()
+        ),
+        (
+            client.collection("users").document(user_id),
+            {LIBRARY_VERSION_FIELD: firestore.Increment(1)},
+        ),
+    ]
@@ -0,0 +1,146 @@
+"""Firestore implementation of LibrarySummaryRepository."""
+
+import asyncio
+import logging
+
+from google.cloud import firestore
+
+from src.domain.interfaces.library_summary_repository import (
+    LibrarySummaryRepository,
+)
+from src.domain.models.book_master import BookMaster
+from src.domain.models.library_summary import LibrarySummaryItem
+from src.infrastructure.firestore.async_book_master_repository import (
+    AsyncFirestoreBookMasterRepository,
+)
+from src.infrastructure.firestore.async_user_library_repository import (
+    AsyncFirestoreUserLibraryRepository,
+)
+from src.infrastructure.firestore.library_summary import (
+    library_change_writes,
+    summary_fields,
+    summary_shard_id,
+    summary_shard_refs,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _summary_items(data: dict) -> list[LibrarySummaryItem]:
+    """Parse the `books` map of a summary shard.
+
+    Entries without added_at are skipped: they can only come from a master
+    change fanned out after the owner removed the book.
+    """
+    return [
+        LibrarySummaryItem(isbn=isbn, **fields)
+        for isbn, fields in data.get("books", {}).items()
+        if "added_at" in fields and "title" in fields
+    ]
+
+
+@firestore.async_transactional
+async def _rebuild(
+    transaction: firestore.AsyncTransaction,
+    repository: "AsyncFirestoreLibrarySummaryRepository",
+    user_id: str,
+) -> list[LibrarySummaryItem]:
+    """Rebuild every summary shard of a user from the library.
+
+    The shards are read first so they are locked: a library write that
+    commits meanwhile (it also writes the shards) waits for the rebuild
+    and then applies its change on top.
+    """
+    refs = summary_shard_refs(repository.client, user_id, repository.shard_count)
+    await asyncio.gather(*(ref.get(transaction=transaction) for ref in refs))
+
+    shards: dict[str, dict[str, dict]] = {ref.id: {} for ref in refs}
+    items = []
+    async for entries in repository.user_library_repo.iter_pages_by_user(user_id):
+        book_masters = await repository.book_master_repo.find_many_by_isbn(
+            [entry.isbn for entry in entries]
+        )
+        for entry, book_master in zip(entries, book_masters, strict=True):
+            if book_master is None:
+                continue
+            fields = summary_fields(book_master, entry.added_at)
+            shard_id = summary_shard_id(entry.isbn, repository.shard_count)
+            shards[shard_id][entry.isbn] = fields
+            items.append(LibrarySummaryItem(isbn=entry.isbn, **fields))
+
+    for ref in refs:
+        transaction.set(
+            ref,
+            {
+                "books": shards[ref.id],
+                "complete": True,
+                "shard_count": repository.shard_count,
+            },
+        )
+    return items
+
+
+class AsyncFirestoreLibrarySummaryRepository(LibrarySummaryRepository):
+    """Library summary repository implementation using the async Firestore client.
+
+    Reads all summary shards of a user with one batched get; with the
+    default single shard, listing a library is a single document read.
+    """
+
+    # Max writes per commit when fanning out a master change
+    FAN_OUT_BATCH_SIZE = 500
+
+    def __init__(self, client: firestore.AsyncClient, shard_count: int = 1) -> None:
+        """Initialize Firestore library summary repository."""
+        self.client = client
+        self.shard_count = shard_count
+        self.book_master_repo = AsyncFirestoreBookMasterRepository(client)
+        self.user_library_repo = AsyncFirestoreUserLibraryRepository(
+            client, summary_shards=shard_count
+        )
+
+    async def find_by_user(self, user_id: str) -> list[LibrarySummaryItem]:
+        """Get the summary of every book in a user's library."""
+        refs = summary_shard_refs(self.client, user_id, self.shard_count)
+        snapshots = [snapshot async for snapshot in self.client.get_all(refs)]
+
+        items = []
+        for snapshot in snapshots:
+            data = snapshot.to_dict() if snapshot.exists else None
+            if (
+                data is None
+                or not data.get("complete")
+                or data.get("shard_count") != self.shard_count
+            ):
+                logger.info("Rebuilding library summary of user %s", user_id)
+                return await _rebuild(self.client.transaction(), self, user_id)
+            items.extend(_summary_items(data))
+        return items
+
+    async def refresh_book(self, book: BookMaster) -> int:
+        """Update the summary entry of a book for all of its owners.
+
+        Requires a collection group index on library.isbn.
+        """
+        normalized_isbn = BookMaster.normalize_isbn(book.isbn)
+        query = (
+            self.client.collection_group("library")
+            .where(filter=firestore.FieldFilter("isbn", "==", normalized_isbn))
+            .select(["user_id"])
+        )
+        owners = [doc.get("user_id") async for doc in query.stream()]
+
+        changes = {normalized_isbn: summary_fields(book)}
+        writes = [
+            write
+            for owner in owners
+            for write in library_change_writes(
+                self.client, owner, changes, self.shard_count
+            )
+        ]
+        for i in range(0, len(writes), self.FAN_OUT_BATCH_SIZE):
+            batch = self.client.batch()
+            for ref, data in writes[i : i + self.FAN_OUT_BATCH_SIZE]:
+                batch.set(ref, data, merge=True)
+            await batch.commit()
+        return len(owners)
@@ -0,0 +1,81 @@
+"""Firestore implementation of ReportCache."""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from google.cloud import firestore
+
+from src.domain.interfaces.report_cache import ReportCache
+from src.domain.models.search_report import SearchReport
+from src.infrastructure.cache.report_cache import InMemoryReportCache
+
+logger = logging.getLogger(__name__)
+
+
+class FirestoreReportCache(ReportCache):
+    """Report cache stored in the 'search_reports' collection.
+
+    Shares generated reports across users, workers and instances. Reads go
+    through an in-process LRU first. Documents carry an `expires_at`
+    field, which can also back a Firestore TTL policy for cleanup.
+    """
+
+    def __init__(
+        self,
+        client: firestore.AsyncClient,
+        memory: InMemoryReportCache,
+    ) -> None:
+        """Initialize the cache with an in-memory front tier."""
+        self.collection = client.collection("search_reports")
+        self.memory = memory
+        self.firestore_hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> SearchReport | None:
+        """Get a cached report from memory, then Firestore."""
+        cached = await self.memory.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            doc = await self.collection.document(key).get()
+        except Exception:
+            logger.exception("Failed to read report cache for %s", key)
+            self.misses += 1
+            return None
+
+        data = doc.to_dict() if doc.exists else None
+        now = datetime.now(UTC)
+        if not data or data["expires_at"] <= now:
+            self.misses += 1
+            return None
+
+        report = SearchReport.model_validate(data["report"])
+        remaining = (data["expires_at"] - now).total_seconds()
+        await self.memory.set(key, report, ttl_seconds=remaining)
+        self.firestore_hits += 1
+        return report
+
+    async def set(self, key: str, report: SearchReport) -> None:
+        """Store a report in memory and Firestore."""
+        await self.memory.set(key, report)
+        now = datetime.now(UTC)
+        try:
+            await self.collection.document(key).set(
+                {
+                    "report": report.model_dump(),
+                    "cached_at": now,
+                    "expires_at": now + timedelta(seconds=self.memory.ttl_seconds),
+                }
+            )
+        except Exception:
+            logger.exception("Failed to write report cache for %s", key)
+
+    def stats(self) -> dict[str, Any]:
+        """Report memory and Firestore hit/miss counters."""
+        return {
+            "memory": self.memory.stats(),
+            "firestore_hits": self.firestore_hits,
+            "misses": self.misses,
+        }
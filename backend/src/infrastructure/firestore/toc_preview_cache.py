@@ -0,0 +1,90 @@
+"""Firestore implementation of TOCPreviewCache."""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from google.cloud import firestore
+
+from src.domain.interfaces.toc_preview_cache import TOCPreviewCache
+from src.infrastructure.cache.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class FirestoreTOCPreviewCache(TOCPreviewCache):
+    """TOC preview cache stored in the 'toc_previews' collection.
+
+    Reads go through an in-process LRU first, so repeated previews on the
+    same worker do not even touch Firestore. Documents carry an `expires_at`
+    field, which can also back a Firestore TTL policy for cleanup.
+    """
+
+    def __init__(
+        self,
+        client: firestore.AsyncClient,
+        ttl_seconds: float,
+        max_size: int,
+    ) -> None:
+        """Initialize the preview cache."""
+        self.collection = client.collection("toc_previews")
+        self.ttl_seconds = ttl_seconds
+        self.memory = TTLCache[str, dict](max_size=max_size, ttl_seconds=ttl_seconds)
+        self.firestore_hits = 0
+        self.misses = 0
+
+    async def get(self, isbn: str) -> dict | None:
+        """Get a cached preview from memory, then Firestore."""
+        cached = self.memory.get(isbn)
+        if cached is not None:
+            return cached
+
+        try:
+            doc = await self.collection.document(isbn).get()
+        except Exception:
+            logger.exception("Failed to read TOC preview cache for %s", isbn)
+            self.misses += 1
+            return None
+
+        data = doc.to_dict() if doc.exists else None
+        if not data or data["expires_at"] <= datetime.now(UTC):
+            self.misses += 1
+            return None
+
+        result = {"title": data["title"], "toc": data["toc"]}
+        remaining = (data["expires_at"] - datetime.now(UTC)).total_seconds()
+        self.memory.set(isbn, result, ttl_seconds=remaining)
+        self.firestore_hits += 1
+        return result
+
+    async def set(self, isbn: str, result: dict) -> None:
+        """Store a preview in memory and Firestore."""
+        self.memory.set(isbn, result)
+        now = datetime.now(UTC)
+        try:
+            await self.collection.document(isbn).set(
+                {
+                    "title": result["title"],
+                    "toc": result["toc"],
+                    "cached_at": now,
+                    "expires_at": now + timedelta(seconds=self.ttl_seconds),
+                }
+            )
+        except Exception:
+            # The preview itself succeeded; failing to cache it is not fatal
+            logger.exception("Failed to write TOC preview cache for %s", isbn)
+
+    def stats(self) -> dict[str, Any]:
+        """Report memory and Firestore hit/miss counters."""
+        memory_stats = self.memory.stats()
+        lookups = memory_stats["hits"] + self.firestore_hits + self.misses
+        return {
+            "memory": memory_stats,
+            "firestore_hits": self.firestore_hits,
+            "misses": self.misses,
+            "hit_rate": (
+                (memory_stats["hits"] + self.firestore_hits) / lookups
+                if lookups
+                else 0.0
+            ),
+        }
@@ -1,10 +1,19 @@
 """Firestore implementation of UserLibraryRepository."""
 
+from collections import defaultdict
+from collections.abc import Iterator
+from datetime import datetime
+
 from google.cloud import firestore
 
 from src.domain.interfaces.book_repository import UserLibraryRepository
 from src.domain.models.book_master import BookMaster
 from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.firestore.library_summary import (
+    library_change_writes,
+    summary_fields,
+    summary_shard_ref,
+)
 
 
 class FirestoreUserLibraryRepository(UserLibraryRepository):
@@ -14,42 +23,127 @@ class FirestoreUserLibraryRepository(UserLibraryRepository):
     users/{user_id}/library/{isbn}
     """
 
-    def __init__(self, client: firestore.Client) -> None:
+    def __init__(self, client: firestore.Client, summary_shards: int = 1) -> None:
         """Initialize Firestore user library repository."""
         self.client = client
+        self.summary_shards = summary_shards
 
     def _get_library_ref(self, user_id: str) -> firestore.CollectionReference:
         """Get the library collection reference for a user."""
         return self.client.collection("users").document(user_id).collection("library")
 
-    def add_book(self, entry: UserLibraryEntry) -> UserLibraryEntry:
+    def add_book(
+        self, entry: UserLibraryEntry, book: BookMaster | None = None
+    ) -> UserLibraryEntry:
         """Add a book to user's library."""
         normalized_isbn = BookMaster.normalize_isbn(entry.isbn)
         entry_dict = entry.model_dump()
 
-        # Use ISBN as document ID in the user's library subcollection
-        ref = self._get_library_ref(entry.user_id).document(normalized_isbn)
-        ref.set(entry_dict)
+        # Use ISBN as document ID in the user's library subcollection,
+        # and keep the library summary in the same batch
+        batch = self.client.batch()
+        library_ref = self._get_library_ref(entry.user_id).document(normalized_isbn)
+        batch.set(library_ref, entry_dict)
+        changes = {}
+        if book is not None:
+            changes[normalized_isbn] = summary_fields(book, entry.added_at)
+        else:
+            ref = summary_shard_ref(
+                self.client, entry.user_id, normalized_isbn, self.summary_shards
+            )
+            batch.set(ref, {"complete": False}, merge=True)
+        for ref, data in library_change_writes(
+            self.client, entry.user_id, changes, self.summary_shards
+        ):
+            batch.set(ref, data, merge=True)
+        batch.commit()
 
         return entry
 
     def remove_book(self, user_id: str, isbn: str) -> None:
         """Remove a book from user's library."""
         normalized_isbn = BookMaster.normalize_isbn(isbn)
-        ref = self._get_library_ref(user_id).document(normalized_isbn)
-        ref.delete()
+        batch = self.client.batch()
+        batch.delete(self._get_library_ref(user_id).document(normalized_isbn))
+        for ref, data in library_change_writes(
+            self.client,
+            user_id,
+            {normalized_isbn: firestore.DELETE_FIELD},
+            self.summary_shards,
+        ):
+            batch.set(ref, data, merge=True)
+        batch.commit()
 
     def find_by_user(self, user_id: str) -> list[UserLibraryEntry]:
-        """Find all library entries for a user."""
-        library_ref = self._get_library_ref(user_id)
-        docs = library_ref.stream()
-
-        entries = []
-        for doc in docs:
+        """Find all library entries for a user, reading them page by page."""
+        return [entry for page in self.iter_pages(user_id) for entry in page]
+
+    def iter_pages(
+        self, user_id: str, page_size: int = 500
+    ) -> Iterator[list[UserLibraryEntry]]:
+        """Stream a user's library entries in pages, newest first.
+
+        Each page is a separate query resuming after the previous page, so
+        no stream is held open while the caller processes a page.
+        Requires a composite index on (added_at DESC, isbn DESC).
+        """
+        query = (
+            self._get_library_ref(user_id)
+            .order_by("added_at", direction=firestore.Query.DESCENDING)
+            .order_by("isbn", direction=firestore.Query.DESCENDING)
+        )
+        last: UserLibraryEntry | None = None
+        while True:
+            page_query = query
+            if last is not None:
+                page_query = query.start_after(
+                    {"added_at": last.added_at, "isbn": last.isbn}
+                )
+            page = [
+                UserLibraryEntry(**doc.to_dict())
+                for doc in page_query.limit(page_size).stream()
+            ]
+            if page:
+                yield page
+            if len(page) < page_size:
+                return
+            last = page[-1]
+
+    def iter_all_pages(
+        self, added_after: datetime | None = None, page_size: int = 500
+    ) -> Iterator[list[UserLibraryEntry]]:
+        """Stream the library entries of every user in pages, oldest first.
+
+        Uses a collection group query over every users/{user_id}/library;
+        with `added_after`, only entries added later are read. Requires a
+        collection group index on library.added_at (ascending).
+        """
+        query = self.client.collection_group("library").order_by("added_at")
+        if added_after is not None:
+            query = query.where(
+                filter=firestore.FieldFilter("added_at", ">", added_after)
+            )
+        cursor = None
+        while True:
+            page_query = query.start_after(cursor) if cursor else query
+            snapshots = list(page_query.limit(page_size).stream())
+            if snapshots:
+                yield [UserLibraryEntry(**doc.to_dict()) for doc in snapshots]
+            if len(snapshots) < page_size:
+                return
+            cursor = snapshots[-1]
+
+    def find_all_owners(self) -> dict[str, set[str]]:
+        """Map every ISBN to the users owning it, across all libraries.
+
+        Uses a collection group query over every users/{user_id}/library.
+        """
+        owners: dict[str, set[str]] = defaultdict(set)
+        docs = self.client.collection_group("library").select(["user_id", "isbn"])
+        for doc in docs.stream():
             data = doc.to_dict()
-            entries.append(UserLibraryEntry(**data))
-
-        return entries
+            owners[data["isbn"]].add(data["user_id"])
+        return owners
 
     def find_entry(self, user_id: str, isbn: str) -> UserLibraryEntry | None:
         """Find a specific library entry."""
@@ -67,7 +161,16 @@ class FirestoreUserLibraryRepository(UserLibraryRepository):
         normalized_isbn = BookMaster.normalize_isbn(entry.isbn)
         entry_dict = entry.model_dump()
 
-        ref = self._get_library_ref(entry.user_id).document(normalized_isbn)
-        ref.update(entry_dict)
+        batch = self.client.batch()
+        library_ref = self._get_library_ref(entry.user_id).document(normalized_isbn)
+        batch.update(library_ref, entry_dict)
+        for ref, data in library_change_writes(
+            self.client,
+            entry.user_id,
+            {normalized_isbn: {"added_at": entry.added_at}},
+            self.summary_shards,
+        ):
+            batch.set(ref, data, merge=True)
+        batch.commit()
 
         return entry
@@ -0,0 +1,102 @@
+"""Caching decorator for report generation."""
+
+import hashlib
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from src.domain.interfaces.report_cache import ReportCache
+from src.domain.interfaces.report_generator import ReportGenerator
+from src.domain.models.search_report import RecommendedBook, SearchReport
+from src.domain.text import normalize_query, normalize_text
+from src.infrastructure.cache.single_flight import SingleFlight
+
+
+def report_cache_key(query: str, search_results: list[dict]) -> str:
+    """Build a user-independent key for a report.
+
+    A report depends only on the query and the retrieved books' titles
+    and TOCs, so the key hashes the normalized query and the sorted
+    (ISBN, content hash) pairs of the results.
+    """
+    books = sorted(
+        (
+            str(result.get("isbn") or result.get("id", "")),
+            result.get("content_hash")
+            # Documents indexed before content hashes existed
+            or hashlib.sha256(
+                normalize_text(
+                    f"{result.get('title', '')}\n{result.get('toc_text', '')}"
+                ).encode()
+            ).hexdigest(),
+        )
+        for result in search_results
+    )
+    payload = json.dumps(
+        {"query": normalize_query(query), "books": books},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CachingReportGenerator(ReportGenerator):
+    """ReportGenerator decorator that reuses reports across users.
+
+    Many users own the same popular books and ask similar questions;
+    identical retrievals are answered from the cache, and concurrent
+    identical requests share one generation.
+    """
+
+    def __init__(self, generator: ReportGenerator, cache: ReportCache) -> None:
+        """Wrap `generator` with a report cache."""
+        self.generator = generator
+        self.cache = cache
+        self.flights = SingleFlight[SearchReport]()
+
+    async def generate_report(
+        self, query: str, search_results: list[dict]
+    ) -> SearchReport:
+        """Generate a report, or reuse one for the same query and books."""
+        key = report_cache_key(query, search_results)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached
+        return await self.flights.do(
+            key, lambda: self._generate(key, query, search_results)
+        )
+
+    async def _generate(
+        self, key: str, query: str, search_results: list[dict]
+    ) -> SearchReport:
+        """Generate and cache a report (empty reports are failures: not cached)."""
+        report = await self.generator.generate_report(query, search_results)
+        if report.recommendations:
+            await self.cache.set(key, report)
+        return report
+
+    async def stream_report(
+        self, query: str, search_results: list[dict]
+    ) -> AsyncIterator[RecommendedBook]:
+        """Stream a report, replaying a cached one for the same query and books.
+
+        A completed stream is cached like a generated report; an interrupted
+        one (failure or client disconnect) is not.
+        """
+        key = report_cache_key(query, search_results)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            for recommendation in cached.recommendations:
+                yield recommendation
+            return
+
+        recommendations: list[RecommendedBook] = []
+        async for recommendation in self.generator.stream_report(query, search_results):
+            recommendations.append(recommendation)
+            yield recommendation
+        if recommendations:
+            await self.cache.set(key, SearchReport(recommendations=recommendations))
+
+    def stats(self) -> dict[str, Any]:
+        """Report cache and coalescing counters."""
+        return {"cache": self.cache.stats(), "coalescing": self.flights.stats()}
@@ -0,0 +1,82 @@
+"""Per-process concurrency limiter and deadline for Gemini calls."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+
+class GeminiCallLimiter:
+    """Bounds concurrent Gemini calls and applies a per-call deadline.
+
+    One limiter is owned by each shared generator, so slow calls of one kind
+    (e.g. grounded TOC previews) cannot consume the capacity of another
+    (e.g. search reports). The deadline covers both the wait for a slot
+    and the call itself.
+    """
+
+    def __init__(self, max_concurrency: int, timeout_seconds: float) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum number of calls in flight at once.
+            timeout_seconds: Deadline for a single call, including queueing.
+
+        """
+        self.max_concurrency = max_concurrency
+        self.timeout_seconds = timeout_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run[T](self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run `call` once a slot is free, within the configured deadline.
+
+        Raises:
+            TimeoutError: If the call does not complete before the deadline.
+
+        """
+        async with asyncio.timeout(self.timeout_seconds), self._semaphore:
+            return await call()
+
+    async def stream[T](
+        self, open_stream: Callable[[], Awaitable[AsyncIterator[T]]]
+    ) -> AsyncIterator[T]:
+        """Run a streaming call in its own task, yielding its items.
+
+        The task holds the slot and runs within the deadline, handing items
+        over through an unbounded queue: a slow consumer neither keeps the
+        slot nor sees the deadline fire while it is paused between items.
+        Closing the iterator early cancels the call.
+
+        Raises:
+            TimeoutError: If the stream does not complete before the deadline.
+
+        """
+        queue: asyncio.Queue[T | _StreamEnd] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async with asyncio.timeout(self.timeout_seconds), self._semaphore:
+                    async for item in await open_stream():
+                        queue.put_nowait(item)
+            except Exception as e:  # noqa: BLE001
+                # Handed over to the consumer, which raises it
+                queue.put_nowait(_StreamEnd(e))
+            else:
+                queue.put_nowait(_StreamEnd())
+
+        producer = asyncio.create_task(produce())
+        try:
+            while not isinstance(item := await queue.get(), _StreamEnd):
+                yield item
+            if item.error is not None:
+                raise item.error
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+
+class _StreamEnd:
+    """Marks the end of a stream, with the error that ended it if any."""
+
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
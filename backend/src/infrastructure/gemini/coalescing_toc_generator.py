@@ -0,0 +1,37 @@
+"""Request-coalescing decorator for TOC generation."""
+
+import re
+from typing import Any
+
+from src.domain.interfaces.book_repository import TOCGenerator
+from src.domain.models.book_master import BookMaster
+from src.infrastructure.cache.single_flight import SingleFlight
+
+
+class CoalescingTOCGenerator(TOCGenerator):
+    """TOCGenerator decorator that shares in-flight generations per ISBN.
+
+    Concurrent previews of the same book (e.g. after it was shared in a
+    group) await a single generation instead of each calling Gemini.
+    """
+
+    def __init__(self, generator: TOCGenerator) -> None:
+        """Wrap `generator` with single-flight coalescing."""
+        self.generator = generator
+        self.flights = SingleFlight[dict[str, Any]]()
+
+    async def generate_from_query(self, query: str) -> dict[str, Any]:
+        """Generate title and TOC, joining a concurrent call for the same book."""
+        isbn_match = re.search(r"ISBN:\s*([\d\- ]{10,17})", query)
+        key = BookMaster.normalize_isbn(isbn_match.group(1)) if isbn_match else query
+        return await self.flights.do(
+            key, lambda: self.generator.generate_from_query(query)
+        )
+
+    def generate_from_image(self, image_data: bytes) -> list[dict]:
+        """Generate TOC from an image (not coalesced)."""
+        return self.generator.generate_from_image(image_data)
+
+    def stats(self) -> dict[str, Any]:
+        """Report coalescing counters."""
+        return self.flights.stats()
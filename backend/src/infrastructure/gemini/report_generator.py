@@ -1,12 +1,15 @@
 """Gemini-based Report Generator."""
 
 import logging
+from collections.abc import AsyncIterator
 
 from google import genai
 from google.genai import types
 
 from src.domain.interfaces.report_generator import ReportGenerator
-from src.domain.models.search_report import SearchReport
+from src.domain.models.search_report import RecommendedBook, SearchReport
+from src.infrastructure.gemini.call_limiter import GeminiCallLimiter
+from src.infrastructure.gemini.report_stream_parser import RecommendationStreamParser
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +22,8 @@ class GeminiReportGenerator(ReportGenerator):
         project_id: str,
         location: str = "us-central1",
         model: str = "gemini-2.5-flash",
+        max_concurrency: int = 16,
+        timeout_seconds: float = 30.0,
     ) -> None:
         """Initialize Gemini Report Generator."""
         self.client = genai.Client(
@@ -27,13 +32,68 @@ class GeminiReportGenerator(ReportGenerator):
             location=location,
         )
         self.model_name = model
+        self.limiter = GeminiCallLimiter(max_concurrency, timeout_seconds)
 
-    def generate_report(self, query: str, search_results: list[dict]) -> SearchReport:
+    async def aclose(self) -> None:
+        """Close the underlying Gen AI client."""
+        await self.client.aio.aclose()
+        self.client.close()
+
+    async def generate_report(
+        self, query: str, search_results: list[dict]
+    ) -> SearchReport:
         """Generate a structured report from search results."""
+        prompt = self._build_prompt(query, search_results)
+
+        try:
+            response = await self.limiter.run(
+                lambda: self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=self._generation_config(),
+                )
+            )
+
+            return SearchReport.model_validate_json(response.text)
+
+        except Exception:
+            logger.exception("Report generation error")
+            return SearchReport(recommendations=[])
+
+    async def stream_report(
+        self, query: str, search_results: list[dict]
+    ) -> AsyncIterator[RecommendedBook]:
+        """Stream the report, yielding each recommendation once it is complete.
+
+        The call runs under the limiter in its own task, so the deadline
+        covers generation only: time the caller spends between items (e.g.
+        writing to a slow client) neither counts nor holds the slot.
+        """
+        prompt = self._build_prompt(query, search_results)
+        parser = RecommendationStreamParser()
+
+        async for chunk in self.limiter.stream(
+            lambda: self.client.aio.models.generate_content_stream(
+                model=self.model_name,
+                contents=prompt,
+                config=self._generation_config(),
+            )
+        ):
+            for book in parser.feed(chunk.text or ""):
+                yield book
+
+    @staticmethod
+    def _generation_config() -> types.GenerateContentConfig:
+        return types.GenerateContentConfig(
+            response_mime_type="application/json",
+            response_schema=SearchReport,
+        )
+
+    def _build_prompt(self, query: str, search_results: list[dict]) -> str:
         # Format search results for the prompt
         context = self._format_search_results(search_results)
 
-        prompt = f"""
+        return f"""
         あなたは蔵書検索アシスタントです。
         提供された目次情報に基づき、ユーザーの興味「{query}」に関連がありそうな本と章を特定して案内してください。
 
@@ -48,22 +108,6 @@ class GeminiReportGenerator(ReportGenerator):
         3. **簡潔さ**: 前置きや結びの言葉は一切省き、JSONデータのみを出力してください。
         """
 
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    response_mime_type="application/json",
-                    response_schema=SearchReport,
-                ),
-            )
-
-            return SearchReport.model_validate_json(response.text)
-
-        except Exception:
-            logger.exception("Report generation error")
-            return SearchReport(recommendations=[])
-
     def _format_search_results(self, results: list[dict]) -> str:
         if not results:
             return "（検索結果なし）"
@@ -0,0 +1,119 @@
+"""Incremental parser for streamed SearchReport JSON."""
+
+import logging
+import re
+
+from pydantic import ValidationError
+
+from src.domain.models.search_report import RecommendedBook
+
+logger = logging.getLogger(__name__)
+
+_RECOMMENDATIONS_START = re.compile(r'"recommendations"\s*:\s*\[')
+
+
+class RecommendationStreamParser:
+    """Extracts recommendations from a SearchReport JSON as it streams in.
+
+    Text chunks are fed as they arrive; every recommendation object that
+    is complete is returned at once, without waiting for the rest of the
+    document. Only the unconsumed tail of the text is buffered.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self._buffer = ""
+        self._pos = 0  # Next character to scan
+        self._object_start: int | None = None  # Start of the current object
+        self._depth = 0  # Nesting depth inside the recommendations array
+        self._in_array = False
+        self._in_string = False
+        self._escaped = False
+        self.finished = False  # The recommendations array was closed
+
+    def feed(self, chunk: str) -> list[RecommendedBook]:
+        """Consume a chunk of text.
+
+        Args:
+            chunk: The next piece of the streamed JSON
+
+        Returns:
+            The recommendations completed by this chunk
+
+        """
+        if self.finished:
+            return []
+        self._buffer += chunk
+
+        if not self._in_array:
+            match = _RECOMMENDATIONS_START.search(self._buffer)
+            if match is None:
+                return []
+            self._in_array = True
+            self._pos = match.end()
+
+        books = []
+        while self._pos < len(self._buffer) and not self.finished:
+            book = self._scan(self._buffer[self._pos])
+            if book is not None:
+                books.append(book)
+            self._pos += 1
+
+        # Drop what was consumed, keeping a partially received object
+        cut = self._object_start if self._object_start is not None else self._pos
+        self._buffer = self._buffer[cut:]
+        self._pos -= cut
+        if self._object_start is not None:
+            self._object_start = 0
+        return books
+
+    def _scan(self, char: str) -> RecommendedBook | None:
+        """Advance the state machine by one character."""
+        if self._in_string:
+            self._scan_string(char)
+            return None
+
+        if char == '"':
+            self._in_string = True
+        elif char in "{[":
+            self._open()
+        elif char in "}]":
+            return self._close()
+        return None
+
+    def _scan_string(self, char: str) -> None:
+        """Advance through a string literal, honouring escapes."""
+        if self._escaped:
+            self._escaped = False
+        elif char == "\\":
+            self._escaped = True
+        elif char == '"':
+            self._in_string = False
+
+    def _open(self) -> None:
+        """Enter an object or array, remembering where a recommendation starts."""
+        if self._depth == 0:
+            self._object_start = self._pos
+        self._depth += 1
+
+    def _close(self) -> RecommendedBook | None:
+        """Leave an object or array; a closed recommendation is parsed."""
+        if self._depth == 0:
+            # The recommendations array itself
+            self.finished = True
+            return None
+        self._depth -= 1
+        if self._depth == 0 and self._object_start is not None:
+            text = self._buffer[self._object_start : self._pos + 1]
+            self._object_start = None
+            return self._parse(text)
+        return None
+
+    @staticmethod
+    def _parse(text: str) -> RecommendedBook | None:
+        """Validate one recommendation object, skipping malformed ones."""
+        try:
+            return RecommendedBook.model_validate_json(text)
+        except ValidationError:
+            logger.warning("Skipping malformed recommendation: %s", text)
+            return None
@@ -1,8 +1,10 @@
 """Gemini-based TOC Generator implementation."""
 
+import asyncio
 import json
 import logging
 import re
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import defusedxml.ElementTree as ET  # noqa: N817
@@ -10,7 +12,12 @@ import httpx
 from google import genai
 from google.genai import types
 
+from src.domain.interfaces.book_metadata_cache import BookMetadataCache
 from src.domain.interfaces.book_repository import TOCGenerator
+from src.domain.models.book_master import BookMaster
+from src.infrastructure.cache.book_metadata_cache import InMemoryBookMetadataCache
+from src.infrastructure.circuit_breaker import CircuitBreaker
+from src.infrastructure.gemini.call_limiter import GeminiCallLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +30,31 @@ class GeminiTOCGenerator(TOCGenerator):
     LEVEL_2 = 2
     LEVEL_3 = 3
 
-    def __init__(
+    # Bibliographic metadata sources
+    NDL_SEARCH_URL = "https://ndlsearch.ndl.go.jp/api/opensearch"
+    GOOGLE_BOOKS_URL = "https://www.googleapis.com/books/v1/volumes"
+
+    # Circuit breaker settings shared by the bibliographic sources
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_SECONDS = 30.0
+
+    # Defaults for the in-memory metadata cache
+    METADATA_CACHE_MAX_SIZE = 4096
+    METADATA_POSITIVE_TTL_SECONDS = 30 * 24 * 60 * 60
+    METADATA_NEGATIVE_TTL_SECONDS = 24 * 60 * 60
+    METADATA_FALLBACK_TTL_SECONDS = 60 * 60
+
+    def __init__(  # noqa: PLR0913
         self,
         project_id: str,
         location: str = "us-central1",
         model: str = "gemini-2.5-pro",
+        max_concurrency: int = 4,
+        timeout_seconds: float = 60.0,
+        ndl_timeout_seconds: float = 10.0,
+        google_books_timeout_seconds: float = 10.0,
+        metadata_cache: BookMetadataCache | None = None,
+        metadata_fallback_ttl_seconds: float = METADATA_FALLBACK_TTL_SECONDS,
     ) -> None:
         """Initialize Gemini client."""
         # Initialize Gen AI Client with Vertex AI backend
@@ -37,80 +64,184 @@ class GeminiTOCGenerator(TOCGenerator):
             location=location,
         )
         self.model_name = model
+        self.limiter = GeminiCallLimiter(max_concurrency, timeout_seconds)
+
+        # Pooled HTTP client shared by all bibliographic metadata lookups
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        self.ndl_timeout_seconds = ndl_timeout_seconds
+        self.google_books_timeout_seconds = google_books_timeout_seconds
+        self.ndl_breaker = CircuitBreaker(
+            "NDL Search",
+            self.CIRCUIT_FAILURE_THRESHOLD,
+            self.CIRCUIT_RESET_SECONDS,
+        )
+        self.google_books_breaker = CircuitBreaker(
+            "Google Books",
+            self.CIRCUIT_FAILURE_THRESHOLD,
+            self.CIRCUIT_RESET_SECONDS,
+        )
+        self.metadata_cache = metadata_cache or InMemoryBookMetadataCache(
+            max_size=self.METADATA_CACHE_MAX_SIZE,
+            positive_ttl_seconds=self.METADATA_POSITIVE_TTL_SECONDS,
+            negative_ttl_seconds=self.METADATA_NEGATIVE_TTL_SECONDS,
+        )
+        self.metadata_fallback_ttl_seconds = metadata_fallback_ttl_seconds
+
+    async def aclose(self) -> None:
+        """Close the underlying Gen AI and HTTP clients."""
+        await self.http_client.aclose()
+        await self.client.aio.aclose()
+        self.client.close()
 
     async def _fetch_book_metadata(self, isbn: str) -> dict[str, Any]:
-        """Fetch canonical metadata, trying NDL Search first, then Google Books."""
-        # 1. Try NDL Search API first (accurate Japanese titles)
-        metadata = await self._fetch_ndl_metadata(isbn)
-        if metadata:
-            logger.info("Got metadata from NDL Search: %s", metadata.get("title"))
-            return metadata
+        """Fetch canonical metadata, consulting the metadata cache first."""
+        isbn = BookMaster.normalize_isbn(isbn)
+        cached = await self.metadata_cache.get(isbn)
+        if cached is not None:
+            logger.info("Metadata cache hit for %s (found: %s)", isbn, bool(cached))
+            return cached
+
+        metadata, authoritative = await self._lookup_book_metadata(isbn)
+        if authoritative:
+            await self.metadata_cache.set(isbn, metadata)
+        elif metadata:
+            # A fallback answer while NDL Search was failing: keep it only
+            # briefly, so NDL's (more accurate) answer replaces it soon
+            await self.metadata_cache.set(
+                isbn, metadata, ttl_seconds=self.metadata_fallback_ttl_seconds
+            )
+        # "Not found" is only remembered when every source actually
+        # answered; a timeout or open circuit says nothing about the ISBN.
+        return metadata
+
+    async def _lookup_book_metadata(self, isbn: str) -> tuple[dict[str, Any], bool]:
+        """Query NDL Search and Google Books concurrently.
 
-        # 2. Fall back to Google Books API
-        logger.info("NDL Search returned no results, falling back to Google Books")
-        return await self._fetch_google_books_metadata(isbn)
+        NDL Search wins whenever it has a title (accurate Japanese titles);
+        Google Books is only used as a fallback.
+
+        Returns:
+            Tuple of (metadata, authoritative)
+            - metadata: The metadata, or {} if none was found
+            - authoritative: True if every queried source answered
+
+        """
+        ndl_task = asyncio.create_task(
+            self._query_source(self.ndl_breaker, self._fetch_ndl_metadata, isbn)
+        )
+        google_task = asyncio.create_task(
+            self._query_source(
+                self.google_books_breaker, self._fetch_google_books_metadata, isbn
+            )
+        )
+        try:
+            ndl_metadata = await ndl_task
+            if ndl_metadata:
+                logger.info(
+                    "Got metadata from NDL Search: %s", ndl_metadata.get("title")
+                )
+                return ndl_metadata, True
+
+            logger.info("NDL Search returned no results, falling back to Google Books")
+            google_metadata = await google_task
+            return (
+                google_metadata or {},
+                ndl_metadata is not None and google_metadata is not None,
+            )
+        finally:
+            # No longer needed once NDL has answered with a title
+            google_task.cancel()
+
+    async def _query_source(
+        self,
+        breaker: CircuitBreaker,
+        fetch: Callable[[str], Awaitable[dict[str, Any]]],
+        isbn: str,
+    ) -> dict[str, Any] | None:
+        """Query one metadata source behind its circuit breaker.
+
+        Returns:
+            The metadata ({} when the source does not know the ISBN),
+            or None if the source failed or its circuit is open.
+
+        """
+        if not breaker.allow_request():
+            logger.warning("%s circuit is open, skipping lookup", breaker.name)
+            return None
+
+        try:
+            metadata = await fetch(isbn)
+        except asyncio.CancelledError:
+            breaker.record_abandoned()
+            raise
+        except Exception:
+            logger.exception("Error fetching metadata from %s", breaker.name)
+            breaker.record_failure()
+            return None
+
+        breaker.record_success()
+        return metadata
 
     async def _fetch_ndl_metadata(self, isbn: str) -> dict[str, Any]:
         """Fetch metadata from National Diet Library Search API."""
-        url = f"https://ndlsearch.ndl.go.jp/api/opensearch?isbn={isbn}"
         namespaces = {
             "dc": "http://purl.org/dc/elements/1.1/",
             "dcndl": "http://ndl.go.jp/dcndl/terms/",
         }
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=10.0)
-                if response.status_code == httpx.codes.OK:
-                    root = ET.fromstring(response.text)
-                    # Find the first <item> element
-                    item = root.find(".//item")
-                    if item is not None:
-                        title = item.findtext(
-                            "dc:title", default="", namespaces=namespaces
-                        )
-                        # dc:creator may contain birth year like "水野, 貴明, 1973-"
-                        creator_raw = item.findtext(
-                            "dc:creator", default="", namespaces=namespaces
-                        )
-                        # Clean up creator: remove birth year pattern
-                        authors = []
-                        if creator_raw:
-                            # Split by comma, take name parts, remove year patterns
-                            parts = [p.strip() for p in creator_raw.split(",")]
-                            name_parts = [
-                                p for p in parts if not re.match(r"^\d{4}-?", p)
-                            ]
-                            if name_parts:
-                                authors = ["".join(name_parts)]
-
-                        if title:
-                            return {
-                                "title": title,
-                                "description": "",
-                                "authors": authors,
-                            }
-        except Exception:
-            logger.exception("Error fetching metadata from NDL Search")
-        return {}
+        response = await self.http_client.get(
+            self.NDL_SEARCH_URL,
+            params={"isbn": isbn},
+            timeout=self.ndl_timeout_seconds,
+        )
+        response.raise_for_status()
+
+        root = ET.fromstring(response.text)
+        # Find the first <item> element
+        item = root.find(".//item")
+        if item is None:
+            return {}
+
+        title = item.findtext("dc:title", default="", namespaces=namespaces)
+        # dc:creator may contain birth year like "水野, 貴明, 1973-"
+        creator_raw = item.findtext("dc:creator", default="", namespaces=namespaces)
+        # Clean up creator: remove birth year pattern
+        authors = []
+        if creator_raw:
+            # Split by comma, take name parts, remove year patterns
+            parts = [p.strip() for p in creator_raw.split(",")]
+            name_parts = [p for p in parts if not re.match(r"^\d{4}-?", p)]
+            if name_parts:
+                authors = ["".join(name_parts)]
+
+        if not title:
+            return {}
+        return {
+            "title": title,
+            "description": "",
+            "authors": authors,
+        }
 
     async def _fetch_google_books_metadata(self, isbn: str) -> dict[str, Any]:
         """Fetch metadata from Google Books API (fallback)."""
-        url = f"https://www.googleapis.com/books/v1/volumes?q=isbn:{isbn}"
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url, timeout=10.0)
-                if response.status_code == httpx.codes.OK:
-                    data = response.json()
-                    if data.get("totalItems", 0) > 0:
-                        volume_info = data["items"][0]["volumeInfo"]
-                        return {
-                            "title": volume_info.get("title", ""),
-                            "description": volume_info.get("description", ""),
-                            "authors": volume_info.get("authors", []),
-                        }
-        except Exception:
-            logger.exception("Error fetching metadata from Google Books")
-        return {}
+        response = await self.http_client.get(
+            self.GOOGLE_BOOKS_URL,
+            params={"q": f"isbn:{isbn}"},
+            timeout=self.google_books_timeout_seconds,
+        )
+        response.raise_for_status()
+
+        data = response.json()
+        if data.get("totalItems", 0) == 0:
+            return {}
+
+        volume_info = data["items"][0]["volumeInfo"]
+        return {
+            "title": volume_info.get("title", ""),
+            "description": volume_info.get("description", ""),
+            "authors": volume_info.get("authors", []),
+        }
 
     async def generate_from_query(self, query: str) -> dict[str, Any]:
         """Generate TOC from query."""
@@ -170,12 +301,14 @@ class GeminiTOCGenerator(TOCGenerator):
         """
 
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=types.GenerateContentConfig(
-                    tools=[types.Tool(google_search=types.GoogleSearch())],
-                ),
+            response = await self.limiter.run(
+                lambda: self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=types.GenerateContentConfig(
+                        tools=[types.Tool(google_search=types.GoogleSearch())],
+                    ),
+                )
             )
 
             text = response.text
@@ -0,0 +1,98 @@
+"""Hedged composite of two search engines."""
+
+import asyncio
+import logging
+from typing import Any
+
+from src.domain.exceptions import SearchUnavailableError
+from src.domain.interfaces.search_engine import AsyncSearchEngine, SearchResult
+
+logger = logging.getLogger(__name__)
+
+
+class HedgedSearchEngine(AsyncSearchEngine):
+    """Searches the primary engine, hedging with the secondary when it is slow.
+
+    The secondary engine is started once the primary has not answered
+    within `hedge_delay_seconds` (about the primary's p95 latency), or as
+    soon as the primary fails; the first successful answer is returned and
+    the other search is cancelled. This caps the tail latency of the
+    primary at the hedge delay plus the secondary's latency, and a failure
+    of one engine no longer turns into an empty result.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncSearchEngine,
+        secondary: AsyncSearchEngine,
+        hedge_delay_seconds: float,
+    ) -> None:
+        """Initialize the hedged engine."""
+        self.primary = primary
+        self.secondary = secondary
+        self.hedge_delay_seconds = hedge_delay_seconds
+        self.hedges = 0
+        self.primary_wins = 0
+        self.secondary_wins = 0
+        self.failures = 0
+
+    async def search(
+        self, query: str, limit: int = 5, user_id: str | None = None
+    ) -> list[SearchResult]:
+        """Search, answering from whichever engine succeeds first."""
+        primary = asyncio.create_task(
+            self.primary.search(query, limit, user_id=user_id)
+        )
+        engines = {primary: "primary"}
+        try:
+            done, pending = await asyncio.wait(
+                engines, timeout=self.hedge_delay_seconds
+            )
+            while True:
+                for task in done:
+                    if task.exception() is None:
+                        self._record_win(engines[task])
+                        return task.result()
+                    logger.warning(
+                        "%s search engine failed",
+                        engines[task],
+                        exc_info=task.exception(),
+                    )
+                if len(engines) == 1:
+                    # The primary is slow or failed: hedge with the secondary
+                    self.hedges += 1
+                    secondary = asyncio.create_task(
+                        self.secondary.search(query, limit, user_id=user_id)
+                    )
+                    engines[secondary] = "secondary"
+                    pending.add(secondary)
+                if not pending:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+        finally:
+            for task in engines:
+                task.cancel()
+
+        self.failures += 1
+        msg = "Both search engines failed"
+        raise SearchUnavailableError(msg)
+
+    def _record_win(self, engine: str) -> None:
+        """Count which engine answered."""
+        if engine == "primary":
+            self.primary_wins += 1
+        else:
+            self.secondary_wins += 1
+            logger.info("Search answered by the secondary engine")
+
+    def stats(self) -> dict[str, Any]:
+        """Report how often the search was hedged and which engine answered."""
+        return {
+            "hedge_delay_seconds": self.hedge_delay_seconds,
+            "hedges": self.hedges,
+            "primary_wins": self.primary_wins,
+            "secondary_wins": self.secondary_wins,
+            "failures": self.failures,
+        }
@@ -0,0 +1,334 @@
+"""In-process search engine over book titles and TOCs."""
+
+import asyncio
+import heapq
+import logging
+import math
+import threading
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from src.domain.interfaces.book_indexer import BookIndexer
+from src.domain.interfaces.search_engine import AsyncSearchEngine, SearchResult
+from src.domain.models.book_master import BookMaster
+from src.domain.models.user_library import UserLibraryEntry
+from src.domain.ranking import bm25_idf, bm25_term_score
+from src.domain.text import ngram_tokens
+from src.infrastructure.firestore.book_master_repository import (
+    FirestoreBookMasterRepository,
+)
+from src.infrastructure.firestore.user_library_repository import (
+    FirestoreUserLibraryRepository,
+)
+from src.infrastructure.vertex.book_document import book_struct_data
+
+logger = logging.getLogger(__name__)
+
+
+class _Postings:
+    """Postings list of one term: ascending doc IDs and their term frequencies."""
+
+    __slots__ = ("doc_ids", "freqs")
+
+    def __init__(self) -> None:
+        self.doc_ids = array("I")
+        self.freqs = array("H")
+
+
+class LocalTOCSearchEngine(AsyncSearchEngine, BookIndexer):
+    """BM25 search over an in-memory inverted index of titles and TOCs.
+
+    Books are indexed once, whoever owns them, as character bigrams
+    (see ngram_tokens); each user's library is applied as a filter, like
+    the `user_ids` ACL of the shared Vertex AI index. Postings are
+    compact arrays, appended in doc ID order so they stay sorted.
+
+    Built from Firestore at startup and updated in-process on registration,
+    so it serves local development and acts as a fallback when Vertex AI
+    Search is unavailable. Each worker holds its own index: registrations
+    through other workers are picked up by the periodic `refresh`, which
+    only reads library entries added since the last one. Removals and
+    TOCs changed through other workers wait for the (rarer) `rebuild`.
+    """
+
+    # Title n-grams count this many times towards the term frequency
+    TITLE_WEIGHT = 2
+    _MAX_FREQ = 0xFFFF
+    # A refresh re-reads entries this much older than the last read, in
+    # case the clocks of the instances stamping added_at disagree
+    REFRESH_OVERLAP = timedelta(minutes=1)
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._postings: dict[str, _Postings] = {}
+        # Doc ID -> struct data of the indexed book (None once replaced)
+        self._docs: list[dict[str, Any] | None] = []
+        self._doc_lengths = array("I")
+        self._doc_ids: dict[str, int] = {}  # ISBN -> live doc ID
+        self._libraries: dict[str, set[str]] = defaultdict(set)  # User -> ISBNs
+        self._total_length = 0
+        # Library entries added after this were not read from Firestore yet
+        self._read_until: datetime | None = None
+        # In-process registrations made while a rebuild reads Firestore
+        self._during_rebuild: list[tuple[BookMaster, str]] | None = None
+        # Indexing and searches run on the threadpool
+        self._lock = threading.Lock()
+
+    def build(
+        self,
+        book_master_repo: FirestoreBookMasterRepository,
+        user_library_repo: FirestoreUserLibraryRepository,
+        page_size: int = 500,
+    ) -> None:
+        """Index the book of every library entry from Firestore (blocking).
+
+        Only owned books are read, each once, whatever its number of owners.
+        """
+        started = datetime.now(UTC)
+        entries = self._index_entries(
+            book_master_repo, user_library_repo.iter_all_pages(page_size=page_size)
+        )
+        with self._lock:
+            self._read_until = started
+        logger.info(
+            "Built local search index from %d library entries: %s",
+            entries,
+            self.stats(),
+        )
+
+    def refresh(
+        self,
+        book_master_repo: FirestoreBookMasterRepository,
+        user_library_repo: FirestoreUserLibraryRepository,
+        page_size: int = 500,
+    ) -> int:
+        """Index library entries added since the last build or refresh (blocking).
+
+        Returns:
+            The number of library entries read
+
+        """
+        started = datetime.now(UTC)
+        with self._lock:
+            read_until = self._read_until
+        added_after = None if read_until is None else read_until - self.REFRESH_OVERLAP
+        entries = self._index_entries(
+            book_master_repo, user_library_repo.iter_all_pages(added_after, page_size)
+        )
+        with self._lock:
+            self._read_until = started
+        return entries
+
+    def _index_entries(
+        self,
+        book_master_repo: FirestoreBookMasterRepository,
+        pages: Iterable[list[UserLibraryEntry]],
+    ) -> int:
+        """Index pages of library entries, reading only unindexed books."""
+        entries = 0
+        for page in pages:
+            with self._lock:
+                isbns = list(
+                    dict.fromkeys(e.isbn for e in page if e.isbn not in self._doc_ids)
+                )
+            books = {
+                book.isbn: book
+                for book in book_master_repo.find_many_by_isbn(isbns)
+                if book is not None
+            }
+            for entry in page:
+                book = books.get(entry.isbn)
+                if book is not None:
+                    self.index_book(book, entry.user_id)
+                else:
+                    self._add_owner(entry.isbn, entry.user_id)
+            entries += len(page)
+        return entries
+
+    def _add_owner(self, isbn: str, user_id: str) -> None:
+        """Add an indexed book to a user's library (a no-op otherwise)."""
+        with self._lock:
+            if isbn in self._doc_ids:
+                self._libraries[user_id].add(isbn)
+
+    def rebuild(
+        self,
+        book_master_repo: FirestoreBookMasterRepository,
+        user_library_repo: FirestoreUserLibraryRepository,
+        page_size: int = 500,
+    ) -> None:
+        """Build a fresh index from Firestore and swap it in (blocking).
+
+        Searches keep using the current index meanwhile. Books indexed
+        in-process during the build are applied to the fresh index too, in
+        case the build read Firestore before they were written.
+        """
+        with self._lock:
+            self._during_rebuild = []
+        fresh = LocalTOCSearchEngine()
+        try:
+            fresh.build(book_master_repo, user_library_repo, page_size)
+        except Exception:
+            with self._lock:
+                self._during_rebuild = None
+            raise
+
+        with self._lock:
+            for book, user_id in self._during_rebuild:
+                fresh.index_book(book, user_id)
+            self._during_rebuild = None
+            self._postings = fresh._postings
+            self._docs = fresh._docs
+            self._doc_lengths = fresh._doc_lengths
+            self._doc_ids = fresh._doc_ids
+            self._libraries = fresh._libraries
+            self._total_length = fresh._total_length
+            self._read_until = fresh._read_until
+
+    def index_book(self, book: BookMaster, user_id: str) -> None:
+        """Index a book for a user, re-indexing it if its content changed."""
+        struct_data = book_struct_data(book)
+        with self._lock:
+            if self._during_rebuild is not None:
+                self._during_rebuild.append((book, user_id))
+            self._libraries[user_id].add(book.isbn)
+
+            doc_id = self._doc_ids.get(book.isbn)
+            if doc_id is not None:
+                if self._docs[doc_id]["content_hash"] == struct_data["content_hash"]:
+                    return
+                self._remove_doc(doc_id)
+            self._add_doc(struct_data)
+
+    def _add_doc(self, struct_data: dict[str, Any]) -> None:
+        """Append a document and its postings (lock held)."""
+        doc_id = len(self._docs)
+        freqs = self._term_freqs(struct_data)
+        for term, freq in freqs.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = _Postings()
+            postings.doc_ids.append(doc_id)
+            postings.freqs.append(min(freq, self._MAX_FREQ))
+
+        length = sum(freqs.values())
+        self._docs.append(struct_data)
+        self._doc_lengths.append(length)
+        self._doc_ids[struct_data["isbn"]] = doc_id
+        self._total_length += length
+
+    def _remove_doc(self, doc_id: int) -> None:
+        """Drop a document from its postings (lock held).
+
+        The doc ID is not reused, so postings appended later stay sorted.
+        """
+        struct_data = self._docs[doc_id]
+        for term in self._term_freqs(struct_data):
+            postings = self._postings[term]
+            i = bisect_left(postings.doc_ids, doc_id)
+            del postings.doc_ids[i]
+            del postings.freqs[i]
+            if not postings.doc_ids:
+                del self._postings[term]
+
+        self._total_length -= self._doc_lengths[doc_id]
+        self._doc_lengths[doc_id] = 0
+        self._docs[doc_id] = None
+        del self._doc_ids[struct_data["isbn"]]
+
+    def _term_freqs(self, struct_data: dict[str, Any]) -> Counter[str]:
+        """Count the n-grams of a document, weighting the title."""
+        freqs = Counter(ngram_tokens(struct_data["toc_text"]))
+        for term in ngram_tokens(struct_data["title"]):
+            freqs[term] += self.TITLE_WEIGHT
+        return freqs
+
+    async def search(
+        self, query: str, limit: int = 5, user_id: str | None = None
+    ) -> list[SearchResult]:
+        """Search the index, optionally filtered to a user's library.
+
+        Scoring runs on the threadpool, so neither it nor waiting for the
+        lock (held by indexing and rebuild swaps) blocks the event loop.
+        """
+        query_terms = Counter(ngram_tokens(query))
+        if not query_terms:
+            return []
+        return await asyncio.to_thread(self._search, query_terms, limit, user_id)
+
+    def _search(
+        self, query_terms: Counter[str], limit: int, user_id: str | None
+    ) -> list[SearchResult]:
+        """Score the documents matching the query terms (blocking)."""
+        with self._lock:
+            doc_count = len(self._doc_ids)
+            if doc_count == 0:
+                return []
+            avg_length = self._total_length / doc_count
+            allowed = None
+            if user_id is not None:
+                allowed = {
+                    self._doc_ids[isbn]
+                    for isbn in self._libraries.get(user_id, ())
+                    if isbn in self._doc_ids
+                }
+                if not allowed:
+                    return []
+
+            scores: dict[int, float] = defaultdict(float)
+            for term, query_freq in query_terms.items():
+                postings = self._postings.get(term)
+                if postings is None:
+                    continue
+                idf = bm25_idf(doc_count, len(postings.doc_ids))
+                for doc_id, freq in self._matches(postings, allowed):
+                    scores[doc_id] += query_freq * bm25_term_score(
+                        freq, self._doc_lengths[doc_id], avg_length, idf
+                    )
+
+            top = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            results = []
+            for doc_id, score in top:
+                struct_data = self._docs[doc_id]
+                result = {**struct_data, "id": struct_data["isbn"], "score": score}
+                results.append(SearchResult(result))
+            return results
+
+    @staticmethod
+    def _matches(
+        postings: _Postings, allowed: set[int] | None
+    ) -> list[tuple[int, int]]:
+        """Get the (doc ID, frequency) pairs of a term, limited to `allowed`.
+
+        A small library is looked up in a long postings list by binary
+        search instead of scanning the whole list.
+        """
+        doc_ids, freqs = postings.doc_ids, postings.freqs
+        if allowed is None:
+            return list(zip(doc_ids, freqs, strict=True))
+        if len(allowed) * math.log2(len(doc_ids) + 1) < len(doc_ids):
+            matches = []
+            for doc_id in allowed:
+                i = bisect_left(doc_ids, doc_id)
+                if i < len(doc_ids) and doc_ids[i] == doc_id:
+                    matches.append((doc_id, freqs[i]))
+            return matches
+        return [
+            (doc_id, freq)
+            for doc_id, freq in zip(doc_ids, freqs, strict=True)
+            if doc_id in allowed
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """Report the size of the index."""
+        with self._lock:
+            return {
+                "books": len(self._doc_ids),
+                "users": len(self._libraries),
+                "terms": len(self._postings),
+                "postings": sum(len(p.doc_ids) for p in self._postings.values()),
+            }
@@ -0,0 +1,45 @@
+"""Shared helpers for building Vertex AI Search book documents."""
+
+import json
+from typing import Any
+
+from src.domain.models.book_master import BookMaster
+
+
+def book_struct_data(book: BookMaster) -> dict[str, Any]:
+    """Build the searchable struct data of a book (without owner fields)."""
+    return {
+        "title": book.title,
+        "isbn": book.isbn,
+        # Flatten TOC for search
+        # We want to make chapter titles searchable
+        "toc_text": "\n".join([f"{item.title}" for item in book.toc]),
+        # Add full JSON string of TOC if we want detailed retrieval
+        "toc_json": json.dumps(
+            [item.model_dump() for item in book.toc],
+            ensure_ascii=False,
+        ),
+        # Lets indexers skip writes when the content is unchanged
+        "content_hash": book.content_hash(),
+    }
+
+
+def bulk_documents(
+    book: BookMaster, user_ids: set[str], *, shared: bool
+) -> list[tuple[str, dict[str, Any]]]:
+    """Build the (document_id, struct_data) pairs to index a book for its owners.
+
+    Args:
+        book: The book master.
+        user_ids: Every user owning the book.
+        shared: True for one document per book with a `user_ids` ACL,
+            False for one document per (user, ISBN) pair.
+
+    """
+    struct_data = book_struct_data(book)
+    if shared:
+        return [(book.isbn, {**struct_data, "user_ids": sorted(user_ids)})]
+    return [
+        (f"{user_id}-{book.isbn}", {**struct_data, "user_id": user_id})
+        for user_id in sorted(user_ids)
+    ]
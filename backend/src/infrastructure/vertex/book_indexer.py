@@ -1,18 +1,24 @@
 """Vertex AI Book Indexer implementation."""
 
-import json
 import logging
 
+from google.api_core.exceptions import NotFound
 from google.cloud import discoveryengine_v1 as discoveryengine
 
 from src.domain.interfaces.book_indexer import BookIndexer
 from src.domain.models.book_master import BookMaster
+from src.infrastructure.vertex.book_document import book_struct_data
 
 logger = logging.getLogger(__name__)
 
 
 class VertexAIBookIndexer(BookIndexer):
-    """Indexer for books using Vertex AI Search."""
+    """Indexer for books using Vertex AI Search.
+
+    Stores one document per (user, ISBN) pair with a scalar `user_id` field.
+    Documents are upserted, and skipped entirely when their content hash
+    is unchanged.
+    """
 
     def __init__(
         self,
@@ -29,40 +35,39 @@ class VertexAIBookIndexer(BookIndexer):
             branch="default_branch",
         )
 
+    async def aclose(self) -> None:
+        """Close the underlying gRPC channel."""
+        self.client.transport.close()
+
     def index_book(self, book: BookMaster, user_id: str) -> None:
         """Index a book into Vertex AI Search for a specific user."""
-        try:
-            # Flatten TOC for search
-            # We want to make chapter titles searchable
-            toc_text = "\n".join([f"{item.title}" for item in book.toc])
+        # Generate deterministic document ID to allow multiple users for same book
+        # while ensuring idempotency for the same user.
+        document_id = f"{user_id}-{book.isbn}"
+        name = f"{self.parent}/documents/{document_id}"
+        struct_data = {**book_struct_data(book), "user_id": user_id}
 
-            # Generate deterministic document ID to allow multiple users for same book
-            # while ensuring idempotency for the same user.
-            document_id = f"{user_id}-{book.isbn}"
+        try:
+            existing = self.client.get_document(name=name)
+        except NotFound:
+            existing = None
 
-            document = discoveryengine.Document(
-                struct_data={
-                    "title": book.title,
-                    "isbn": book.isbn,
-                    "user_id": user_id,
-                    "toc_text": toc_text,
-                    # Add full JSON string of TOC if we want detailed retrieval
-                    "toc_json": json.dumps(
-                        [item.model_dump() for item in book.toc],
-                        ensure_ascii=False,
-                    ),
-                },
-            )
+        if (
+            existing is not None
+            and existing.struct_data.get("content_hash") == struct_data["content_hash"]
+        ):
+            logger.info("Book %s is unchanged; skipping indexing.", book.title)
+            return
 
-            request = discoveryengine.CreateDocumentRequest(
-                parent=self.parent,
-                document=document,
-                document_id=document_id,
+        # Upsert so TOC corrections reach documents that already exist
+        self.client.update_document(
+            request=discoveryengine.UpdateDocumentRequest(
+                document=discoveryengine.Document(
+                    name=name,
+                    id=document_id,
+                    struct_data=struct_data,
+                ),
+                allow_missing=True,
             )
-
-            self.client.create_document(request=request)
-            logger.info("Successfully indexed book %s to Vertex AI.", book.title)
-
-        except Exception:
-            logger.exception("Failed to index book to Vertex AI")
-            # Don't break the main flow for MVP
+        )
+        logger.info("Successfully indexed book %s to Vertex AI.", book.title)
@@ -0,0 +1,96 @@
+"""Destinations for bulk-indexed Vertex AI Search documents."""
+
+import json
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from google.cloud import discoveryengine_v1 as discoveryengine
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentBatchSink(ABC):
+    """Abstract destination for batches of (document_id, struct_data) pairs."""
+
+    @abstractmethod
+    def write_batch(self, batch_id: str, documents: list[tuple[str, dict]]) -> None:
+        """Write one batch of documents, raising if any document failed."""
+
+
+class VertexAIImportSink(DocumentBatchSink):
+    """Imports batches through ImportDocuments with an inline source.
+
+    Uses incremental reconciliation, so existing documents are replaced
+    and documents outside the batch are left untouched.
+    """
+
+    # Inline sources accept at most 100 documents per request
+    MAX_BATCH_SIZE = 100
+
+    def __init__(
+        self,
+        project_id: str,
+        data_store_id: str,
+        location: str = "global",
+        timeout_seconds: float = 600.0,
+        client: Any = None,  # noqa: ANN401
+    ) -> None:
+        """Initialize the sink (optionally with a stand-in DocumentService client)."""
+        self.client = client or discoveryengine.DocumentServiceClient()
+        self.parent = self.client.branch_path(
+            project=project_id,
+            location=location,
+            data_store=data_store_id,
+            branch="default_branch",
+        )
+        self.timeout_seconds = timeout_seconds
+
+    def write_batch(self, batch_id: str, documents: list[tuple[str, dict]]) -> None:
+        """Import one batch and wait for the long-running operation."""
+        request = discoveryengine.ImportDocumentsRequest(
+            parent=self.parent,
+            inline_source=discoveryengine.ImportDocumentsRequest.InlineSource(
+                documents=[
+                    discoveryengine.Document(id=document_id, struct_data=struct_data)
+                    for document_id, struct_data in documents
+                ],
+            ),
+            reconciliation_mode=(
+                discoveryengine.ImportDocumentsRequest.ReconciliationMode.INCREMENTAL
+            ),
+        )
+        operation = self.client.import_documents(request=request)
+        response = operation.result(timeout=self.timeout_seconds)
+
+        if response.error_samples:
+            msg = (
+                f"Batch {batch_id}: {len(response.error_samples)} document(s) "
+                f"failed to import, first error: {response.error_samples[0].message}"
+            )
+            raise RuntimeError(msg)
+
+
+class JsonlDirectorySink(DocumentBatchSink):
+    """Writes batches as JSONL files for a later GCS-based import.
+
+    Each line follows the Discovery Engine document format
+    ({"id": ..., "structData": {...}}).
+    """
+
+    def __init__(self, output_dir: Path) -> None:
+        """Initialize the sink, creating the output directory if needed."""
+        self.output_dir = output_dir
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+    def write_batch(self, batch_id: str, documents: list[tuple[str, dict]]) -> None:
+        """Write one batch to `<output_dir>/<batch_id>.jsonl`."""
+        path = self.output_dir / f"{batch_id}.jsonl"
+        tmp_path = path.with_suffix(".jsonl.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            for document_id, struct_data in documents:
+                line = {"id": document_id, "structData": struct_data}
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+        tmp_path.replace(path)
+        logger.debug("Wrote %d documents to %s", len(documents), path)
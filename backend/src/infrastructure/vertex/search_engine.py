@@ -4,25 +4,78 @@ import logging
 
 from google.cloud import discoveryengine_v1 as discoveryengine
 
-from src.domain.interfaces.search_engine import SearchEngine, SearchResult
+from src.domain.exceptions import SearchUnavailableError
+from src.domain.interfaces.search_engine import (
+    AsyncSearchEngine,
+    SearchResult,
+)
 
 logger = logging.getLogger(__name__)
 
 
-class VertexAISearchEngine(SearchEngine):
-    """Implementation of SearchEngine using Vertex AI Search."""
+def _search_request(
+    serving_config: str,
+    user_filter_field: str,
+    query: str,
+    limit: int,
+    user_id: str | None,
+) -> discoveryengine.SearchRequest:
+    """Build a search request, filtered to the user's documents if given."""
+    filter_str = f'{user_filter_field}: ANY("{user_id}")' if user_id else ""
+    return discoveryengine.SearchRequest(
+        serving_config=serving_config,
+        query=query,
+        page_size=limit,
+        filter=filter_str,
+    )
+
+
+def _search_results(response: discoveryengine.SearchResponse) -> list[SearchResult]:
+    """Convert the first page of a search response into search results."""
+    results: list[SearchResult] = []
+    for result in response.results:
+        data = {}
+        # Extract struct data
+        if hasattr(result.document, "derived_struct_data"):
+            data.update(result.document.derived_struct_data)
+
+        # If struct data is in 'struct_data' (for imported JSONL)
+        if hasattr(result.document, "struct_data"):
+            data.update(result.document.struct_data)
+
+        # Add ID
+        data["id"] = result.document.id
+        results.append(SearchResult(data))
+    return results
+
+
+class AsyncVertexAISearchEngine(AsyncSearchEngine):
+    """Implementation of AsyncSearchEngine using the async Vertex AI Search client.
+
+    The client's gRPC channel is bound to the event loop it is created on,
+    so the engine must be created from async code.
+    """
 
     def __init__(
         self,
         project_id: str,
         data_store_id: str,
         location: str = "global",
+        user_filter_field: str = "user_id",
+        timeout_seconds: float = 10.0,
     ) -> None:
-        """Initialize the Vertex AI Search engine."""
+        """Initialize the Vertex AI Search engine.
+
+        `user_filter_field` is the owner field to filter on: "user_id" for
+        per-user documents, "user_ids" for shared documents with an ACL.
+        `timeout_seconds` is the deadline of one search call.
+        """
         self.project_id = project_id
         self.data_store_id = data_store_id
         self.location = location
-        self.client = discoveryengine.SearchServiceClient()
+        self.user_filter_field = user_filter_field
+        self.timeout_seconds = timeout_seconds
+        self.client = discoveryengine.SearchServiceAsyncClient()
         self.serving_config = self.client.serving_config_path(
             project=project_id,
             location=location,
@@ -30,38 +83,25 @@ class VertexAISearchEngine(SearchEngine):
             serving_config="default_config",
         )
 
-    def search(
+    async def aclose(self) -> None:
+        """Close the underlying gRPC channel."""
+        await self.client.transport.close()
+
+    async def search(
         self, query: str, limit: int = 5, user_id: str | None = None
     ) -> list[SearchResult]:
         """Search documents in Vertex AI, optionally filtered by user."""
         try:
-            filter_str = f'user_id: ANY("{user_id}")' if user_id else ""
-
-            request = discoveryengine.SearchRequest(
-                serving_config=self.serving_config,
-                query=query,
-                page_size=limit,
-                filter=filter_str,
+            request = _search_request(
+                self.serving_config, self.user_filter_field, query, limit, user_id
             )
-            response = self.client.search(request)
-
-            results: list[SearchResult] = []
-            for result in response.results:
-                data = {}
-                # Extract struct data
-                if hasattr(result.document, "derived_struct_data"):
-                    data.update(result.document.derived_struct_data)
-
-                # If struct data is in 'struct_data' (for imported JSONL)
-                if hasattr(result.document, "struct_data"):
-                    data.update(result.document.struct_data)
-
-                # Add ID
-                data["id"] = result.document.id
-                results.append(SearchResult(data))
+            # Only the first page is read, so no further pages are fetched
+            response = await self.client.search(request, timeout=self.timeout_seconds)
+            results = _search_results(response)
 
-        except Exception:
+        except Exception as e:
             logger.exception("Vertex AI Search Error")
-            return []
+            msg = "Vertex AI Search failed"
+            raise SearchUnavailableError(msg) from e
         else:
             return results
@@ -0,0 +1,92 @@
+"""Vertex AI Book Indexer storing one shared document per book."""
+
+import logging
+
+from google.api_core.exceptions import NotFound
+from google.cloud import discoveryengine_v1 as discoveryengine
+
+from src.domain.interfaces.book_indexer import BookIndexer
+from src.domain.models.book_master import BookMaster
+from src.infrastructure.vertex.book_document import book_struct_data
+
+logger = logging.getLogger(__name__)
+
+
+class SharedVertexAIBookIndexer(BookIndexer):
+    """Indexer keeping a single Vertex AI Search document per ISBN.
+
+    Ownership is stored as a repeated `user_ids` field (the ACL), so a book
+    owned by many users is stored and embedded once. Registering a book
+    adds the user to the ACL of the existing document; nothing is written
+    when the user is already listed and the content hash is unchanged.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        data_store_id: str,
+        location: str = "global",
+    ) -> None:
+        """Initialize the shared Vertex AI Book Indexer."""
+        self.client = discoveryengine.DocumentServiceClient()
+        self.parent = self.client.branch_path(
+            project=project_id,
+            location=location,
+            data_store=data_store_id,
+            branch="default_branch",
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying gRPC channel."""
+        self.client.transport.close()
+
+    def document_name(self, isbn: str) -> str:
+        """Get the full resource name of the shared document for a book."""
+        return f"{self.parent}/documents/{isbn}"
+
+    def get_state(self, isbn: str) -> tuple[list[str], str | None]:
+        """Get the ACL and content hash of a book's shared document.
+
+        Returns:
+            Tuple of (user_ids, content_hash); ([], None) if there is no document
+
+        """
+        try:
+            existing = self.client.get_document(name=self.document_name(isbn))
+        except NotFound:
+            return [], None
+        return (
+            list(existing.struct_data.get("user_ids", [])),
+            existing.struct_data.get("content_hash"),
+        )
+
+    def write_document(self, book: BookMaster, user_ids: list[str]) -> None:
+        """Create or replace the shared document of a book."""
+        document = discoveryengine.Document(
+            name=self.document_name(book.isbn),
+            id=book.isbn,
+            struct_data={**book_struct_data(book), "user_ids": user_ids},
+        )
+        self.client.update_document(
+            request=discoveryengine.UpdateDocumentRequest(
+                document=document,
+                allow_missing=True,
+            )
+        )
+
+    def index_book(self, book: BookMaster, user_id: str) -> None:
+        """Index a book and add the user to its ACL."""
+        user_ids, content_hash = self.get_state(book.isbn)
+        if user_id in user_ids and content_hash == book.content_hash():
+            logger.info("Book %s is unchanged; skipping indexing.", book.title)
+            return
+
+        if user_id not in user_ids:
+            user_ids.append(user_id)
+
+        self.write_document(book, user_ids)
+        logger.info(
+            "Successfully indexed shared book %s (%d users) to Vertex AI.",
+            book.title,
+            len(user_ids),
+        )
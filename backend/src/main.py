@@ -1,27 +1,101 @@
 """Main application module."""
 
+import asyncio
+import contextlib
+import logging
 import os
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
 
 import uvicorn
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from firebase_admin import firestore
 
 from src.config import get_settings
+from src.domain.models.user import User
+from src.infrastructure.client_registry import ClientRegistry
+from src.infrastructure.firestore.book_master_repository import (
+    FirestoreBookMasterRepository,
+)
+from src.infrastructure.firestore.user_library_repository import (
+    FirestoreUserLibraryRepository,
+)
+from src.infrastructure.search.local_toc_search_engine import LocalTOCSearchEngine
 from src.presentation.api import books, search
+from src.presentation.api.deps import get_current_user
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+async def _refresh_local_index(engine: LocalTOCSearchEngine) -> None:
+    """Refresh the local search index periodically, rebuilding it now and then."""
+    db = firestore.client()
+    book_master_repo = FirestoreBookMasterRepository(db)
+    user_library_repo = FirestoreUserLibraryRepository(db)
+    last_rebuild = time.monotonic()
+    while True:
+        await asyncio.sleep(settings.local_search_refresh_seconds)
+        rebuild = (
+            settings.local_search_rebuild_seconds > 0
+            and time.monotonic() - last_rebuild >= settings.local_search_rebuild_seconds
+        )
+        try:
+            if rebuild:
+                await asyncio.to_thread(
+                    engine.rebuild, book_master_repo, user_library_repo
+                )
+                last_rebuild = time.monotonic()
+            else:
+                await asyncio.to_thread(
+                    engine.refresh, book_master_repo, user_library_repo
+                )
+        except Exception:
+            logger.exception("Failed to refresh the local search index")
+
 
-app = FastAPI(title="Personal Book Brain API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create shared infrastructure clients per worker and close them on shutdown."""
+    app.state.client_registry = ClientRegistry(settings)
+    local_search_engine = app.state.client_registry.local_search_engine()
+    refresh = None
+    if local_search_engine is not None:
+        db = firestore.client()
+        await asyncio.to_thread(
+            local_search_engine.build,
+            FirestoreBookMasterRepository(db),
+            FirestoreUserLibraryRepository(db),
+        )
+        if settings.local_search_refresh_seconds > 0:
+            refresh = asyncio.create_task(_refresh_local_index(local_search_engine))
+    try:
+        yield
+    finally:
+        if refresh is not None:
+            refresh.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresh
+        await app.state.client_registry.aclose()
+
+
+app = FastAPI(title="Personal Book Brain API", version="1.0.0", lifespan=lifespan)
 
 app.include_router(books.router)
 app.include_router(search.router)
 
 # CORS Setup
-settings = get_settings()
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[books.NEXT_CURSOR_HEADER, "ETag"],
 )
 
 
@@ -31,6 +105,22 @@ def read_root() -> dict[str, str]:
     return {"status": "ok", "service": "Personal Book Brain"}
 
 
+@app.get("/stats/clients")
+def client_stats(
+    request: Request, _user: Annotated[User, Depends(get_current_user)]
+) -> dict[str, Any]:
+    """Report open channels and reuse counts of the shared clients."""
+    return request.app.state.client_registry.stats()
+
+
+@app.get("/stats/caches")
+def cache_stats(
+    request: Request, _user: Annotated[User, Depends(get_current_user)]
+) -> dict[str, Any]:
+    """Report hit/miss and coalescing counters of the shared caches."""
+    return request.app.state.client_registry.cache_stats()
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", "8080"))
     uvicorn.run(app, host="0.0.0.0", port=port)  # noqa: S104
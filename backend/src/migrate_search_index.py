@@ -0,0 +1,122 @@
+"""Migrate per-user Vertex AI Search documents to shared per-book documents.
+
+Usage:
+    uv run python -m src.migrate_search_index [--dry-run] [--delete-legacy]
+
+Per-user documents ("{user_id}-{isbn}") are grouped by ISBN and converted
+into one shared document per book whose `user_ids` ACL lists every owner.
+The book content is taken from the Firestore book master. Legacy documents
+are only deleted with --delete-legacy, so the migration can be verified
+before switching VERTEX_INDEX_MODE to "shared".
+"""
+
+import argparse
+import logging
+from collections import defaultdict
+
+from firebase_admin import firestore
+
+from src.config import get_settings
+from src.infrastructure.firebase.setup import initialize_firebase
+from src.infrastructure.firestore.book_master_repository import (
+    FirestoreBookMasterRepository,
+)
+from src.infrastructure.vertex.shared_book_indexer import SharedVertexAIBookIndexer
+
+logger = logging.getLogger(__name__)
+
+
+def migrate(
+    indexer: SharedVertexAIBookIndexer,
+    book_master_repo: FirestoreBookMasterRepository,
+    *,
+    dry_run: bool = False,
+    delete_legacy: bool = False,
+) -> dict[str, int]:
+    """Convert per-user documents into shared documents.
+
+    Returns:
+        Counters of the migration run.
+
+    """
+    owners: dict[str, set[str]] = defaultdict(set)
+    legacy_names: dict[str, list[str]] = defaultdict(list)
+
+    # 1. Collect legacy per-user documents, grouped by ISBN
+    for document in indexer.client.list_documents(parent=indexer.parent):
+        data = document.struct_data
+        if "user_ids" in data:
+            continue  # Already a shared document
+
+        user_id, isbn = data.get("user_id"), data.get("isbn")
+        if not user_id or not isbn:
+            logger.warning("Skipping document without owner/ISBN: %s", document.name)
+            continue
+
+        owners[isbn].add(user_id)
+        legacy_names[isbn].append(document.name)
+
+    counters = {"books": 0, "legacy_documents": 0, "deleted": 0, "missing_master": 0}
+
+    # 2. Write one shared document per book
+    isbns = sorted(owners)
+    book_masters = book_master_repo.find_many_by_isbn(isbns)
+    for isbn, book_master in zip(isbns, book_masters, strict=True):
+        if book_master is None:
+            logger.warning("No book master for %s; keeping legacy documents", isbn)
+            counters["missing_master"] += 1
+            continue
+
+        existing_user_ids, _ = indexer.get_state(isbn)
+        user_ids = sorted(set(existing_user_ids) | owners[isbn])
+        counters["books"] += 1
+        counters["legacy_documents"] += len(legacy_names[isbn])
+        if dry_run:
+            logger.info("[dry-run] %s: %d users", isbn, len(user_ids))
+            continue
+
+        indexer.write_document(book_master, user_ids)
+
+        if delete_legacy:
+            for name in legacy_names[isbn]:
+                indexer.client.delete_document(name=name)
+                counters["deleted"] += 1
+
+    return counters
+
+
+def main() -> None:
+    """Run the migration from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Only report what would be migrated",
+    )
+    parser.add_argument(
+        "--delete-legacy",
+        action="store_true",
+        help="Delete per-user documents after their shared document is written",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    settings = get_settings()
+    initialize_firebase()
+
+    indexer = SharedVertexAIBookIndexer(
+        settings.google_cloud_project,
+        settings.vertex_ai_data_store_id,
+        settings.vertex_ai_location,
+    )
+    counters = migrate(
+        indexer,
+        FirestoreBookMasterRepository(firestore.client()),
+        dry_run=args.dry_run,
+        delete_legacy=args.delete_legacy,
+    )
+    logger.info("Migration finished: %s", counters)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,78 +1,153 @@
 """API endpoints for managing books."""
 
+import base64
+import csv
+import io
+import json
 import logging
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
-from firebase_admin import firestore
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+    Response,
+    UploadFile,
+)
+from firebase_admin import firestore, firestore_async
 from pydantic import BaseModel, ValidationError
 
 from src.application.services.fetch_book_metadata_service import (
     FetchBookMetadataUseCase,
 )
+from src.application.services.get_book_toc_service import GetBookTOCUseCase
+from src.application.services.import_books_service import (
+    GetImportJobUseCase,
+    ImportBooksUseCase,
+)
 from src.application.services.list_books_service import (
     ListBooksUseCase,
 )
 from src.application.services.register_book_service import RegisterBookUseCase
 from src.config import get_settings
-from src.domain.models.book_master import TableOfContentsItem
+from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.domain.models.import_job import ImportJob, ImportJobStatus
 from src.domain.models.user import User
-from src.infrastructure.firestore.book_master_repository import (
-    FirestoreBookMasterRepository,
+from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.client_registry import ClientRegistry
+from src.infrastructure.firestore.async_book_master_repository import (
+    AsyncFirestoreBookMasterRepository,
+)
+from src.infrastructure.firestore.async_user_library_repository import (
+    AsyncFirestoreUserLibraryRepository,
+)
+from src.infrastructure.firestore.book_registration_repository import (
+    AsyncFirestoreBookRegistrationRepository,
 )
-from src.infrastructure.firestore.user_library_repository import (
-    FirestoreUserLibraryRepository,
+from src.infrastructure.firestore.bulk_book_writer import FirestoreBulkBookWriter
+from src.infrastructure.firestore.import_job_repository import (
+    FirestoreImportJobRepository,
 )
-from src.infrastructure.gemini.toc_generator import GeminiTOCGenerator
-from src.infrastructure.vertex.book_indexer import VertexAIBookIndexer
-from src.presentation.api.deps import get_current_user
+from src.infrastructure.firestore.library_summary_repository import (
+    AsyncFirestoreLibrarySummaryRepository,
+)
+from src.presentation.api.conditional import (
+    etag_matches,
+    make_etag,
+    not_modified,
+    set_etag,
+)
+from src.presentation.api.deps import get_client_registry, get_current_user
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/books", tags=["books"])
 
+# Response header carrying the cursor of the next page of GET /api/books
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+MAX_PAGE_SIZE = 500
+
 
-def get_register_use_case() -> RegisterBookUseCase:
+def get_register_use_case(
+    registry: Annotated[ClientRegistry, Depends(get_client_registry)],
+) -> RegisterBookUseCase:
     """Dependency injection for RegisterBookUseCase."""
-    settings = get_settings()
-    db = firestore.client()
-
-    book_master_repo = FirestoreBookMasterRepository(db)
-    user_library_repo = FirestoreUserLibraryRepository(db)
-    book_indexer = VertexAIBookIndexer(
-        settings.google_cloud_project,
-        settings.vertex_ai_data_store_id,
-        settings.vertex_ai_location,
-    )
+    db = firestore_async.client()
 
-    return RegisterBookUseCase(
-        book_master_repo,
-        user_library_repo,
-        book_indexer,
-        db,
+    registration_repo = AsyncFirestoreBookRegistrationRepository(
+        db, get_settings().library_summary_shards
     )
 
+    return RegisterBookUseCase(registration_repo, registry.local_search_engine())
+
 
-def get_fetch_metadata_use_case() -> FetchBookMetadataUseCase:
+def get_fetch_metadata_use_case(
+    registry: Annotated[ClientRegistry, Depends(get_client_registry)],
+) -> FetchBookMetadataUseCase:
     """Dependency injection for FetchBookMetadataUseCase."""
-    settings = get_settings()
-    db = firestore.client()
-    book_master_repo = FirestoreBookMasterRepository(db)
-    toc_gen = GeminiTOCGenerator(
-        project_id=settings.google_cloud_project,
-        location=settings.gemini_location,
-        model=settings.gemini_toc_model,
+    db = firestore_async.client()
+    book_master_repo = AsyncFirestoreBookMasterRepository(db)
+    toc_gen = registry.toc_generator()
+    preview_cache = registry.toc_preview_cache()
+    return FetchBookMetadataUseCase(book_master_repo, toc_gen, preview_cache, db)
+
+
+def get_import_use_case(
+    registry: Annotated[ClientRegistry, Depends(get_client_registry)],
+    metadata_use_case: Annotated[
+        FetchBookMetadataUseCase, Depends(get_fetch_metadata_use_case)
+    ],
+) -> ImportBooksUseCase:
+    """Dependency injection for ImportBooksUseCase."""
+    db = firestore_async.client()
+    settings = registry.settings
+    return ImportBooksUseCase(
+        FirestoreImportJobRepository(db),
+        AsyncFirestoreBookMasterRepository(db),
+        metadata_use_case,
+        # BulkWriter is only available on the sync client
+        FirestoreBulkBookWriter(firestore.client(), settings.library_summary_shards),
+        max_isbns=settings.book_import_max_isbns,
+        max_concurrency=settings.book_import_max_concurrency,
+        generations_per_minute=settings.book_import_generations_per_minute,
+        flush_size=settings.book_import_flush_size,
+        heartbeat_seconds=settings.book_import_heartbeat_seconds,
+        local_indexer=registry.local_search_engine(),
+    )
+
+
+def get_import_job_use_case() -> GetImportJobUseCase:
+    """Dependency injection for GetImportJobUseCase."""
+    return GetImportJobUseCase(
+        FirestoreImportJobRepository(firestore_async.client()),
+        stale_after_seconds=get_settings().book_import_stale_after_seconds,
     )
-    return FetchBookMetadataUseCase(book_master_repo, toc_gen, db)
+
+
+def get_book_toc_use_case() -> GetBookTOCUseCase:
+    """Dependency injection for GetBookTOCUseCase."""
+    db = firestore_async.client()
+    summary_shards = get_settings().library_summary_shards
+    book_master_repo = AsyncFirestoreBookMasterRepository(db)
+    user_library_repo = AsyncFirestoreUserLibraryRepository(db, summary_shards)
+    library_summary_repo = AsyncFirestoreLibrarySummaryRepository(db, summary_shards)
+    return GetBookTOCUseCase(book_master_repo, user_library_repo, library_summary_repo)
 
 
 def get_list_books_use_case() -> ListBooksUseCase:
     """Dependency injection for ListBooksUseCase."""
-    db = firestore.client()
-    book_master_repo = FirestoreBookMasterRepository(db)
-    user_library_repo = FirestoreUserLibraryRepository(db)
-    return ListBooksUseCase(book_master_repo, user_library_repo)
+    db = firestore_async.client()
+    summary_shards = get_settings().library_summary_shards
+    book_master_repo = AsyncFirestoreBookMasterRepository(db)
+    user_library_repo = AsyncFirestoreUserLibraryRepository(db, summary_shards)
+    library_summary_repo = AsyncFirestoreLibrarySummaryRepository(db, summary_shards)
+    return ListBooksUseCase(book_master_repo, user_library_repo, library_summary_repo)
 
 
 class BookPreviewRequest(BaseModel):
@@ -91,12 +166,51 @@ class BookRegisterRequest(BaseModel):
 
 
 class BookResponse(BaseModel):
-    """Response model for a book with user library info."""
+    """Response model for a book with user library info.
+
+    Fields other than isbn are None when left out by a `fields` projection.
+    """
 
     isbn: str
-    title: str
-    toc: list[TableOfContentsItem]
-    added_at: datetime
+    title: str | None = None
+    toc: list[TableOfContentsItem] | None = None
+    chapter_count: int | None = None
+    added_at: datetime | None = None
+
+
+class ImportJobResponse(BaseModel):
+    """Response model for the progress of a bulk import."""
+
+    job_id: str
+    status: ImportJobStatus
+    total: int
+    processed: int
+    registered: int
+    linked: int
+    failed_isbns: list[str]
+    error: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+    books_per_minute: float
+
+    @classmethod
+    def from_job(cls, job: ImportJob) -> "ImportJobResponse":
+        """Build the response from an import job."""
+        return cls(
+            job_id=job.job_id,
+            status=job.status,
+            total=job.total,
+            processed=job.processed,
+            registered=job.registered,
+            linked=job.linked,
+            failed_isbns=job.failed_isbns,
+            error=job.error,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            books_per_minute=round(job.books_per_minute(), 1),
+        )
 
 
 class BookPreviewResponse(BaseModel):
@@ -140,7 +254,6 @@ async def preview_book(
 @router.post("")
 async def create_book(
     request: BookRegisterRequest,
-    background_tasks: BackgroundTasks,
     _user: Annotated[User, Depends(get_current_user)],
     use_case: Annotated[RegisterBookUseCase, Depends(get_register_use_case)],
 ) -> BookResponse:
@@ -156,16 +269,12 @@ async def create_book(
             toc=toc_dict,
         )
 
-        # Background Indexing
-        background_tasks.add_task(
-            use_case.book_indexer.index_book,
-            book=book_master,
-            user_id=_user.uid,
-        )
+        # Indexing is picked up from the outbox by the index worker
         return BookResponse(
             isbn=book_master.isbn,
             title=book_master.title,
             toc=book_master.toc,
+            chapter_count=book_master.get_chapter_count(),
             added_at=library_entry.added_at,
         )
     except (ValueError, ValidationError):
@@ -180,19 +289,201 @@ async def create_book(
         ) from e
 
 
-@router.get("")
-def list_books(
+def _encode_cursor(entry: UserLibraryEntry) -> str:
+    """Encode the last entry of a page as an opaque cursor."""
+    payload = {"added_at": entry.added_at.isoformat(), "isbn": entry.isbn}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _decode_cursor(cursor: str, user_id: str) -> UserLibraryEntry:
+    """Decode a cursor back into the entry the next page starts after."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return UserLibraryEntry(
+            user_id=user_id,
+            isbn=payload["isbn"],
+            added_at=datetime.fromisoformat(payload["added_at"]),
+        )
+    except (ValueError, TypeError, KeyError, ValidationError):
+        raise HTTPException(
+            status_code=400, detail="ページ指定（cursor）が正しくありません。"
+        ) from None
+
+
+@router.get("", response_model_exclude_none=True)
+async def list_books(  # noqa: PLR0913
+    response: Response,
     user: Annotated[User, Depends(get_current_user)],
     use_case: Annotated[ListBooksUseCase, Depends(get_list_books_use_case)],
+    limit: Annotated[int | None, Query(ge=1, le=MAX_PAGE_SIZE)] = None,
+    cursor: str | None = None,
+    fields: str | None = None,
+    if_none_match: Annotated[str | None, Header()] = None,
 ) -> list[BookResponse]:
-    """List all books belonging to the authenticated user."""
-    books_with_info = use_case.execute(user)
+    """List books belonging to the authenticated user, newest first.
+
+    Without `limit` the whole library is returned. With it, the cursor of
+    the next page (if any) is returned in the X-Next-Cursor header.
+    `fields` is a comma separated subset of the response fields; list
+    views can leave out "toc" and fetch it per book from /{isbn}/toc.
+    Without "toc" the listing is served from the library summary, a
+    single document read instead of the library plus every book master.
+
+    The ETag derives from the user's library version, so a matching
+    If-None-Match is answered with 304 after reading only that counter.
+    """
+    requested = (
+        {field.strip() for field in fields.split(",")}
+        if fields
+        else set(BookResponse.model_fields)
+    )
+    if not requested <= set(BookResponse.model_fields):
+        raise HTTPException(
+            status_code=400, detail="指定できない項目（fields）が含まれています。"
+        )
+
+    etag = make_etag(
+        await use_case.library_version(user), limit, cursor, sorted(requested)
+    )
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+
+    page = await use_case.execute(
+        user,
+        limit,
+        _decode_cursor(cursor, user.uid) if cursor else None,
+        include_toc="toc" in requested,
+    )
+    if page.next_start_after is not None:
+        response.headers[NEXT_CURSOR_HEADER] = _encode_cursor(page.next_start_after)
+
     return [
         BookResponse(
             isbn=item.book.isbn,
-            title=item.book.title,
-            toc=item.book.toc,
-            added_at=item.library_entry.added_at,
+            title=item.book.title if "title" in requested else None,
+            toc=item.book.toc if "toc" in requested else None,
+            chapter_count=(
+                item.chapter_count if "chapter_count" in requested else None
+            ),
+            added_at=(item.library_entry.added_at if "added_at" in requested else None),
         )
-        for item in books_with_info
+        for item in page.items
     ]
+
+
+@router.get("/{isbn}/toc")
+async def get_book_toc(
+    isbn: str,
+    response: Response,
+    user: Annotated[User, Depends(get_current_user)],
+    use_case: Annotated[GetBookTOCUseCase, Depends(get_book_toc_use_case)],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> list[TableOfContentsItem]:
+    """Get the TOC of a book in the authenticated user's library.
+
+    The ETag derives from the book's updated_at, which only moves when its
+    content changes (re-registering an unchanged book keeps it). A
+    matching If-None-Match is answered with 304 from the library summary,
+    without reading the book master.
+    """
+    normalized_isbn = BookMaster.normalize_isbn(isbn)
+    if if_none_match:
+        updated_at = await use_case.find_updated_at(user, normalized_isbn)
+        if updated_at is not None:
+            etag = make_etag(normalized_isbn, updated_at.isoformat())
+            if etag_matches(if_none_match, etag):
+                return not_modified(etag)
+
+    book_master = await use_case.execute(user, normalized_isbn)
+    if book_master is None:
+        raise HTTPException(status_code=404, detail="書籍が見つかりませんでした。")
+    set_etag(response, make_etag(normalized_isbn, book_master.updated_at.isoformat()))
+    return book_master.toc
+
+
+def _isbns_from_csv(text: str) -> list[str]:
+    """Extract ISBNs from CSV text.
+
+    Uses the "isbn" column when there is a header with one, otherwise the
+    first cell of each row that looks like an ISBN.
+    """
+    rows = list(csv.reader(io.StringIO(text)))
+    if not rows:
+        return []
+
+    header = [cell.strip().lower() for cell in rows[0]]
+    if "isbn" in header:
+        column = header.index("isbn")
+        return [row[column] for row in rows[1:] if len(row) > column]
+
+    isbns = []
+    for row in rows:
+        for cell in row:
+            normalized = cell.replace("-", "").replace(" ", "")
+            if len(normalized) in {10, 13} and normalized.isdigit():
+                isbns.append(cell)
+                break
+    return isbns
+
+
+@router.post("/import", status_code=202)
+async def import_books(
+    background_tasks: BackgroundTasks,
+    user: Annotated[User, Depends(get_current_user)],
+    use_case: Annotated[ImportBooksUseCase, Depends(get_import_use_case)],
+    isbns: Annotated[str | None, Form()] = None,
+    file: Annotated[UploadFile | None, File()] = None,
+) -> ImportJobResponse:
+    """Start a bulk import from an ISBN list and/or a CSV file.
+
+    `isbns` is a comma or newline separated list. Progress is available
+    from GET /api/books/import/{job_id}.
+
+    The import runs as a FastAPI background task in this request's
+    process, not on a durable queue: if the instance restarts or scales
+    in, the run is lost. Its heartbeats stop, so polling reports the job
+    as failed once it is stale, but nothing resumes it; the user has to
+    start the import again (books already imported are only linked).
+    """
+    requested = isbns.replace(",", "\n").split() if isbns else []
+    if file is not None:
+        content = await file.read()
+        try:
+            requested += _isbns_from_csv(content.decode("utf-8-sig"))
+        except (UnicodeDecodeError, csv.Error):
+            raise HTTPException(
+                status_code=400,
+                detail="CSVファイルを読み込めませんでした。UTF-8形式のCSVを指定してください。",
+            ) from None
+
+    try:
+        job = await use_case.start(user.uid, requested)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"インポートするISBNを確認してください（最大{use_case.max_isbns}件）。",
+        ) from e
+
+    background_tasks.add_task(use_case.run, job)
+    return ImportJobResponse.from_job(job)
+
+
+@router.get("/import/{job_id}")
+async def get_import_job(
+    job_id: str,
+    user: Annotated[User, Depends(get_current_user)],
+    use_case: Annotated[GetImportJobUseCase, Depends(get_import_job_use_case)],
+) -> ImportJobResponse:
+    """Get the progress of a bulk import.
+
+    A job whose run was lost with its instance (see POST /import) is
+    reported as failed once its heartbeat is older than
+    `book_import_stale_after_seconds`.
+    """
+    job = await use_case.find(user.uid, job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=404, detail="インポート処理が見つかりませんでした。"
+        )
+    return ImportJobResponse.from_job(job)
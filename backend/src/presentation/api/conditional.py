@@ -0,0 +1,35 @@
+"""Helpers for conditional GET (ETag / If-None-Match)."""
+
+import hashlib
+
+from fastapi import Response
+
+# Responses are per user: let the browser cache them, but always revalidate
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: object) -> str:
+    """Build a strong ETag from the values a response depends on."""
+    payload = "\x1f".join(str(part) for part in parts)
+    return f'"{hashlib.sha256(payload.encode()).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 response for a matching ETag."""
+    return Response(
+        status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach the ETag and revalidation headers to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -2,13 +2,13 @@
 
 from typing import Annotated
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.domain.exceptions import AuthenticationError
 from src.domain.interfaces.auth_service import AuthService
 from src.domain.models.user import User
-from src.infrastructure.firebase.auth_service import FirebaseAuthService
+from src.infrastructure.client_registry import ClientRegistry
 from src.infrastructure.firebase.setup import initialize_firebase
 
 # Ensure firebase is initialized
@@ -17,14 +17,27 @@ initialize_firebase()
 security = HTTPBearer()
 
 
-def get_auth_service() -> AuthService:
+def get_client_registry(request: Request) -> ClientRegistry:
+    """Provide the process-wide client registry created in the app lifespan.
+
+    Returns:
+        ClientRegistry: The shared registry of infrastructure clients.
+
+    """
+    return request.app.state.client_registry
+
+
+def get_auth_service(
+    registry: Annotated[ClientRegistry, Depends(get_client_registry)],
+) -> AuthService:
     """Provide the authentication service implementation.
 
     Returns:
-        AuthService: The authentication service instance (Firebase implementation).
+        AuthService: The shared authentication service instance
+            (Firebase implementation with a verified-token cache).
 
     """
-    return FirebaseAuthService()
+    return registry.auth_service()
 
 
 def get_current_user(
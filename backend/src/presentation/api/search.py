@@ -1,40 +1,55 @@
 """API endpoints for search and report generation."""
 
+import json
 import logging
-from typing import Annotated
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from firebase_admin import firestore_async
 from pydantic import BaseModel
 
+from src.application.services.chapter_selector import ChapterSelector
 from src.application.services.search_report_service import SearchReportUseCase
-from src.config import get_settings
+from src.domain.exceptions import SearchUnavailableError
 from src.domain.models.search_report import SearchReport
 from src.domain.models.user import User
-from src.infrastructure.gemini.report_generator import GeminiReportGenerator
-from src.infrastructure.vertex.search_engine import VertexAISearchEngine
-from src.presentation.api.deps import get_current_user
+from src.infrastructure.client_registry import ClientRegistry
+from src.infrastructure.firestore.async_user_library_repository import (
+    AsyncFirestoreUserLibraryRepository,
+)
+from src.presentation.api.deps import get_client_registry, get_current_user
 
 router = APIRouter(prefix="/api/search", tags=["search"])
 
 logger = logging.getLogger(__name__)
 
 
-def get_search_use_case() -> SearchReportUseCase:
-    """Dependency injection for SearchReportUseCase."""
-    settings = get_settings()
+async def get_search_use_case(
+    registry: Annotated[ClientRegistry, Depends(get_client_registry)],
+) -> SearchReportUseCase:
+    """Dependency injection for SearchReportUseCase.
 
-    search_engine = VertexAISearchEngine(
-        settings.google_cloud_project,
-        settings.vertex_ai_data_store_id,
-        settings.vertex_ai_location,
-    )
-    report_generator = GeminiReportGenerator(
-        settings.google_cloud_project,
-        settings.gemini_location,
-        settings.gemini_report_model,
+    Async so the search engine's gRPC channel is created on the event loop.
+    """
+    return SearchReportUseCase(
+        registry.search_engine(),
+        registry.report_generator(),
+        registry.search_report_cache(),
+        AsyncFirestoreUserLibraryRepository(firestore_async.client()),
+        ChapterSelector(
+            chapters_per_book=registry.settings.report_chapters_per_book,
+            tokens_per_book=registry.settings.report_toc_tokens_per_book,
+        ),
     )
 
-    return SearchReportUseCase(search_engine, report_generator)
+
+def _sse_event(event: str, data: Any) -> str:  # noqa: ANN401
+    """Format one Server-Sent Events message."""
+    payload = json.dumps(jsonable_encoder(data), ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
 
 
 class SearchResponse(BaseModel):
@@ -47,7 +62,7 @@ class SearchResponse(BaseModel):
 
 
 @router.get("")
-def search_and_report(
+async def search_and_report(
     q: Annotated[str, Query(..., description="Search query")],
     _user: Annotated[User, Depends(get_current_user)],
     use_case: Annotated[SearchReportUseCase, Depends(get_search_use_case)],
@@ -55,10 +70,50 @@ def search_and_report(
 ) -> dict:
     """Search for books and generate a summary report."""
     try:
-        return use_case.execute(q, limit, user_id=_user.uid)
+        return await use_case.execute(q, limit, user_id=_user.uid)
+    except SearchUnavailableError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="検索サービスが一時的に利用できません。しばらく時間を置いてから再度お試しください。",
+        ) from e
     except Exception as e:
         logger.exception("Search failed for query: %s", q)
         raise HTTPException(
             status_code=500,
             detail="検索レポートの生成中にエラーが発生しました。しばらく時間を置いてから再度お試しください。",
         ) from e
+
+
+@router.get("/stream")
+async def stream_search_report(
+    q: Annotated[str, Query(..., description="Search query")],
+    _user: Annotated[User, Depends(get_current_user)],
+    use_case: Annotated[SearchReportUseCase, Depends(get_search_use_case)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> StreamingResponse:
+    """Search for books and stream the report as Server-Sent Events.
+
+    Events: "search_results" once the search returns, one "recommendation"
+    per recommended book as Gemini produces it, then "done". A failure
+    after the stream started is reported as an "error" event.
+    """
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event, data in use_case.stream(q, limit, user_id=_user.uid):
+                yield _sse_event(event, data)
+        except Exception:
+            logger.exception("Search stream failed for query: %s", q)
+            yield _sse_event(
+                "error",
+                {
+                    "detail": "検索レポートの生成中にエラーが発生しました。しばらく時間を置いてから再度お試しください。"
+                },
+            )
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # Keep proxies (e.g. nginx) from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
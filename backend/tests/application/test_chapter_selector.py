@@ -0,0 +1,124 @@
+"""Tests of ChapterSelector, measured on a fixture corpus of large TOCs."""
+
+from src.application.services.chapter_selector import ChapterSelector, estimate_tokens
+from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.infrastructure.gemini.report_generator import GeminiReportGenerator
+from src.infrastructure.vertex.book_document import book_struct_data
+
+SECTIONS = ["概要", "基本", "仕組み", "設計", "実装", "テスト", "運用", "事例", "演習"]
+
+# Title -> chapters of each part; every chapter gets the sections above,
+# and each section a few subsections, for TOCs of several hundred entries
+CORPUS = {
+    "9784000000001": (
+        "実践Pythonプログラミング",
+        [
+            ["変数と型", "制御構文", "関数", "クラス", "モジュール"],
+            ["非同期処理", "並行処理とスレッド", "型ヒント", "デコレータ"],
+            ["データベース接続", "Webアプリケーション", "パッケージ配布"],
+        ],
+    ),
+    "9784000000002": (
+        "機械学習の基礎と応用",
+        [
+            ["線形回帰", "ロジスティック回帰", "決定木", "サポートベクターマシン"],
+            ["ニューラルネットワーク", "畳み込みニューラルネットワーク", "強化学習"],
+            ["特徴量エンジニアリング", "モデル評価", "ハイパーパラメータ探索"],
+        ],
+    ),
+    "9784000000003": (
+        "分散システム設計",
+        [
+            ["レプリケーション", "パーティショニング", "トランザクション"],
+            ["合意アルゴリズム", "障害検知", "キャッシュ戦略"],
+            ["メッセージキュー", "ストリーム処理", "監視と可観測性"],
+        ],
+    ),
+}
+
+# Query -> chapters the report should be able to cite
+QUERIES = {
+    "非同期処理": ["非同期処理"],
+    "強化学習": ["強化学習"],
+    "キャッシュ戦略": ["キャッシュ戦略"],
+    "トランザクション": ["トランザクション"],
+}
+
+
+def make_book(isbn: str, title: str, parts: list[list[str]]) -> BookMaster:
+    """Build a book with parts, chapters, sections and subsections."""
+    toc = []
+    for part_number, chapters in enumerate(parts, 1):
+        toc.append(TableOfContentsItem(title=f"第{part_number}部", level=1))
+        for chapter in chapters:
+            toc.append(TableOfContentsItem(title=chapter, level=2))
+            for section in SECTIONS:
+                toc.append(TableOfContentsItem(title=section, level=3))
+                toc.extend(
+                    TableOfContentsItem(title=f"{section}の例{i}", level=3)
+                    for i in range(1, 3)
+                )
+    return BookMaster(isbn=isbn, title=title, toc=toc)
+
+
+def search_results() -> list[dict]:
+    """Index documents of the corpus, as search engines return them."""
+    return [
+        book_struct_data(make_book(isbn, title, parts))
+        for isbn, (title, parts) in CORPUS.items()
+    ]
+
+
+def prompt_tokens(results: list[dict]) -> float:
+    """Estimate the tokens of the search results part of the report prompt."""
+    generator = GeminiReportGenerator(project_id="test-project")
+    return estimate_tokens(generator._format_search_results(results))  # noqa: SLF001
+
+
+def test_selected_chapters_cut_the_prompt_and_keep_the_relevant_ones() -> None:
+    """Measures token savings and relevance on the fixture corpus."""
+    results = search_results()
+    assert all(len(result["toc_text"].splitlines()) > 250 for result in results)
+    selector = ChapterSelector(chapters_per_book=5, tokens_per_book=400)
+    full_tokens = prompt_tokens(results)
+
+    for query, relevant in QUERIES.items():
+        selected = selector.select(query, results)
+        selected_tokens = prompt_tokens(selected)
+
+        # Every book stays within its budget, and the prompt shrinks 5x+
+        for result in selected:
+            assert estimate_tokens(result["toc_text"]) <= selector.tokens_per_book
+        assert selected_tokens * 5 < full_tokens
+        # The chapters answering the query survive the cut
+        lines = {
+            line.strip()
+            for result in selected
+            for line in result["toc_text"].splitlines()
+        }
+        assert set(relevant) <= lines, query
+
+
+def test_book_without_a_match_keeps_an_overview() -> None:
+    """Top-level chapters stand in for the TOC when nothing matches."""
+    result = search_results()[0]
+
+    (selected,) = ChapterSelector().select("天体観測", [result])
+
+    assert selected["toc_text"].splitlines() == [
+        "第1部",
+        "…",
+        "第2部",
+        "…",
+        "第3部",
+        "…",
+    ]
+
+
+def test_ancestors_are_kept_with_a_matching_entry() -> None:
+    """A matching chapter is shown under its part, in TOC order."""
+    result = search_results()[0]
+
+    (selected,) = ChapterSelector(chapters_per_book=1).select("型ヒント", [result])
+
+    assert selected["toc_text"].splitlines() == ["…", "第2部", "…", "  型ヒント", "…"]
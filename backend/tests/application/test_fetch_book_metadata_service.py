@@ -0,0 +1,102 @@
+"""Tests of FetchBookMetadataUseCase's preview cache."""
+
+import asyncio
+
+import pytest
+
+from src.application.services.fetch_book_metadata_service import (
+    FetchBookMetadataUseCase,
+)
+from src.infrastructure.firestore.async_book_master_repository import (
+    AsyncFirestoreBookMasterRepository,
+)
+from src.infrastructure.firestore.toc_preview_cache import FirestoreTOCPreviewCache
+from tests.infrastructure.fake_firestore import FakeFirestore
+
+PREVIEW = {"title": "吾輩は猫である", "toc": [{"title": "一", "level": 1}]}
+
+
+class StubTOCGenerator:
+    """Returns a fixed result and records the queries it was asked."""
+
+    def __init__(self, result: dict) -> None:
+        self.result = result
+        self.queries: list[str] = []
+
+    async def generate_from_query(self, query: str) -> dict:
+        self.queries.append(query)
+        return self.result
+
+
+def make_use_case(
+    result: dict = PREVIEW,
+) -> tuple[FetchBookMetadataUseCase, StubTOCGenerator, FirestoreTOCPreviewCache]:
+    """Build the use case over an in-memory Firestore with no book masters."""
+    client = FakeFirestore()
+    generator = StubTOCGenerator(result)
+    cache = FirestoreTOCPreviewCache(client, ttl_seconds=3600, max_size=10)
+    use_case = FetchBookMetadataUseCase(
+        AsyncFirestoreBookMasterRepository(client), generator, cache, client
+    )
+    return use_case, generator, cache
+
+
+def test_second_preview_is_served_from_the_cache() -> None:
+    """Only the first preview of an ISBN runs generation."""
+    use_case, generator, cache = make_use_case()
+
+    first = asyncio.run(use_case.execute("9784003101018"))
+    second = asyncio.run(use_case.execute("9784003101018"))
+
+    assert len(generator.queries) == 1
+    assert second.toc == first.toc
+    assert second.title == "吾輩は猫である"
+    assert cache.stats()["memory"]["hits"] == 1
+    assert cache.misses == 1
+
+
+def test_preview_survives_the_in_process_cache() -> None:
+    """Another worker (empty memory tier) reads the preview from Firestore."""
+    use_case, generator, cache = make_use_case()
+    asyncio.run(use_case.execute("9784003101018"))
+    cache.memory.clear()
+
+    asyncio.run(use_case.execute("9784003101018"))
+
+    assert len(generator.queries) == 1
+    assert cache.firestore_hits == 1
+
+
+def test_empty_toc_is_not_cached() -> None:
+    """A failed generation is retried on the next preview."""
+    use_case, generator, _ = make_use_case({"title": "不明", "toc": []})
+
+    asyncio.run(use_case.execute("9784003101018"))
+    asyncio.run(use_case.execute("9784003101018"))
+
+    assert len(generator.queries) == 2
+
+
+@pytest.mark.parametrize(
+    "isbn",
+    ["978-4-00-310101-8", "978 4003101018", "4003101014", "4-00-310101-4"],
+)
+def test_every_form_of_an_isbn_shares_one_entry(isbn: str) -> None:
+    """Hyphens, spaces and the ISBN-10 form all hit the ISBN-13 entry."""
+    use_case, generator, _ = make_use_case()
+    asyncio.run(use_case.execute("9784003101018"))
+
+    asyncio.run(use_case.execute(isbn))
+
+    assert len(generator.queries) == 1
+
+
+def test_title_hint_does_not_split_the_cache() -> None:
+    """The hint shapes the query and the returned title, not the key."""
+    use_case, generator, _ = make_use_case()
+    asyncio.run(use_case.execute("9784003101018"))
+
+    book = asyncio.run(use_case.execute("9784003101018", title="猫"))
+
+    assert len(generator.queries) == 1
+    assert book.title == "猫"
@@ -0,0 +1,121 @@
+"""Tests of ImportBooksUseCase and GetImportJobUseCase."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from src.application.services.import_books_service import (
+    GetImportJobUseCase,
+    ImportBooksUseCase,
+)
+from src.domain.models.book_master import BookMaster
+from src.domain.models.import_job import ImportJob, ImportJobStatus
+
+
+class FakeImportJobRepository:
+    """Stores import jobs in a dict, recording every save."""
+
+    def __init__(self) -> None:
+        self.jobs: dict[str, ImportJob] = {}
+        self.saves = 0
+
+    async def save(self, job: ImportJob) -> ImportJob:
+        self.saves += 1
+        self.jobs[job.job_id] = job.model_copy(deep=True)
+        return job
+
+    async def find(self, user_id: str, job_id: str) -> ImportJob | None:
+        job = self.jobs.get(job_id)
+        return job if job is not None and job.user_id == user_id else None
+
+
+class FakeBookMasterRepository:
+    """Knows no books."""
+
+    async def find_many_by_isbn(self, isbns: list[str]) -> list[BookMaster | None]:
+        return [None] * len(isbns)
+
+
+class SlowMetadataUseCase:
+    """Takes a while to find nothing."""
+
+    def __init__(self, seconds: float) -> None:
+        self.seconds = seconds
+
+    async def generate_preview(self, isbn: str) -> BookMaster | None:
+        del isbn
+        await asyncio.sleep(self.seconds)
+
+
+def make_use_case(
+    repository: FakeImportJobRepository, seconds: float = 0.0
+) -> ImportBooksUseCase:
+    """Build the use case with fakes and a fast heartbeat."""
+    return ImportBooksUseCase(
+        repository,
+        FakeBookMasterRepository(),
+        SlowMetadataUseCase(seconds),
+        bulk_writer=None,
+        generations_per_minute=60_000,
+        heartbeat_seconds=0.05,
+    )
+
+
+def test_interrupted_job_is_reported_as_failed() -> None:
+    """A running job without a recent heartbeat was lost with its instance."""
+    repository = FakeImportJobRepository()
+    stale = datetime.now(UTC) - timedelta(minutes=5)
+    asyncio.run(
+        repository.save(
+            ImportJob(
+                job_id="job-1",
+                user_id="user-1",
+                isbns=["9784000000001"],
+                status=ImportJobStatus.RUNNING,
+                heartbeat_at=stale,
+            )
+        )
+    )
+
+    job = asyncio.run(
+        GetImportJobUseCase(repository, stale_after_seconds=60).find("user-1", "job-1")
+    )
+
+    assert job.status == ImportJobStatus.FAILED
+    assert job.finished_at is not None
+    assert repository.jobs["job-1"].status == ImportJobStatus.FAILED
+
+
+def test_running_job_with_a_recent_heartbeat_is_left_alone() -> None:
+    """A live job is reported as it is."""
+    repository = FakeImportJobRepository()
+    asyncio.run(
+        repository.save(
+            ImportJob(
+                job_id="job-1",
+                user_id="user-1",
+                status=ImportJobStatus.RUNNING,
+                heartbeat_at=datetime.now(UTC),
+            )
+        )
+    )
+
+    job = asyncio.run(
+        GetImportJobUseCase(repository, stale_after_seconds=60).find("user-1", "job-1")
+    )
+
+    assert job.status == ImportJobStatus.RUNNING
+
+
+def test_run_saves_heartbeats_while_nothing_is_written() -> None:
+    """Slow generations without writes still keep the job alive."""
+    repository = FakeImportJobRepository()
+    use_case = make_use_case(repository, seconds=0.3)
+    job = asyncio.run(use_case.start("user-1", ["9784000000001"]))
+    saves_before = repository.saves
+
+    job = asyncio.run(use_case.run(job))
+
+    assert job.status == ImportJobStatus.COMPLETED
+    assert job.failed_isbns == ["9784000000001"]
+    # Start and finish, plus heartbeats in between
+    assert repository.saves - saves_before > 2
@@ -0,0 +1,171 @@
+"""Tests of ListBooksUseCase, with a benchmark against library size."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.application.services.list_books_service import ListBooksUseCase
+from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.domain.models.user import User
+from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.firestore.async_book_master_repository import (
+    AsyncFirestoreBookMasterRepository,
+)
+from tests.infrastructure.fake_firestore import FakeFirestore
+
+LATENCY = 0.02
+USER = User(uid="user-1")
+
+
+class FakeUserLibraryRepository:
+    """Serves a user's library entries newest first, one round trip per page."""
+
+    PAGE_SIZE = 500
+
+    def __init__(self, client: FakeFirestore, entries: list[UserLibraryEntry]) -> None:
+        self.client = client
+        self.entries = entries
+
+    async def find_page_by_user(
+        self,
+        user_id: str,
+        limit: int,
+        start_after: UserLibraryEntry | None = None,
+    ) -> list[UserLibraryEntry]:
+        await self.client.rpc()
+        entries = sorted(
+            (entry for entry in self.entries if entry.user_id == user_id),
+            key=lambda entry: (entry.added_at, entry.isbn),
+            reverse=True,
+        )
+        if start_after is not None:
+            cursor = (start_after.added_at, start_after.isbn)
+            entries = [e for e in entries if (e.added_at, e.isbn) < cursor]
+        return entries[:limit]
+
+    async def iter_pages_by_user(
+        self, user_id: str
+    ) -> AsyncIterator[list[UserLibraryEntry]]:
+        start_after = None
+        while True:
+            page = await self.find_page_by_user(user_id, self.PAGE_SIZE, start_after)
+            if page:
+                yield page
+            if len(page) < self.PAGE_SIZE:
+                return
+            start_after = page[-1]
+
+
+def make_library(size: int) -> tuple[FakeFirestore, ListBooksUseCase]:
+    """Store `size` books owned by the test user, behind per-RPC latency."""
+    client = FakeFirestore(latency=LATENCY)
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    entries = []
+    for i in range(size):
+        isbn = f"978400{i:07d}"
+        book = BookMaster(
+            isbn=isbn, title=f"本{i}", toc=[TableOfContentsItem(title="第1章")]
+        )
+        client.documents[f"books/{isbn}"] = book.model_dump()
+        entries.append(
+            UserLibraryEntry(user_id=USER.uid, isbn=isbn, added_at=start + timedelta(i))
+        )
+    use_case = ListBooksUseCase(
+        AsyncFirestoreBookMasterRepository(client),
+        FakeUserLibraryRepository(client, entries),
+    )
+    return client, use_case
+
+
+def timed(coroutine: object) -> tuple[object, float]:
+    """Run a coroutine, returning its result and wall time."""
+    start = time.perf_counter()
+    result = asyncio.run(coroutine)
+    return result, time.perf_counter() - start
+
+
+def test_books_are_returned_in_library_order() -> None:
+    """Batched reads keep each book with its library entry."""
+    _, use_case = make_library(250)
+
+    page = asyncio.run(use_case.execute(USER))
+
+    assert [item.book.isbn for item in page.items] == [
+        item.library_entry.isbn for item in page.items
+    ]
+    assert len(page.items) == 250
+
+
+def test_projection_skips_the_toc() -> None:
+    """Listings without TOC only read the projected fields."""
+    _, use_case = make_library(3)
+
+    page = asyncio.run(use_case.execute(USER, include_toc=False))
+
+    assert [item.book.toc for item in page.items] == [[], [], []]
+
+
+async def per_book_reads(use_case: ListBooksUseCase) -> list[BookMaster | None]:
+    """List books the former way, with one sequential read per book."""
+    return [
+        await use_case.book_master_repo.find_by_isbn(entry.isbn)
+        async for page in use_case.user_library_repo.iter_pages_by_user(USER.uid)
+        for entry in page
+    ]
+
+
+def test_round_trips_stay_flat_against_library_size() -> None:
+    """Batched reads cost a fixed number of round trips per library page.
+
+    Per-book reads (the former flow) cost one sequential round trip per
+    book; get_all chunks of 100 run concurrently, so each page of 500
+    entries waits on two round trips whatever its size.
+    """
+    for size, pages in ((10, 1), (100, 1), (800, 2)):
+        client, use_case = make_library(size)
+        page = asyncio.run(use_case.execute(USER))
+        assert len(page.items) == size
+        assert client.rpcs == pages + -(-size // 100)
+    # The 5 chunks of the first page of 500 books are read concurrently
+    assert client.max_in_flight == 5
+
+    client, use_case = make_library(50)
+    asyncio.run(per_book_reads(use_case))
+
+    assert client.rpcs == 51
+    assert client.max_in_flight == 1
+
+
+def test_next_page_cursor_only_when_more_entries_follow() -> None:
+    """A page that ends exactly at the end of the library has no next page."""
+    _, use_case = make_library(4)
+
+    first = asyncio.run(use_case.execute(USER, limit=2))
+    last = asyncio.run(use_case.execute(USER, 2, first.next_start_after))
+
+    assert [item.book.isbn for item in first.items] == [
+        "9784000000003",
+        "9784000000002",
+    ]
+    assert first.next_start_after.isbn == "9784000000002"
+    assert [item.book.isbn for item in last.items] == [
+        "9784000000001",
+        "9784000000000",
+    ]
+    assert last.next_start_after is None
+
+
+@pytest.mark.benchmark
+def test_list_latency_against_library_size() -> None:
+    """Benchmark: batched reads stay flat where per-book reads grow linearly."""
+    _, use_case = make_library(800)
+    page, batched = timed(use_case.execute(USER))
+    assert len(page.items) == 800
+
+    _, use_case = make_library(50)
+    _, sequential = timed(per_book_reads(use_case))
+
+    assert batched * 5 < sequential
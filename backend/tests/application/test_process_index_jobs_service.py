@@ -0,0 +1,131 @@
+"""Tests of ProcessIndexJobsUseCase."""
+
+import asyncio
+import threading
+import time
+
+from src.application.services.process_index_jobs_service import (
+    ProcessIndexJobsUseCase,
+)
+from src.domain.models.book_master import BookMaster
+from src.domain.models.index_job import IndexJob
+
+ISBN = "9784000000001"
+
+
+class FakeJobQueue:
+    """Hands out fixed jobs once and records their outcome."""
+
+    def __init__(self, jobs: list[IndexJob]) -> None:
+        self.jobs = jobs
+        self.completed: list[IndexJob] = []
+        self.retried: list[IndexJob] = []
+
+    async def claim(self, limit: int, lease_seconds: float) -> list[IndexJob]:
+        del lease_seconds
+        jobs, self.jobs = self.jobs[:limit], self.jobs[limit:]
+        return jobs
+
+    async def complete(self, job: IndexJob) -> None:
+        self.completed.append(job)
+
+    async def retry(self, job: IndexJob, error: str, delay_seconds: float) -> None:
+        del error, delay_seconds
+        self.retried.append(job)
+
+    async def dead_letter(self, job: IndexJob, error: str) -> None:
+        del error
+        self.retried.append(job)
+
+
+class FakeBookMasterRepository:
+    """Serves book masters from a dict."""
+
+    def __init__(self, books: list[BookMaster]) -> None:
+        self.books = {book.isbn: book for book in books}
+
+    async def find_many_by_isbn(
+        self, isbns: list[str], fields: list[str] | None = None
+    ) -> list[BookMaster | None]:
+        del fields
+        return [self.books.get(isbn) for isbn in isbns]
+
+
+class RecordingIndexer:
+    """Records indexed (ISBN, user) pairs."""
+
+    def __init__(self) -> None:
+        self.indexed: list[tuple[str, str]] = []
+
+    def index_book(self, book: BookMaster, user_id: str) -> None:
+        self.indexed.append((book.isbn, user_id))
+
+
+class AclIndexer:
+    """Read-modify-writes a per-book ACL, like SharedVertexAIBookIndexer."""
+
+    def __init__(self) -> None:
+        self.acls: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    def index_book(self, book: BookMaster, user_id: str) -> None:
+        with self._lock:
+            user_ids = list(self.acls.get(book.isbn, []))
+        time.sleep(0.05)  # The get/update round trip
+        if user_id not in user_ids:
+            user_ids.append(user_id)
+        with self._lock:
+            self.acls[book.isbn] = user_ids
+
+
+class FakeUserLibraryRepository:
+    """Counts index version bumps per user."""
+
+    def __init__(self) -> None:
+        self.versions: dict[str, int] = {}
+
+    async def bump_index_version(self, user_id: str) -> None:
+        self.versions[user_id] = self.versions.get(user_id, 0) + 1
+
+
+def test_completed_job_bumps_the_index_version() -> None:
+    """Reports cached before the book was searchable become unreachable."""
+    queue = FakeJobQueue([IndexJob(isbn=ISBN, user_id="user-1")])
+    libraries = FakeUserLibraryRepository()
+    use_case = ProcessIndexJobsUseCase(
+        queue,
+        FakeBookMasterRepository([BookMaster(isbn=ISBN, title="本")]),
+        RecordingIndexer(),
+        user_library_repo=libraries,
+    )
+
+    assert asyncio.run(use_case.execute(10)) == 1
+    assert libraries.versions == {"user-1": 1}
+    assert len(queue.completed) == 1
+
+
+def test_jobs_for_one_isbn_keep_every_user_in_the_acl() -> None:
+    """Two users registering one book both end up in its ACL."""
+    queue = FakeJobQueue(
+        [
+            IndexJob(isbn=ISBN, user_id="user-1"),
+            IndexJob(isbn=ISBN, user_id="user-2"),
+            IndexJob(isbn="9784000000002", user_id="user-1"),
+        ]
+    )
+    indexer = AclIndexer()
+    use_case = ProcessIndexJobsUseCase(
+        queue,
+        FakeBookMasterRepository(
+            [
+                BookMaster(isbn=ISBN, title="本"),
+                BookMaster(isbn="9784000000002", title="別の本"),
+            ]
+        ),
+        indexer,
+    )
+
+    assert asyncio.run(use_case.execute(10)) == 3
+    assert sorted(indexer.acls[ISBN]) == ["user-1", "user-2"]
+    assert indexer.acls["9784000000002"] == ["user-1"]
+    assert len(queue.completed) == 3
@@ -0,0 +1,132 @@
+"""Tests of SearchReportUseCase."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from src.application.services.search_report_service import SearchReportUseCase
+from src.domain.models.search_report import (
+    ChapterRef,
+    RecommendedBook,
+    SearchReport,
+)
+from src.infrastructure.cache.search_report_cache import InMemorySearchReportCache
+
+RESULTS = [{"id": "9784000000001", "isbn": "9784000000001", "title": "本"}]
+BOOK = RecommendedBook(
+    isbn="9784000000001",
+    title="本",
+    summary="関連する章がある",
+    relevant_chapters=[ChapterRef(chapter_title="第1章")],
+)
+
+
+class FakeSearchEngine:
+    """Returns fixed results and counts calls."""
+
+    def __init__(self, results: list[dict]) -> None:
+        self.results = results
+        self.calls = 0
+
+    async def search(
+        self, query: str, limit: int = 5, user_id: str | None = None
+    ) -> list[dict]:
+        del query, limit, user_id
+        self.calls += 1
+        return self.results
+
+
+class FlakyReportGenerator:
+    """Fails (like GeminiReportGenerator: with an empty report) until fixed."""
+
+    def __init__(self) -> None:
+        self.failing = True
+        self.calls = 0
+
+    async def generate_report(
+        self, query: str, search_results: list[dict]
+    ) -> SearchReport:
+        del query, search_results
+        self.calls += 1
+        return SearchReport(recommendations=[] if self.failing else [BOOK])
+
+    async def stream_report(
+        self, query: str, search_results: list[dict]
+    ) -> AsyncIterator[RecommendedBook]:
+        report = await self.generate_report(query, search_results)
+        for book in report.recommendations:
+            yield book
+
+
+class FakeLibraryRepository:
+    """Serves a fixed search version."""
+
+    async def get_search_version(self, user_id: str) -> int:
+        del user_id
+        return 1
+
+
+def make_use_case(
+    results: list[dict],
+) -> tuple[SearchReportUseCase, FakeSearchEngine, FlakyReportGenerator]:
+    """Build the use case with an in-memory cache."""
+    search_engine = FakeSearchEngine(results)
+    generator = FlakyReportGenerator()
+    use_case = SearchReportUseCase(
+        search_engine,
+        generator,
+        InMemorySearchReportCache(max_size=10, ttl_seconds=3600),
+        FakeLibraryRepository(),
+    )
+    return use_case, search_engine, generator
+
+
+def test_failed_report_is_not_cached() -> None:
+    """A generation failure is retried by the next request instead of pinned."""
+    use_case, _, generator = make_use_case(RESULTS)
+
+    first = asyncio.run(use_case.execute("機械学習", user_id="user-1"))
+    generator.failing = False
+    second = asyncio.run(use_case.execute("機械学習", user_id="user-1"))
+
+    assert first["report"].recommendations == []
+    assert second["report"].recommendations == [BOOK]
+    assert generator.calls == 2
+
+
+def test_successful_report_is_cached() -> None:
+    """A successful report answers the next equivalent query."""
+    use_case, search_engine, generator = make_use_case(RESULTS)
+    generator.failing = False
+
+    asyncio.run(use_case.execute("Python 入門", user_id="user-1"))
+    cached = asyncio.run(use_case.execute("python　入門", user_id="user-1"))
+
+    assert cached["report"].recommendations == [BOOK]
+    assert search_engine.calls == 1
+    assert generator.calls == 1
+
+
+def test_empty_search_is_cached() -> None:
+    """No results is a genuine answer, so it is cached."""
+    use_case, search_engine, generator = make_use_case([])
+
+    asyncio.run(use_case.execute("機械学習", user_id="user-1"))
+    asyncio.run(use_case.execute("機械学習", user_id="user-1"))
+
+    assert search_engine.calls == 1
+    assert generator.calls == 0
+
+
+def test_failed_stream_is_not_cached() -> None:
+    """Streaming applies the same rule as execute()."""
+    use_case, _, generator = make_use_case(RESULTS)
+
+    async def drain() -> list[str]:
+        return [event async for event, _ in use_case.stream("機械学習", user_id="u")]
+
+    asyncio.run(drain())
+    generator.failing = False
+    events = asyncio.run(drain())
+
+    assert events == ["search_results", "recommendation", "done"]
+    assert generator.calls == 2
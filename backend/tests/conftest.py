@@ -0,0 +1,7 @@
+"""Shared test configuration."""
+
+import os
+
+# Settings are read from the environment; tests never reach Google Cloud
+os.environ.setdefault("GOOGLE_CLOUD_PROJECT", "test-project")
+os.environ.setdefault("VERTEX_AI_DATA_STORE_ID", "test-data-store")
@@ -0,0 +1,261 @@
+"""In-memory stand-in for the async Firestore client.
+
+Covers what the repositories use: document references, get/get_all,
+write batches with create preconditions, and transactions run by
+`firestore.async_transactional`. Transactions are optimistic: a commit
+aborts (and the decorator retries it) when a document it read has changed
+since. Every RPC sleeps `latency` seconds and is counted in `rpcs`;
+`max_in_flight` records how many RPCs overlapped at most.
+"""
+
+import asyncio
+import copy
+import itertools
+from collections.abc import AsyncIterator
+from typing import Any
+
+from google.api_core.exceptions import Aborted, AlreadyExists, NotFound
+from google.cloud.firestore_v1.transforms import DELETE_FIELD, Increment
+
+
+def _apply(target: dict, data: dict, *, merge: bool) -> dict:
+    """Apply the fields of a write, with transforms, to a document dict."""
+    for key, value in data.items():
+        if value is DELETE_FIELD:
+            target.pop(key, None)
+        elif isinstance(value, Increment):
+            target[key] = target.get(key, 0) + value.value
+        elif merge and isinstance(value, dict) and isinstance(target.get(key), dict):
+            _apply(target[key], value, merge=True)
+        else:
+            target[key] = (
+                _apply({}, value, merge=False)
+                if isinstance(value, dict)
+                else copy.deepcopy(value)
+            )
+    return target
+
+
+class FakeSnapshot:
+    """A document snapshot."""
+
+    def __init__(self, reference: "FakeDocumentReference", data: dict | None) -> None:
+        self.reference = reference
+        self.id = reference.id
+        self.exists = data is not None
+        self._data = data
+
+    def to_dict(self) -> dict | None:
+        return copy.deepcopy(self._data)
+
+    def get(self, field: str) -> Any:  # noqa: ANN401
+        return (self._data or {}).get(field)
+
+
+class FakeDocumentReference:
+    """A reference to one document of a FakeFirestore."""
+
+    def __init__(self, client: "FakeFirestore", path: str) -> None:
+        self.client = client
+        self.path = path
+        self.id = path.rsplit("/", 1)[-1]
+
+    def collection(self, name: str) -> "FakeCollection":
+        return FakeCollection(self.client, f"{self.path}/{name}")
+
+    async def get(
+        self,
+        field_paths: list[str] | None = None,
+        transaction: "FakeTransaction | None" = None,
+    ) -> FakeSnapshot:
+        await self.client.rpc()
+        return self.client.read(self, transaction, field_paths)
+
+    async def set(self, data: dict, merge: bool = False) -> None:  # noqa: FBT001, FBT002
+        await self.client.rpc()
+        self.client.apply([("set", self, data, merge)])
+
+
+class FakeCollection:
+    """A collection of a FakeFirestore."""
+
+    def __init__(self, client: "FakeFirestore", path: str) -> None:
+        self.client = client
+        self.path = path
+
+    def document(self, document_id: str) -> FakeDocumentReference:
+        return FakeDocumentReference(self.client, f"{self.path}/{document_id}")
+
+
+class FakeWriteBatch:
+    """Writes committed atomically in one RPC."""
+
+    def __init__(self, client: "FakeFirestore") -> None:
+        self.client = client
+        self._writes: list[tuple[str, FakeDocumentReference, dict, bool]] = []
+
+    def create(self, ref: FakeDocumentReference, data: dict) -> None:
+        self._writes.append(("create", ref, data, False))
+
+    def set(self, ref: FakeDocumentReference, data: dict, merge: bool = False) -> None:  # noqa: FBT001, FBT002
+        self._writes.append(("set", ref, data, merge))
+
+    def update(self, ref: FakeDocumentReference, data: dict) -> None:
+        self._writes.append(("update", ref, data, True))
+
+    def delete(self, ref: FakeDocumentReference) -> None:
+        self._writes.append(("delete", ref, {}, False))
+
+    async def commit(self) -> None:
+        await self.client.rpc()
+        self.client.apply(self._writes)
+
+
+class FakeTransaction(FakeWriteBatch):
+    """The transaction protocol that `firestore.async_transactional` drives."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, client: "FakeFirestore") -> None:
+        super().__init__(client)
+        self._read_only = False
+        self._max_attempts = 5
+        self._id: int | None = None
+        self._read_versions: dict[str, int] = {}
+
+    def _clean_up(self) -> None:
+        self._writes = []
+        self._read_versions = {}
+        self._id = None
+
+    async def _begin(self, retry_id: int | None = None) -> None:
+        del retry_id
+        await self.client.rpc()
+        self._id = next(self._ids)
+
+    async def _commit(self) -> None:
+        await self.client.rpc()
+        for path, version in self._read_versions.items():
+            if self.client.versions.get(path, 0) != version:
+                self._clean_up()
+                msg = f"{path} changed during the transaction"
+                raise Aborted(msg)
+        self.client.apply(self._writes)
+        self._clean_up()
+
+    async def _rollback(self) -> None:
+        self._clean_up()
+
+
+class FakeFirestore:
+    """An in-memory async Firestore client."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.rpcs = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.documents: dict[str, dict] = {}
+        self.versions: dict[str, int] = {}
+
+    async def rpc(self) -> None:
+        """Count one round trip and wait for it."""
+        self.rpcs += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+    def collection(self, name: str) -> FakeCollection:
+        return FakeCollection(self, name)
+
+    def document(self, path: str) -> FakeDocumentReference:
+        return FakeDocumentReference(self, path)
+
+    def batch(self) -> FakeWriteBatch:
+        return FakeWriteBatch(self)
+
+    def transaction(self) -> FakeTransaction:
+        return FakeTransaction(self)
+
+    async def get_all(
+        self,
+        references: list[FakeDocumentReference],
+        field_paths: list[str] | None = None,
+        transaction: FakeTransaction | None = None,
+    ) -> AsyncIterator[FakeSnapshot]:
+        await self.rpc()
+        for ref in references:
+            yield self.read(ref, transaction, field_paths)
+
+    def read(
+        self,
+        ref: FakeDocumentReference,
+        transaction: FakeTransaction | None,
+        field_paths: list[str] | None = None,
+    ) -> FakeSnapshot:
+        """Read a document (projected to top-level `field_paths`).
+
+        Within a transaction, the document's version is recorded.
+        """
+        if transaction is not None:
+            transaction._read_versions[ref.path] = self.versions.get(ref.path, 0)  # noqa: SLF001
+        data = copy.deepcopy(self.documents.get(ref.path))
+        if data is not None and field_paths is not None:
+            data = {key: data[key] for key in field_paths if key in data}
+        return FakeSnapshot(ref, data)
+
+    def apply(
+        self, writes: list[tuple[str, FakeDocumentReference, dict, bool]]
+    ) -> None:
+        """Apply the writes of a commit, all or nothing."""
+        for kind, ref, _, _ in writes:
+            if kind == "create" and ref.path in self.documents:
+                msg = f"Document already exists: {ref.path}"
+                raise AlreadyExists(msg)
+            if kind == "update" and ref.path not in self.documents:
+                msg = f"No document to update: {ref.path}"
+                raise NotFound(msg)
+
+        for kind, ref, data, merge in writes:
+            if kind == "delete":
+                self.documents.pop(ref.path, None)
+            else:
+                current = self.documents.get(ref.path, {}) if merge else {}
+                self.documents[ref.path] = _apply(
+                    copy.deepcopy(current), data, merge=merge
+                )
+            self.versions[ref.path] = self.versions.get(ref.path, 0) + 1
+
+
+class FakeBulkWriter(FakeWriteBatch):
+    """Writes applied one by one on close; failed creates/updates are skipped."""
+
+    def on_write_error(self, callback: object) -> None:
+        del callback
+
+    def close(self) -> None:
+        self.client.rpcs += 1
+        for write in self._writes:
+            try:
+                self.client.apply([write])
+            except (AlreadyExists, NotFound):
+                continue
+
+
+class FakeSyncFirestore(FakeFirestore):
+    """The sync client flavour, as used with BulkWriter."""
+
+    def bulk_writer(self) -> FakeBulkWriter:
+        return FakeBulkWriter(self)
+
+    def get_all(
+        self,
+        references: list[FakeDocumentReference],
+        field_paths: list[str] | None = None,
+        transaction: FakeTransaction | None = None,
+    ) -> list[FakeSnapshot]:
+        self.rpcs += 1
+        return [self.read(ref, transaction, field_paths) for ref in references]
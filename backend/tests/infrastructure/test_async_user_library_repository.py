@@ -0,0 +1,21 @@
+"""Tests of AsyncFirestoreUserLibraryRepository against an in-memory fake."""
+
+import asyncio
+
+from src.infrastructure.firestore.async_user_library_repository import (
+    AsyncFirestoreUserLibraryRepository,
+)
+from tests.infrastructure.fake_firestore import FakeFirestore
+
+
+def test_indexing_moves_search_results_but_not_the_listing() -> None:
+    """An index bump changes the search version, not the library version."""
+    client = FakeFirestore()
+    client.documents["users/user-1"] = {"library_version": 3}
+    repository = AsyncFirestoreUserLibraryRepository(client)
+
+    before = asyncio.run(repository.get_search_version("user-1"))
+    asyncio.run(repository.bump_index_version("user-1"))
+
+    assert asyncio.run(repository.get_version("user-1")) == 3
+    assert asyncio.run(repository.get_search_version("user-1")) == before + 1
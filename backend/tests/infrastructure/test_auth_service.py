@@ -0,0 +1,113 @@
+"""Tests of FirebaseAuthService's verified-token cache."""
+
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from firebase_admin import auth
+from google.auth import crypt, jwt
+
+from src.domain.exceptions import AuthenticationError
+from src.infrastructure.firebase.auth_service import FirebaseAuthService
+
+REQUESTS = 200
+
+_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+_PRIVATE_PEM = _KEY.private_bytes(
+    serialization.Encoding.PEM,
+    serialization.PrivateFormat.PKCS8,
+    serialization.NoEncryption(),
+).decode()
+_PUBLIC_PEM = (
+    _KEY.public_key()
+    .public_bytes(
+        serialization.Encoding.PEM,
+        serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    .decode()
+)
+
+
+def make_token(uid: str, expires_in: float = 3600) -> str:
+    """Sign an RS256 ID token, as Firebase Auth issues them."""
+    now = int(time.time())
+    payload = {"uid": uid, "iat": now, "exp": int(now + expires_in)}
+    signer = crypt.RSASigner.from_string(_PRIVATE_PEM, "test-key")
+    return jwt.encode(signer, payload).decode()
+
+
+class CountingVerifier:
+    """Checks RS256 signatures locally, like verify_id_token without the network."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, token: str) -> dict:
+        self.calls += 1
+        try:
+            return jwt.decode(token, certs={"test-key": _PUBLIC_PEM})
+        except ValueError as e:
+            raise auth.InvalidIdTokenError(str(e)) from e
+
+
+@pytest.fixture
+def verifier(monkeypatch: pytest.MonkeyPatch) -> CountingVerifier:
+    """Replace Firebase's verification with a local signature check."""
+    verifier = CountingVerifier()
+    monkeypatch.setattr(auth, "verify_id_token", verifier)
+    return verifier
+
+
+def test_reused_token_is_verified_once(verifier: CountingVerifier) -> None:
+    """Requests with the same token skip the signature check."""
+    service = FirebaseAuthService()
+    token = make_token("user-1")
+
+    users = [service.verify_token(token) for _ in range(3)]
+
+    assert {user.uid for user in users} == {"user-1"}
+    assert verifier.calls == 1
+
+
+def test_token_close_to_expiry_is_not_cached(verifier: CountingVerifier) -> None:
+    """A token expiring within the skew is verified on every request."""
+    service = FirebaseAuthService(cache_expiry_skew_seconds=60)
+    token = make_token("user-1", expires_in=30)
+
+    service.verify_token(token)
+    service.verify_token(token)
+
+    assert verifier.calls == 2
+
+
+def test_invalid_token_is_rejected_every_time(verifier: CountingVerifier) -> None:
+    """Failures are never cached."""
+    service = FirebaseAuthService()
+    token = make_token("user-1")[:-4] + "AAAA"
+
+    for _ in range(2):
+        with pytest.raises(AuthenticationError):
+            service.verify_token(token)
+    assert verifier.calls == 2
+
+
+@pytest.mark.benchmark
+def test_cache_cuts_auth_overhead_per_request(verifier: CountingVerifier) -> None:
+    """Micro-benchmark: cached requests cost a hash and a dict lookup."""
+    token = make_token("user-1")
+
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        FirebaseAuthService().verify_token(token)  # Fresh cache: always verifies
+    uncached = (time.perf_counter() - start) / REQUESTS
+
+    service = FirebaseAuthService()
+    service.verify_token(token)
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        service.verify_token(token)
+    cached = (time.perf_counter() - start) / REQUESTS
+
+    assert verifier.calls == REQUESTS + 1
+    assert cached * 5 < uncached
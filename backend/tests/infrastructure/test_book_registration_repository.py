@@ -0,0 +1,189 @@
+"""Tests of AsyncFirestoreBookRegistrationRepository against an in-memory fake."""
+
+import asyncio
+import time
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.domain.models.index_job import IndexJob
+from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.firestore.book_registration_repository import (
+    AsyncFirestoreBookRegistrationRepository,
+)
+from tests.infrastructure.fake_firestore import FakeFirestore
+
+ISBN = "9784000000001"
+LATENCY = 0.02
+
+
+def make_book(user_id: str, chapters: list[str], at: datetime) -> BookMaster:
+    """Build the book master a registration by `user_id` would write."""
+    return BookMaster(
+        isbn=ISBN,
+        title="本",
+        toc=[TableOfContentsItem(title=title) for title in chapters],
+        last_updated_by=user_id,
+        created_at=at,
+        updated_at=at,
+    )
+
+
+async def register(
+    repository: AsyncFirestoreBookRegistrationRepository,
+    user_id: str,
+    chapters: list[str],
+    at: datetime,
+) -> tuple[BookMaster, UserLibraryEntry]:
+    """Register the test book for a user, as RegisterBookUseCase does."""
+    return await repository.register(
+        make_book(user_id, chapters, at),
+        UserLibraryEntry(user_id=user_id, isbn=ISBN, added_at=at),
+        IndexJob(isbn=ISBN, user_id=user_id),
+    )
+
+
+def test_new_book_is_registered_in_one_round_trip() -> None:
+    """The master, library entry, summary and index job share one commit."""
+    client = FakeFirestore()
+    repository = AsyncFirestoreBookRegistrationRepository(client)
+
+    asyncio.run(register(repository, "user-1", ["第1章"], datetime.now(UTC)))
+
+    assert client.rpcs == 1
+    assert f"books/{ISBN}" in client.documents
+    assert f"users/user-1/library/{ISBN}" in client.documents
+    assert f"index_jobs/{ISBN}-user-1" in client.documents
+    assert client.documents["users/user-1"]["library_version"] == 1
+
+
+def test_concurrent_registrations_of_one_isbn() -> None:
+    """Concurrent users all own the book, and the master is created once."""
+    client = FakeFirestore(latency=LATENCY)
+    repository = AsyncFirestoreBookRegistrationRepository(client)
+    now = datetime.now(UTC)
+    users = [f"user-{i}" for i in range(10)]
+
+    async def register_all() -> list[tuple[BookMaster, UserLibraryEntry]]:
+        return await asyncio.gather(
+            *(register(repository, user_id, ["第1章"], now) for user_id in users)
+        )
+
+    results = asyncio.run(register_all())
+
+    assert {book.isbn for book, _ in results} == {ISBN}
+    assert client.documents[f"books/{ISBN}"]["last_updated_by"] in users
+    for user_id in users:
+        assert f"users/{user_id}/library/{ISBN}" in client.documents
+        assert f"index_jobs/{ISBN}-{user_id}" in client.documents
+        assert client.documents[f"users/{user_id}"]["library_version"] == 1
+
+
+def test_concurrent_corrections_apply_one_toc() -> None:
+    """Conflicting corrections retry, and the master ends up consistent."""
+    client = FakeFirestore(latency=LATENCY)
+    repository = AsyncFirestoreBookRegistrationRepository(client)
+    now = datetime.now(UTC)
+    asyncio.run(register(repository, "user-0", ["初版"], now))
+
+    async def correct_all() -> None:
+        await asyncio.gather(
+            *(
+                register(repository, f"user-{i}", [f"第{i}版"], now + timedelta(i))
+                for i in range(1, 6)
+            )
+        )
+
+    asyncio.run(correct_all())
+
+    stored = client.documents[f"books/{ISBN}"]
+    editor = stored["last_updated_by"]
+    assert stored["toc"][0]["title"] == f"第{editor.removeprefix('user-')}版"
+    for i in range(1, 6):
+        assert client.documents[f"index_jobs/{ISBN}-user-{i}"]["refresh_summaries"]
+
+
+def test_re_registration_keeps_added_at() -> None:
+    """Registering an owned book again does not move it in the library."""
+    client = FakeFirestore()
+    repository = AsyncFirestoreBookRegistrationRepository(client)
+    first = datetime(2025, 1, 1, tzinfo=UTC)
+    asyncio.run(register(repository, "user-1", ["第1章"], first))
+
+    _, entry = asyncio.run(
+        register(repository, "user-1", ["第1章", "第2章"], first + timedelta(days=30))
+    )
+
+    assert entry.added_at == first
+    assert client.documents[f"users/user-1/library/{ISBN}"]["added_at"] == first
+    summary = next(
+        data
+        for path, data in client.documents.items()
+        if path.startswith("users/user-1/summary/")
+    )
+    assert summary["books"][ISBN]["added_at"] == first
+
+
+def test_re_registration_keeps_a_pending_summary_refresh() -> None:
+    """An unchanged re-registration does not drop a pending refresh request."""
+    client = FakeFirestore()
+    repository = AsyncFirestoreBookRegistrationRepository(client)
+    now = datetime.now(UTC)
+    asyncio.run(register(repository, "user-1", ["第1章"], now))
+    asyncio.run(register(repository, "user-1", ["第1章", "第2章"], now))
+    job_path = f"index_jobs/{ISBN}-user-1"
+    assert client.documents[job_path]["refresh_summaries"]
+
+    asyncio.run(register(repository, "user-1", ["第1章", "第2章"], now))
+
+    assert client.documents[job_path]["refresh_summaries"]
+
+
+def test_unchanged_re_registration_keeps_updated_at() -> None:
+    """The master (and the ETag derived from it) is left alone."""
+    client = FakeFirestore()
+    repository = AsyncFirestoreBookRegistrationRepository(client)
+    first = datetime(2025, 1, 1, tzinfo=UTC)
+    asyncio.run(register(repository, "user-1", ["第1章"], first))
+
+    book, _ = asyncio.run(
+        register(repository, "user-2", ["第1章"], first + timedelta(days=1))
+    )
+
+    assert book.updated_at == first
+    assert client.documents[f"books/{ISBN}"]["last_updated_by"] == "user-1"
+
+
+@pytest.mark.benchmark
+def test_registration_latency_against_read_then_write() -> None:
+    """A new book costs one round trip instead of three sequential ones."""
+    client = FakeFirestore(latency=LATENCY)
+    repository = AsyncFirestoreBookRegistrationRepository(client)
+    now = datetime.now(UTC)
+
+    async def read_then_write(isbn: str) -> None:
+        # The former flow: find_by_isbn, save, then add_book
+        await client.collection("books").document(isbn).get()
+        for ref in (
+            client.collection("books").document(isbn),
+            client.collection("users")
+            .document("user-1")
+            .collection("library")
+            .document(isbn),
+        ):
+            batch = client.batch()
+            batch.set(ref, {"isbn": isbn})
+            await batch.commit()
+
+    start = time.perf_counter()
+    asyncio.run(read_then_write("9784000000002"))
+    baseline = time.perf_counter() - start
+    baseline_rpcs, client.rpcs = client.rpcs, 0
+
+    start = time.perf_counter()
+    asyncio.run(register(repository, "user-1", ["第1章"], now))
+    elapsed = time.perf_counter() - start
+
+    assert (baseline_rpcs, client.rpcs) == (3, 1)
+    assert elapsed < baseline
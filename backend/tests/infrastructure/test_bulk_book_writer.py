@@ -0,0 +1,84 @@
+"""Tests of FirestoreBulkBookWriter against an in-memory fake."""
+
+import asyncio
+from datetime import UTC, datetime
+
+from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.domain.models.index_job import IndexJob
+from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.firestore.bulk_book_writer import FirestoreBulkBookWriter
+from tests.infrastructure.fake_firestore import FakeSyncFirestore
+
+OWNED = "9784000000001"
+NEW = "9784000000002"
+
+
+def make_book(isbn: str) -> BookMaster:
+    """Build a book master with one chapter."""
+    return BookMaster(isbn=isbn, title="本", toc=[TableOfContentsItem(title="第1章")])
+
+
+def test_linked_books_keep_added_at() -> None:
+    """Importing a book already in the library does not move it."""
+    client = FakeSyncFirestore()
+    first = datetime(2025, 1, 1, tzinfo=UTC)
+    client.documents[f"users/user-1/library/{OWNED}"] = {
+        "user_id": "user-1",
+        "isbn": OWNED,
+        "added_at": first,
+    }
+    now = datetime.now(UTC)
+    owned, new = make_book(OWNED), make_book(NEW)
+
+    asyncio.run(
+        FirestoreBulkBookWriter(client).write(
+            [new],
+            [
+                (UserLibraryEntry(user_id="user-1", isbn=isbn, added_at=now), book)
+                for isbn, book in ((OWNED, owned), (NEW, new))
+            ],
+            [IndexJob(isbn=isbn, user_id="user-1") for isbn in (OWNED, NEW)],
+        )
+    )
+
+    library = "users/user-1/library"
+    assert client.documents[f"{library}/{OWNED}"]["added_at"] == first
+    assert client.documents[f"{library}/{NEW}"]["added_at"] == now
+    summary = next(
+        data
+        for path, data in client.documents.items()
+        if path.startswith("users/user-1/summary/")
+    )
+    assert summary["books"][OWNED]["added_at"] == first
+    assert summary["books"][NEW]["added_at"] == now
+
+
+def test_linked_books_keep_a_workers_lease() -> None:
+    """Importing a book whose job is being processed only marks it dirty."""
+    client = FakeSyncFirestore()
+    lease_until = datetime(2030, 1, 1, tzinfo=UTC)
+    job_path = f"index_jobs/{OWNED}-user-1"
+    client.documents[job_path] = {
+        **IndexJob(isbn=OWNED, user_id="user-1").model_dump(),
+        "lease_id": "lease-1",
+        "available_at": lease_until,
+    }
+    owned, new = make_book(OWNED), make_book(NEW)
+
+    asyncio.run(
+        FirestoreBulkBookWriter(client).write(
+            [new],
+            [
+                (UserLibraryEntry(user_id="user-1", isbn=isbn), book)
+                for isbn, book in ((OWNED, owned), (NEW, new))
+            ],
+            [IndexJob(isbn=isbn, user_id="user-1") for isbn in (OWNED, NEW)],
+        )
+    )
+
+    job = client.documents[job_path]
+    assert (job["lease_id"], job["available_at"]) == ("lease-1", lease_until)
+    assert job["dirty"]
+    assert client.documents[f"index_jobs/{NEW}-user-1"]["lease_id"] is None
+    # added_at and the job were read together
+    assert client.rpcs == 2
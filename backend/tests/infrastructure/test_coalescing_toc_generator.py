@@ -0,0 +1,148 @@
+"""Tests of CoalescingTOCGenerator and its SingleFlight."""
+
+import asyncio
+
+import pytest
+
+from src.infrastructure.gemini.coalescing_toc_generator import (
+    CoalescingTOCGenerator,
+)
+
+RESULT = {"title": "吾輩は猫である", "toc": [{"title": "一", "level": 1}]}
+
+
+class StubTOCGenerator:
+    """Generates once released, recording calls and cancellations."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+
+    async def generate_from_query(self, query: str) -> dict:
+        del query
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return RESULT
+
+
+async def settle() -> None:
+    """Let started tasks reach their first await."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+def test_concurrent_previews_share_one_generation() -> None:
+    """N callers for one ISBN, in any notation, cause a single call."""
+
+    async def scenario() -> tuple[StubTOCGenerator, list[dict]]:
+        stub = StubTOCGenerator()
+        generator = CoalescingTOCGenerator(stub)
+        queries = ["ISBN: 9784003101018", "ISBN: 978-4-00-310101-8"] * 5
+        tasks = [
+            asyncio.create_task(generator.generate_from_query(query))
+            for query in queries
+        ]
+        await settle()
+        stub.release.set()
+        return stub, await asyncio.gather(*tasks)
+
+    stub, results = asyncio.run(scenario())
+
+    assert stub.calls == 1
+    assert results == [RESULT] * 10
+
+
+def test_next_preview_after_completion_runs_again() -> None:
+    """Only in-flight calls are shared; results are not cached here."""
+
+    async def scenario() -> StubTOCGenerator:
+        stub = StubTOCGenerator()
+        stub.release.set()
+        generator = CoalescingTOCGenerator(stub)
+        await generator.generate_from_query("ISBN: 9784003101018")
+        await generator.generate_from_query("ISBN: 9784003101018")
+        return stub
+
+    assert asyncio.run(scenario()).calls == 2
+
+
+def test_cancelling_one_waiter_keeps_the_shared_call() -> None:
+    """The remaining waiter still gets the result of the same call."""
+
+    async def scenario() -> tuple[StubTOCGenerator, dict]:
+        stub = StubTOCGenerator()
+        generator = CoalescingTOCGenerator(stub)
+        first = asyncio.create_task(
+            generator.generate_from_query("ISBN: 9784003101018")
+        )
+        second = asyncio.create_task(
+            generator.generate_from_query("ISBN: 9784003101018")
+        )
+        await settle()
+
+        first.cancel()
+        await settle()
+        assert stub.cancelled == 0
+        stub.release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return stub, await second
+
+    stub, result = asyncio.run(scenario())
+
+    assert (stub.calls, stub.cancelled) == (1, 0)
+    assert result == RESULT
+
+
+def test_cancelling_every_waiter_cancels_the_call() -> None:
+    """Nobody needs the result, so the generation is abandoned."""
+
+    async def scenario() -> tuple[int, int, int]:
+        stub = StubTOCGenerator()
+        generator = CoalescingTOCGenerator(stub)
+        tasks = [
+            asyncio.create_task(generator.generate_from_query("ISBN: 9784003101018"))
+            for _ in range(2)
+        ]
+        await settle()
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await settle()
+        # Read before asyncio.run() cancels whatever is left at shutdown
+        return stub.calls, stub.cancelled, generator.stats()["in_flight"]
+
+    assert asyncio.run(scenario()) == (1, 1, 0)
+
+
+def test_failure_is_shared_by_every_waiter() -> None:
+    """Waiters receive the exception of the shared call."""
+
+    class FailingGenerator(StubTOCGenerator):
+        async def generate_from_query(self, query: str) -> dict:
+            await super().generate_from_query(query)
+            msg = "Gemini unavailable"
+            raise RuntimeError(msg)
+
+    async def scenario() -> tuple[StubTOCGenerator, list[BaseException]]:
+        stub = FailingGenerator()
+        generator = CoalescingTOCGenerator(stub)
+        tasks = [
+            asyncio.create_task(generator.generate_from_query("ISBN: 9784003101018"))
+            for _ in range(3)
+        ]
+        await settle()
+        stub.release.set()
+        return stub, await asyncio.gather(*tasks, return_exceptions=True)
+
+    stub, errors = asyncio.run(scenario())
+
+    assert stub.calls == 1
+    assert all(isinstance(error, RuntimeError) for error in errors)
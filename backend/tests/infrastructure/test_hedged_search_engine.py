@@ -0,0 +1,119 @@
+"""Tests of HedgedSearchEngine."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.domain.exceptions import SearchUnavailableError
+from src.infrastructure.search.hedged_search_engine import HedgedSearchEngine
+
+HEDGE_DELAY = 0.1
+
+
+class StubEngine:
+    """Answers (or fails) after a delay, recording when it starts and stops."""
+
+    def __init__(self, name: str, delay: float, *, fails: bool = False) -> None:
+        self.name = name
+        self.delay = delay
+        self.fails = fails
+        self.started_at: float | None = None
+        self.cancelled = False
+
+    async def search(
+        self, query: str, limit: int = 5, user_id: str | None = None
+    ) -> list[dict]:
+        del query, limit, user_id
+        self.started_at = time.monotonic()
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fails:
+            msg = f"{self.name} is down"
+            raise RuntimeError(msg)
+        return [{"id": self.name}]
+
+
+def hedged_search(
+    primary: StubEngine, secondary: StubEngine
+) -> tuple[HedgedSearchEngine, list[dict], float, set[str]]:
+    """Search once.
+
+    Returns the engine, its answer, when the search started and which
+    engines were cancelled by the time it returned.
+    """
+    engine = HedgedSearchEngine(primary, secondary, hedge_delay_seconds=HEDGE_DELAY)
+
+    async def run() -> tuple[list[dict], float, set[str]]:
+        started = time.monotonic()
+        results = await engine.search("q")
+        # Let cancelled searches unwind; asyncio.run would cancel leftovers
+        await asyncio.sleep(0)
+        cancelled = {stub.name for stub in (primary, secondary) if stub.cancelled}
+        return results, started, cancelled
+
+    return engine, *asyncio.run(run())
+
+
+def test_slow_primary_is_hedged_and_the_secondary_wins() -> None:
+    """Past the hedge delay the secondary starts, answers and the primary stops."""
+    primary = StubEngine("primary", delay=5)
+    secondary = StubEngine("secondary", delay=0.01)
+
+    engine, results, started, cancelled = hedged_search(primary, secondary)
+
+    assert results == [{"id": "secondary"}]
+    assert secondary.started_at - started >= HEDGE_DELAY
+    assert cancelled == {"primary"}
+    assert engine.stats()["hedges"] == 1
+    assert engine.stats()["secondary_wins"] == 1
+
+
+def test_fast_primary_is_not_hedged() -> None:
+    """A primary answering within the delay never starts the secondary."""
+    primary = StubEngine("primary", delay=0.01)
+    secondary = StubEngine("secondary", delay=0.01)
+
+    engine, results, _, cancelled = hedged_search(primary, secondary)
+
+    assert results == [{"id": "primary"}]
+    assert secondary.started_at is None
+    assert cancelled == set()
+    assert engine.stats()["primary_wins"] == 1
+
+
+def test_failing_primary_starts_the_secondary_at_once() -> None:
+    """A failure does not wait for the hedge delay."""
+    primary = StubEngine("primary", delay=0, fails=True)
+    secondary = StubEngine("secondary", delay=0.01)
+
+    _, results, started, _ = hedged_search(primary, secondary)
+
+    assert results == [{"id": "secondary"}]
+    assert secondary.started_at - started < HEDGE_DELAY / 2
+
+
+def test_primary_answering_after_the_hedge_wins_and_cancels_the_secondary() -> None:
+    """Whichever engine answers first wins, the primary included."""
+    primary = StubEngine("primary", delay=HEDGE_DELAY * 1.5)
+    secondary = StubEngine("secondary", delay=5)
+
+    engine, results, _, cancelled = hedged_search(primary, secondary)
+
+    assert results == [{"id": "primary"}]
+    assert cancelled == {"secondary"}
+    assert engine.stats()["primary_wins"] == 1
+
+
+def test_both_engines_failing_raises() -> None:
+    """Search is reported unavailable, not answered with nothing."""
+    primary = StubEngine("primary", delay=0, fails=True)
+    secondary = StubEngine("secondary", delay=0, fails=True)
+    engine = HedgedSearchEngine(primary, secondary, hedge_delay_seconds=HEDGE_DELAY)
+
+    with pytest.raises(SearchUnavailableError):
+        asyncio.run(engine.search("q"))
+    assert engine.stats()["failures"] == 1
@@ -0,0 +1,113 @@
+"""Tests of FirestoreIndexJobQueue leases against re-registrations."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.domain.models.index_job import IndexJob, IndexJobStatus
+from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.firestore.book_registration_repository import (
+    AsyncFirestoreBookRegistrationRepository,
+)
+from src.infrastructure.firestore.index_job_queue import FirestoreIndexJobQueue
+from tests.infrastructure.fake_firestore import FakeFirestore
+
+ISBN = "9784000000001"
+JOB_PATH = f"index_jobs/{ISBN}-user-1"
+LEASE_UNTIL = datetime(2030, 1, 1, tzinfo=UTC)
+
+
+def register(client: FakeFirestore, chapters: list[str]) -> None:
+    """Register the test book for user-1."""
+    book = BookMaster(
+        isbn=ISBN,
+        title="本",
+        toc=[TableOfContentsItem(title=title) for title in chapters],
+    )
+    asyncio.run(
+        AsyncFirestoreBookRegistrationRepository(client).register(
+            book,
+            UserLibraryEntry(user_id="user-1", isbn=ISBN),
+            IndexJob(isbn=ISBN, user_id="user-1"),
+        )
+    )
+
+
+def lease(client: FakeFirestore) -> IndexJob:
+    """Take the lease on the job, as claim() does."""
+    client.documents[JOB_PATH].update(
+        lease_id="lease-1", attempts=1, available_at=LEASE_UNTIL, dirty=False
+    )
+    return IndexJob(**client.documents[JOB_PATH])
+
+
+def test_re_registration_keeps_the_lease() -> None:
+    """No other worker can claim the book while the first one indexes it."""
+    client = FakeFirestore()
+    register(client, ["第1章"])
+    lease(client)
+
+    register(client, ["第1章", "第2章"])
+
+    job = client.documents[JOB_PATH]
+    assert job["lease_id"] == "lease-1"
+    assert job["available_at"] == LEASE_UNTIL
+    assert job["dirty"]
+    assert job["refresh_summaries"]
+
+
+def test_completing_a_dirty_job_queues_it_again() -> None:
+    """The changed master is indexed by another pass."""
+    client = FakeFirestore()
+    register(client, ["第1章"])
+    job = lease(client)
+    register(client, ["第1章", "第2章"])
+
+    asyncio.run(FirestoreIndexJobQueue(client).complete(job))
+
+    stored = client.documents[JOB_PATH]
+    assert stored["lease_id"] is None
+    assert not stored["dirty"]
+    assert stored["available_at"] <= datetime.now(UTC)
+
+
+def test_completing_a_clean_job_deletes_it() -> None:
+    """Without a re-registration, completion removes the job."""
+    client = FakeFirestore()
+    register(client, ["第1章"])
+    job = lease(client)
+
+    asyncio.run(FirestoreIndexJobQueue(client).complete(job))
+
+    assert JOB_PATH not in client.documents
+
+
+def test_completion_after_a_lost_lease_leaves_the_job() -> None:
+    """A worker whose lease expired and was taken over does not delete it."""
+    client = FakeFirestore()
+    register(client, ["第1章"])
+    job = lease(client)
+    client.documents[JOB_PATH]["lease_id"] = "lease-2"
+
+    asyncio.run(FirestoreIndexJobQueue(client).complete(job))
+
+    assert client.documents[JOB_PATH]["lease_id"] == "lease-2"
+
+
+def test_re_registration_revives_a_dead_job() -> None:
+    """A book that failed to index is retried when registered again."""
+    client = FakeFirestore()
+    register(client, ["第1章"])
+    client.documents[JOB_PATH].update(
+        status=IndexJobStatus.DEAD,
+        attempts=8,
+        available_at=datetime.now(UTC) - timedelta(days=1),
+        last_error="boom",
+    )
+
+    register(client, ["第1章"])
+
+    job = client.documents[JOB_PATH]
+    assert job["status"] == IndexJobStatus.PENDING
+    assert job["attempts"] == 0
+    assert job["last_error"] is None
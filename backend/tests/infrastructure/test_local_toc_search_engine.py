@@ -0,0 +1,184 @@
+"""Tests of LocalTOCSearchEngine."""
+
+import asyncio
+import threading
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+
+from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.domain.models.user_library import UserLibraryEntry
+from src.infrastructure.search.local_toc_search_engine import LocalTOCSearchEngine
+
+
+def make_book(isbn: str, title: str, chapters: list[str]) -> BookMaster:
+    """Build a book master with top-level chapters."""
+    return BookMaster(
+        isbn=isbn,
+        title=title,
+        toc=[TableOfContentsItem(title=chapter) for chapter in chapters],
+    )
+
+
+PYTHON = make_book("9784000000001", "Python入門", ["型ヒント", "非同期処理"])
+GO = make_book("9784000000002", "Go言語の基礎", ["ゴルーチン", "チャネル"])
+ADDED_AT = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class FakeFirestore:
+    """Serves book masters and library entries like the sync repositories."""
+
+    def __init__(
+        self,
+        owners: dict[str, set[str]],
+        on_page: Callable[[], None] | None = None,
+    ) -> None:
+        self.books = {PYTHON.isbn: PYTHON, GO.isbn: GO}
+        self.entries: list[UserLibraryEntry] = []
+        self.on_page = on_page
+        self.book_reads = 0
+        for isbn, user_ids in owners.items():
+            for user_id in sorted(user_ids):
+                self.add(isbn, user_id, ADDED_AT)
+
+    def add(self, isbn: str, user_id: str, added_at: datetime) -> None:
+        self.entries.append(
+            UserLibraryEntry(user_id=user_id, isbn=isbn, added_at=added_at)
+        )
+
+    def iter_all_pages(
+        self, added_after: datetime | None = None, page_size: int = 500
+    ) -> Iterator[list[UserLibraryEntry]]:
+        del page_size
+        if self.on_page is not None:
+            self.on_page()
+        yield [
+            entry
+            for entry in self.entries
+            if added_after is None or entry.added_at > added_after
+        ]
+
+    def find_many_by_isbn(self, isbns: list[str]) -> list[BookMaster | None]:
+        self.book_reads += len(isbns)
+        return [self.books.get(isbn) for isbn in isbns]
+
+
+def search(engine: LocalTOCSearchEngine, query: str, user_id: str) -> list[str]:
+    """Get the ISBNs found for a user."""
+    results = asyncio.run(engine.search(query, user_id=user_id))
+    return [result["isbn"] for result in results]
+
+
+def test_search_is_limited_to_the_users_library() -> None:
+    """Books are shared, but only an owner finds them."""
+    engine = LocalTOCSearchEngine()
+    store = FakeFirestore({PYTHON.isbn: {"user-1"}, GO.isbn: {"user-2"}})
+    engine.build(store, store)
+
+    assert search(engine, "非同期", "user-1") == [PYTHON.isbn]
+    assert search(engine, "非同期", "user-2") == []
+    assert search(engine, "ゴルーチン", "user-2") == [GO.isbn]
+
+
+def test_title_matches_rank_above_toc_matches() -> None:
+    """Title n-grams are weighted above TOC entries."""
+    engine = LocalTOCSearchEngine()
+    engine.index_book(make_book("9784000000003", "並行処理", ["概要"]), "user-1")
+    engine.index_book(make_book("9784000000004", "概要", ["並行処理"]), "user-1")
+
+    assert search(engine, "並行処理", "user-1") == ["9784000000003", "9784000000004"]
+
+
+def test_changed_content_replaces_the_old_postings() -> None:
+    """A re-registered book is found by its new TOC only."""
+    engine = LocalTOCSearchEngine()
+    engine.index_book(GO, "user-1")
+    engine.index_book(GO.model_copy(update={"toc": PYTHON.toc}), "user-2")
+
+    assert search(engine, "チャネル", "user-1") == []
+    assert search(engine, "型ヒント", "user-1") == [GO.isbn]
+    assert search(engine, "型ヒント", "user-2") == [GO.isbn]
+    assert engine.stats()["books"] == 1
+
+
+def test_rebuild_picks_up_other_workers_changes() -> None:
+    """Registrations and removals made elsewhere appear after a rebuild."""
+    engine = LocalTOCSearchEngine()
+    store = FakeFirestore({PYTHON.isbn: {"user-1"}})
+    engine.build(store, store)
+    store.entries = []
+    store.add(GO.isbn, "user-1", ADDED_AT)
+
+    engine.rebuild(store, store)
+
+    assert search(engine, "ゴルーチン", "user-1") == [GO.isbn]
+    assert search(engine, "非同期", "user-1") == []
+
+
+def test_rebuild_keeps_registrations_made_while_it_runs() -> None:
+    """A book indexed in-process during the build survives the swap."""
+    engine = LocalTOCSearchEngine()
+    store = FakeFirestore(
+        {},
+        # Registered after the build read the owners
+        on_page=lambda: engine.index_book(GO, "user-1"),
+    )
+
+    engine.rebuild(store, store)
+
+    assert search(engine, "チャネル", "user-1") == [GO.isbn]
+
+
+def test_build_reads_each_owned_book_once() -> None:
+    """A book owned by several users is read once; unowned books never."""
+    engine = LocalTOCSearchEngine()
+    store = FakeFirestore({PYTHON.isbn: {"user-1", "user-2"}})
+    engine.build(store, store)
+
+    assert store.book_reads == 1
+    assert search(engine, "非同期", "user-2") == [PYTHON.isbn]
+    assert search(engine, "ゴルーチン", "user-1") == []
+
+
+def test_refresh_only_reads_entries_added_since_the_last_read() -> None:
+    """Other workers' registrations appear without re-reading the library."""
+    engine = LocalTOCSearchEngine()
+    store = FakeFirestore({PYTHON.isbn: {"user-1"}})
+    engine.build(store, store)
+    now = datetime.now(UTC)
+    store.add(GO.isbn, "user-2", now)
+    store.add(PYTHON.isbn, "user-2", now)
+
+    entries = engine.refresh(store, store)
+
+    assert entries == 2
+    # Only the unindexed book is read
+    assert store.book_reads == 2
+    assert search(engine, "ゴルーチン", "user-2") == [GO.isbn]
+    assert search(engine, "非同期", "user-2") == [PYTHON.isbn]
+
+    # Entries stamped by a slightly slower clock are still read
+    store.add(GO.isbn, "user-3", datetime.now(UTC) - timedelta(seconds=30))
+    engine.refresh(store, store)
+
+    assert search(engine, "ゴルーチン", "user-3") == [GO.isbn]
+
+
+def test_search_does_not_block_the_event_loop_on_the_lock() -> None:
+    """A search waiting for the index lock leaves the event loop running."""
+    engine = LocalTOCSearchEngine()
+    engine.index_book(PYTHON, "user-1")
+
+    async def search_while_locked() -> tuple[int, list[str]]:
+        ticks = 0
+        engine._lock.acquire()  # noqa: SLF001
+        task = asyncio.create_task(engine.search("非同期", user_id="user-1"))
+        threading.Timer(0.1, engine._lock.release).start()  # noqa: SLF001
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        return ticks, [result["isbn"] for result in task.result()]
+
+    ticks, isbns = asyncio.run(search_while_locked())
+
+    assert ticks > 1
+    assert isbns == [PYTHON.isbn]
@@ -0,0 +1,104 @@
+"""Tests of GeminiReportGenerator streaming under its call limiter."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from types import SimpleNamespace
+
+import pytest
+
+from src.infrastructure.gemini.report_generator import GeminiReportGenerator
+
+BOOKS = [
+    {
+        "isbn": f"978400000000{i}",
+        "title": f"本{i}",
+        "summary": "要約",
+        "relevant_chapters": [],
+    }
+    for i in range(1, 4)
+]
+RESULTS = [{"isbn": book["isbn"], "title": book["title"]} for book in BOOKS]
+
+
+class StubModels:
+    """Streams a report in one chunk per book, optionally stalling midway."""
+
+    def __init__(self, stall_after: int | None = None) -> None:
+        self.stall_after = stall_after
+
+    async def generate_content_stream(self, **kwargs: object) -> AsyncIterator:
+        del kwargs
+        return self._chunks()
+
+    async def _chunks(self) -> AsyncIterator[SimpleNamespace]:
+        yield SimpleNamespace(text='{"recommendations": [')
+        for i, book in enumerate(BOOKS):
+            if i == self.stall_after:
+                await asyncio.sleep(60)
+            separator = "," if i else ""
+            yield SimpleNamespace(text=separator + json.dumps(book))
+        yield SimpleNamespace(text="]}")
+
+
+def make_generator(models: StubModels, timeout_seconds: float) -> GeminiReportGenerator:
+    """Build a generator with one slot whose client serves `models`."""
+    generator = GeminiReportGenerator(
+        "test-project", max_concurrency=1, timeout_seconds=timeout_seconds
+    )
+    generator.client = SimpleNamespace(aio=SimpleNamespace(models=models))
+    return generator
+
+
+def test_slow_consumer_holds_neither_the_slot_nor_the_deadline() -> None:
+    """Time spent between items counts against nothing once generation ends."""
+    generator = make_generator(StubModels(), timeout_seconds=0.2)
+
+    async def consume_slowly() -> tuple[list[str], str]:
+        isbns = []
+        stream = generator.stream_report("q", RESULTS)
+        async for book in stream:
+            isbns.append(book.isbn)
+            if len(isbns) == 1:
+                # The only slot is free while this consumer is paused
+                other = await generator.limiter.run(lambda: asyncio.sleep(0, "ok"))
+            await asyncio.sleep(0.15)
+        return isbns, other
+
+    isbns, other = asyncio.run(consume_slowly())
+
+    assert isbns == [book["isbn"] for book in BOOKS]
+    assert other == "ok"
+
+
+def test_deadline_mid_stream_raises_timeout() -> None:
+    """A stalled generation fails with TimeoutError after the books so far.
+
+    The deadline fires while the consumer is paused between items; it must
+    still surface as TimeoutError from the stream, not as a cancellation
+    of the consumer.
+    """
+    generator = make_generator(StubModels(stall_after=1), timeout_seconds=0.2)
+    isbns = []
+
+    async def consume() -> None:
+        async for book in generator.stream_report("q", RESULTS):
+            isbns.append(book.isbn)
+            await asyncio.sleep(0.3)
+
+    with pytest.raises(TimeoutError):
+        asyncio.run(consume())
+    assert isbns == [BOOKS[0]["isbn"]]
+
+
+def test_closing_the_stream_cancels_the_call() -> None:
+    """A consumer that stops early (a client disconnect) frees the slot."""
+    generator = make_generator(StubModels(stall_after=1), timeout_seconds=5)
+
+    async def close_after_first() -> str:
+        stream = generator.stream_report("q", RESULTS)
+        await anext(stream)
+        await stream.aclose()
+        return await generator.limiter.run(lambda: asyncio.sleep(0, "ok"))
+
+    assert asyncio.run(asyncio.wait_for(close_after_first(), 1)) == "ok"
@@ -0,0 +1,48 @@
+"""Tests of RecommendationStreamParser."""
+
+import json
+
+from src.infrastructure.gemini.report_stream_parser import RecommendationStreamParser
+
+REPORT = json.dumps(
+    {
+        "recommendations": [
+            {
+                "isbn": "9784000000001",
+                "title": 'Braces { and "quotes" ] in a title',
+                "summary": "An escaped backslash \\ before a quote",
+                "relevant_chapters": [{"chapter_title": "第1章 {概要}"}],
+            },
+            {"isbn": "9784000000002", "title": "Broken"},
+            {
+                "isbn": "9784000000003",
+                "title": "二冊目",
+                "summary": "要約",
+                "relevant_chapters": [],
+            },
+        ]
+    },
+    ensure_ascii=False,
+)
+
+
+def test_recommendations_are_returned_as_each_one_completes() -> None:
+    """Chunk boundaries, strings with brackets and escapes do not matter."""
+    parser = RecommendationStreamParser()
+    seen = []
+    for i in range(0, len(REPORT), 7):
+        seen.extend(book.isbn for book in parser.feed(REPORT[i : i + 7]))
+        if i + 7 < REPORT.index("9784000000003"):
+            assert seen in ([], ["9784000000001"])
+
+    # The malformed recommendation is skipped
+    assert seen == ["9784000000001", "9784000000003"]
+    assert parser.finished
+
+
+def test_feeding_after_the_array_closes_returns_nothing() -> None:
+    """Text after the recommendations array is ignored."""
+    parser = RecommendationStreamParser()
+    parser.feed(REPORT)
+
+    assert parser.feed('{"recommendations": [{}]}') == []
@@ -0,0 +1,288 @@
+"""Tests of GeminiTOCGenerator's bibliographic metadata lookup.
+
+The sources are either replaced by coroutines, or served by local stub
+HTTP servers standing in for NDL Search and Google Books.
+"""
+
+import asyncio
+import contextlib
+import json
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from src.infrastructure.gemini.toc_generator import GeminiTOCGenerator
+
+ISBN = "9784000000001"
+
+NDL_FOUND = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+  <channel>
+    <item>
+      <dc:title>日本語の本</dc:title>
+      <dc:creator>水野, 貴明, 1973-</dc:creator>
+    </item>
+  </channel>
+</rss>"""
+NDL_NOT_FOUND = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel></channel></rss>"""
+GOOGLE_BOOKS_FOUND = json.dumps(
+    {"totalItems": 1, "items": [{"volumeInfo": {"title": "Book", "authors": ["A"]}}]}
+)
+
+
+class RecordingMetadataCache:
+    """Records what is cached, and with which TTL."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, tuple[dict, float | None]] = {}
+
+    async def get(self, isbn: str) -> dict | None:
+        del isbn
+
+    async def set(
+        self, isbn: str, metadata: dict, ttl_seconds: float | None = None
+    ) -> None:
+        self.entries[isbn] = (metadata, ttl_seconds)
+
+
+def make_generator(
+    ndl: dict[str, Any] | None, google_books: dict[str, Any] | None
+) -> tuple[GeminiTOCGenerator, RecordingMetadataCache]:
+    """Build a generator whose sources answer `ndl` and `google_books`.
+
+    None makes a source fail.
+    """
+    cache = RecordingMetadataCache()
+    generator = GeminiTOCGenerator(project_id="test-project", metadata_cache=cache)
+
+    def source(answer: dict[str, Any] | None) -> Any:  # noqa: ANN401
+        async def fetch(isbn: str) -> dict[str, Any]:
+            del isbn
+            if answer is None:
+                msg = "source is down"
+                raise RuntimeError(msg)
+            return answer
+
+        return fetch
+
+    generator._fetch_ndl_metadata = source(ndl)  # noqa: SLF001
+    generator._fetch_google_books_metadata = source(google_books)  # noqa: SLF001
+    return generator, cache
+
+
+def test_ndl_answer_is_cached_with_the_default_ttl() -> None:
+    """An authoritative answer uses the cache's positive TTL."""
+    generator, cache = make_generator({"title": "日本語の本"}, {"title": "Book"})
+
+    metadata = asyncio.run(generator._fetch_book_metadata(ISBN))  # noqa: SLF001
+
+    assert metadata == {"title": "日本語の本"}
+    assert cache.entries[ISBN] == ({"title": "日本語の本"}, None)
+
+
+def test_fallback_answer_is_cached_briefly() -> None:
+    """Google Books answering while NDL fails is only kept for a short TTL."""
+    generator, cache = make_generator(None, {"title": "Book"})
+
+    metadata = asyncio.run(generator._fetch_book_metadata(ISBN))  # noqa: SLF001
+
+    assert metadata == {"title": "Book"}
+    assert cache.entries[ISBN] == (
+        {"title": "Book"},
+        GeminiTOCGenerator.METADATA_FALLBACK_TTL_SECONDS,
+    )
+
+
+def test_not_found_is_not_cached_when_a_source_failed() -> None:
+    """A failure says nothing about the ISBN."""
+    generator, cache = make_generator(None, {})
+
+    assert asyncio.run(generator._fetch_book_metadata(ISBN)) == {}  # noqa: SLF001
+    assert cache.entries == {}
+
+
+class StubSource:
+    """The canned answer of one stub source."""
+
+    def __init__(self, body: str, delay: float = 0.0, status: int = 200) -> None:
+        self.body = body
+        self.delay = delay
+        self.status = status
+        self.requests: list[str] = []
+        self.connections: set[int] = set()
+
+
+class StubServer:
+    """Local HTTP server answering /ndl and /google-books from StubSources."""
+
+    def __init__(self) -> None:
+        self.sources = {
+            "/ndl": StubSource(NDL_NOT_FOUND),
+            "/google-books": StubSource(json.dumps({"totalItems": 0})),
+        }
+        sources = self.sources
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, as the real APIs
+
+            def do_GET(self) -> None:
+                path, _, _ = self.path.partition("?")
+                source = sources[path]
+                source.requests.append(self.path)
+                source.connections.add(self.client_address[1])
+                time.sleep(source.delay)
+                body = source.body.encode()
+                self.send_response(source.status)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                # A client that timed out has already hung up
+                with contextlib.suppress(ConnectionError):
+                    self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                del args
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def ndl(self) -> StubSource:
+        return self.sources["/ndl"]
+
+    @property
+    def google_books(self) -> StubSource:
+        return self.sources["/google-books"]
+
+
+@pytest.fixture
+def stub_server() -> Iterator[StubServer]:
+    """Run the stub sources for one test."""
+    server = StubServer()
+    server.thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+def stubbed_generator(
+    server: StubServer, timeout_seconds: float = 5.0
+) -> tuple[GeminiTOCGenerator, RecordingMetadataCache]:
+    """Build a generator querying the stub server."""
+    cache = RecordingMetadataCache()
+    generator = GeminiTOCGenerator(
+        project_id="test-project",
+        ndl_timeout_seconds=timeout_seconds,
+        google_books_timeout_seconds=timeout_seconds,
+        metadata_cache=cache,
+    )
+    generator.NDL_SEARCH_URL = f"{server.url}/ndl"
+    generator.GOOGLE_BOOKS_URL = f"{server.url}/google-books"
+    return generator, cache
+
+
+def lookup(generator: GeminiTOCGenerator, count: int = 1) -> tuple[list[dict], float]:
+    """Look the ISBN up `count` times in one event loop, timing the lookups."""
+
+    async def run() -> list[dict]:
+        try:
+            return [
+                await generator._fetch_book_metadata(ISBN)  # noqa: SLF001
+                for _ in range(count)
+            ]
+        finally:
+            await generator.http_client.aclose()
+
+    start = time.perf_counter()
+    results = asyncio.run(run())
+    return results, time.perf_counter() - start
+
+
+def test_sources_are_queried_concurrently(stub_server: StubServer) -> None:
+    """A miss on NDL costs one source's latency, not the sum of both."""
+    stub_server.ndl.delay = stub_server.google_books.delay = 0.4
+    stub_server.google_books.body = GOOGLE_BOOKS_FOUND
+    generator, _ = stubbed_generator(stub_server)
+
+    (metadata,), elapsed = lookup(generator)
+
+    assert metadata["title"] == "Book"
+    assert elapsed < 0.7
+    assert stub_server.ndl.requests == [f"/ndl?isbn={ISBN}"]
+
+
+def test_ndl_wins_when_it_has_a_title(stub_server: StubServer) -> None:
+    """NDL's title is used even when Google Books answers first."""
+    stub_server.ndl.body = NDL_FOUND
+    stub_server.ndl.delay = 0.2
+    stub_server.google_books.body = GOOGLE_BOOKS_FOUND
+    generator, cache = stubbed_generator(stub_server)
+
+    (metadata,), _ = lookup(generator)
+
+    assert metadata == {
+        "title": "日本語の本",
+        "description": "",
+        "authors": ["水野貴明"],
+    }
+    assert cache.entries[ISBN] == (metadata, None)
+
+
+def test_slow_google_books_does_not_delay_an_ndl_answer(
+    stub_server: StubServer,
+) -> None:
+    """Google Books is abandoned once NDL answered with a title."""
+    stub_server.ndl.body = NDL_FOUND
+    stub_server.google_books.delay = 2.0
+    generator, _ = stubbed_generator(stub_server)
+
+    (metadata,), elapsed = lookup(generator)
+
+    assert metadata["title"] == "日本語の本"
+    assert elapsed < 1.0
+
+
+def test_each_source_has_its_own_timeout(stub_server: StubServer) -> None:
+    """A hanging NDL times out, and Google Books' answer is kept briefly."""
+    stub_server.ndl.delay = 2.0
+    stub_server.google_books.body = GOOGLE_BOOKS_FOUND
+    generator, cache = stubbed_generator(stub_server, timeout_seconds=0.3)
+
+    (metadata,), elapsed = lookup(generator)
+
+    assert metadata["title"] == "Book"
+    assert elapsed < 1.0
+    assert cache.entries[ISBN][1] == GeminiTOCGenerator.METADATA_FALLBACK_TTL_SECONDS
+
+
+def test_failing_source_is_skipped_once_its_circuit_opens(
+    stub_server: StubServer,
+) -> None:
+    """After repeated NDL errors, lookups stop calling NDL."""
+    stub_server.ndl.status = 500
+    stub_server.google_books.body = GOOGLE_BOOKS_FOUND
+    generator, _ = stubbed_generator(stub_server)
+    threshold = GeminiTOCGenerator.CIRCUIT_FAILURE_THRESHOLD
+
+    results, _ = lookup(generator, count=threshold + 3)
+
+    assert [metadata["title"] for metadata in results] == ["Book"] * (threshold + 3)
+    assert len(stub_server.ndl.requests) == threshold
+    assert generator.ndl_breaker.state == generator.ndl_breaker.OPEN
+
+
+def test_connections_are_pooled(stub_server: StubServer) -> None:
+    """Sequential lookups reuse one connection per source."""
+    stub_server.ndl.body = NDL_FOUND
+    generator, _ = stubbed_generator(stub_server)
+
+    lookup(generator, count=3)
+
+    assert len(stub_server.ndl.requests) == 3
+    assert len(stub_server.ndl.connections) == 1
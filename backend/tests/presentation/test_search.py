@@ -0,0 +1,44 @@
+"""Tests of the search endpoints."""
+
+from fastapi.testclient import TestClient
+
+from src.application.services.search_report_service import SearchReportUseCase
+from src.domain.models.user import User
+from src.infrastructure.cache.search_report_cache import InMemorySearchReportCache
+from src.main import app
+from src.presentation.api.deps import get_current_user
+from src.presentation.api.search import get_search_use_case
+from tests.application.test_search_report_service import (
+    FakeLibraryRepository,
+    FakeSearchEngine,
+)
+from tests.infrastructure.test_report_generator import (
+    BOOKS,
+    RESULTS,
+    StubModels,
+    make_generator,
+)
+
+
+def test_deadline_mid_stream_sends_an_error_event() -> None:
+    """The client is told the report failed instead of the stream just ending."""
+    use_case = SearchReportUseCase(
+        FakeSearchEngine(RESULTS),
+        make_generator(StubModels(stall_after=1), timeout_seconds=0.2),
+        InMemorySearchReportCache(max_size=10, ttl_seconds=3600),
+        FakeLibraryRepository(),
+    )
+    app.dependency_overrides[get_current_user] = lambda: User(uid="user-1")
+    app.dependency_overrides[get_search_use_case] = lambda: use_case
+    try:
+        response = TestClient(app).get("/api/search/stream", params={"q": "q"})
+    finally:
+        app.dependency_overrides.clear()
+
+    events = [
+        line.removeprefix("event: ")
+        for line in response.text.splitlines()
+        if line.startswith("event: ")
+    ]
+    assert events == ["search_results", "recommendation", "error"]
+    assert BOOKS[0]["isbn"] in response.text
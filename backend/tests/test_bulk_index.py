@@ -0,0 +1,231 @@
+"""Tests of the bulk indexing pipeline and its document sinks."""
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from google.cloud import discoveryengine_v1 as discoveryengine
+
+from src.bulk_index import BulkIndexPipeline
+from src.domain.models.book_master import BookMaster, TableOfContentsItem
+from src.infrastructure.vertex.bulk_import import (
+    DocumentBatchSink,
+    JsonlDirectorySink,
+    VertexAIImportSink,
+)
+
+BOOKS = [
+    BookMaster(
+        isbn=f"978400{i:07d}",
+        title=f"本{i}",
+        toc=[TableOfContentsItem(title="第1章")],
+    )
+    for i in range(25)
+]
+# Every book has two owners, except the last one, which has none
+OWNERS = {book.isbn: {"user-1", "user-2"} for book in BOOKS[:-1]}
+
+
+class FakeBookMasterRepository:
+    """Pages through book masters in ISBN order, like the Firestore one."""
+
+    def iter_pages(
+        self, page_size: int, start_after_isbn: str | None = None
+    ) -> Iterator[list[BookMaster]]:
+        books = [book for book in BOOKS if book.isbn > (start_after_isbn or "")]
+        for i in range(0, len(books), page_size):
+            yield books[i : i + page_size]
+
+
+class FakeUserLibraryRepository:
+    """Knows the owners of every book."""
+
+    def find_all_owners(self) -> dict[str, set[str]]:
+        return OWNERS
+
+
+class RecordingSink(DocumentBatchSink):
+    """Records batches, tracking concurrent writes; can fail on a batch."""
+
+    def __init__(self, fail_on: str | None = None, delay: float = 0.0) -> None:
+        self.fail_on = fail_on
+        self.delay = delay
+        self.batches: list[list[tuple[str, dict]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def write_batch(self, batch_id: str, documents: list[tuple[str, dict]]) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            if batch_id == self.fail_on:
+                msg = f"Batch {batch_id} failed"
+                raise RuntimeError(msg)
+            with self._lock:
+                self.batches.append(documents)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    @property
+    def document_ids(self) -> list[str]:
+        return [document_id for batch in self.batches for document_id, _ in batch]
+
+
+def make_pipeline(
+    sink: DocumentBatchSink, checkpoint_path: Path, **options: object
+) -> BulkIndexPipeline:
+    """Build a pipeline over the fake repositories."""
+    return BulkIndexPipeline(
+        FakeBookMasterRepository(),
+        FakeUserLibraryRepository(),
+        sink,
+        checkpoint_path,
+        **{"shared": False, "page_size": 10, "batch_size": 4, **options},
+    )
+
+
+def test_every_owned_book_is_indexed_in_bounded_batches(tmp_path: Path) -> None:
+    """Per-user documents for every owner, batches within the batch size."""
+    sink = RecordingSink()
+
+    result = make_pipeline(sink, tmp_path / "checkpoint.json").run()
+
+    assert sorted(sink.document_ids) == sorted(
+        f"{user_id}-{isbn}" for isbn, owners in OWNERS.items() for user_id in owners
+    )
+    assert all(len(batch) <= 4 for batch in sink.batches)
+    assert result["books"] == 25
+    assert result["documents"] == 48
+    assert result["last_isbn"] == BOOKS[-1].isbn
+    assert result["documents_per_second"] > 0
+
+
+def test_shared_mode_writes_one_document_per_book(tmp_path: Path) -> None:
+    """The shared layout carries the owners as a `user_ids` ACL."""
+    sink = RecordingSink()
+
+    make_pipeline(sink, tmp_path / "checkpoint.json", shared=True).run()
+
+    documents = dict(document for batch in sink.batches for document in batch)
+    assert len(documents) == 25
+    assert documents[BOOKS[0].isbn]["user_ids"] == ["user-1", "user-2"]
+    assert documents[BOOKS[-1].isbn]["user_ids"] == []
+
+
+def test_interrupted_run_resumes_after_the_last_complete_page(
+    tmp_path: Path,
+) -> None:
+    """A failed page is not checkpointed; the next run starts from it."""
+    checkpoint_path = tmp_path / "checkpoint.json"
+    # The first batch of the second page (books 10-19)
+    failing = RecordingSink(fail_on=f"user-1-{BOOKS[10].isbn}")
+
+    with pytest.raises(RuntimeError):
+        make_pipeline(failing, checkpoint_path).run()
+
+    checkpoint = json.loads(checkpoint_path.read_text(encoding="utf-8"))
+    assert checkpoint == {"last_isbn": BOOKS[9].isbn, "books": 10, "documents": 20}
+
+    sink = RecordingSink()
+    result = make_pipeline(sink, checkpoint_path).run()
+
+    assert {document_id[-13:] for document_id in sink.document_ids} == {
+        book.isbn for book in BOOKS[10:-1]
+    }
+    assert (result["books"], result["documents"]) == (25, 48)
+
+
+def test_batches_are_written_with_bounded_concurrency(tmp_path: Path) -> None:
+    """A page's batches run in parallel, up to max_concurrency at once."""
+    sink = RecordingSink(delay=0.05)
+
+    make_pipeline(
+        sink, tmp_path / "checkpoint.json", page_size=25, max_concurrency=3
+    ).run()
+
+    assert sink.max_in_flight == 3
+
+
+def test_jsonl_sink_writes_discovery_engine_documents(tmp_path: Path) -> None:
+    """One JSONL file per batch, in the import format."""
+    sink = JsonlDirectorySink(tmp_path / "out")
+
+    sink.write_batch("batch-1", [("doc-1", {"title": "本"})])
+
+    lines = (tmp_path / "out" / "batch-1.jsonl").read_text(encoding="utf-8")
+    assert [json.loads(line) for line in lines.splitlines()] == [
+        {"id": "doc-1", "structData": {"title": "本"}}
+    ]
+    assert not list((tmp_path / "out").glob("*.tmp"))
+
+
+class FakeOperation:
+    """A finished ImportDocuments long-running operation."""
+
+    def __init__(self, error_messages: list[str]) -> None:
+        self.error_messages = error_messages
+
+    def result(self, timeout: float) -> discoveryengine.ImportDocumentsResponse:
+        del timeout
+        return discoveryengine.ImportDocumentsResponse(
+            error_samples=[{"message": message} for message in self.error_messages]
+        )
+
+
+class FakeDocumentServiceClient:
+    """Local stand-in for the Discovery Engine DocumentServiceClient."""
+
+    def __init__(self, error_messages: list[str] | None = None) -> None:
+        self.error_messages = error_messages or []
+        self.requests: list[discoveryengine.ImportDocumentsRequest] = []
+
+    def branch_path(
+        self, project: str, location: str, data_store: str, branch: str
+    ) -> str:
+        return (
+            f"projects/{project}/locations/{location}/collections/default_collection"
+            f"/dataStores/{data_store}/branches/{branch}"
+        )
+
+    def import_documents(
+        self, request: discoveryengine.ImportDocumentsRequest
+    ) -> FakeOperation:
+        self.requests.append(request)
+        return FakeOperation(self.error_messages)
+
+
+def test_import_sink_sends_an_incremental_inline_import() -> None:
+    """Documents go inline, replacing existing ones without a full sync."""
+    client = FakeDocumentServiceClient()
+    sink = VertexAIImportSink("project", "store", client=client)
+
+    sink.write_batch("batch-1", [("doc-1", {"title": "本"}), ("doc-2", {})])
+
+    (request,) = client.requests
+    assert request.parent.endswith("/dataStores/store/branches/default_branch")
+    assert [document.id for document in request.inline_source.documents] == [
+        "doc-1",
+        "doc-2",
+    ]
+    assert request.inline_source.documents[0].struct_data["title"] == "本"
+    assert (
+        request.reconciliation_mode
+        == discoveryengine.ImportDocumentsRequest.ReconciliationMode.INCREMENTAL
+    )
+
+
+def test_import_sink_raises_on_document_errors() -> None:
+    """A partially failed import fails the batch, so it is retried."""
+    sink = VertexAIImportSink(
+        "project", "store", client=FakeDocumentServiceClient(["bad document"])
+    )
+
+    with pytest.raises(RuntimeError, match="bad document"):
+        sink.write_batch("batch-1", [("doc-1", {})])
@@ -0,0 +1,14 @@
+"""Tests of the application-level endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.main import app
+
+
+@pytest.mark.parametrize("path", ["/stats/clients", "/stats/caches"])
+def test_stats_require_authentication(path: str) -> None:
+    """Operational stats are not served to anonymous callers."""
+    response = TestClient(app).get(path)
+
+    assert response.status_code in {401, 403}